@@ -1,76 +1,54 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
+import io
+import os
+import re
+import sys
+import time
 import warnings
 
-warnings.filterwarnings('ignore')
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
 
-def data_translate():
-    """
-    실제 원본 데이터(giup_source.csv)를 읽어서 집계표로 변환하는 함수
+from module.encoding_sniffer import read_with_fallback
 
-    주요 집계 내용:
-    1. 시도/시군구별 기업체수 집계
-    2. 법인구분코드별 분배 (1:개인사업자, 2:법인사업자, 3:법인이외법인, 4:국가지자체, 5:기타)
-    3. 폐업구분코드별 분배 (1~4는 그대로, 5~20은 99로 통합, 공백은 제외)
-    4. 산업분류코드별 분배 (A~S 대분류별)
-    5. 일자 관련 집계 (등록일자수, 개업일자수, 폐업일자수)
-
-    폐업구분코드 처리 규칙:
-    - 1~4: 사업부진(폐업), 행정처분(폐업), 계절사유(폐업), 법인전환(폐업)
-    - 5~20: 모두 99(기타)로 통합
-    - 공백(NULL)이나 빈 문자열: 개수에 포함하지 않음
-
-    폐업일자 처리:
-    - 폐업일자 항목에 값이 있는 개수만 폐업일자수에 계산
-    """
+warnings.filterwarnings('ignore')
 
-    print("실제 원본 데이터 집계 시작")
-    print("=" * 60)
+# 집계 대상 코드 목록
+ORG_CODES = [1, 2, 3, 4, 5]
+CLOSURE_CODES = [1, 2, 3, 4, 99]
+INDUSTRY_CODES = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']
 
-    # 데이터 파일 경로 설정
-    data_path = Path(__file__).parent / 'data'
-    source_file = data_path / 'giup_source.csv'
-    output_file = data_path / '집계표_202412.xlsx'
-
-    # 원본 데이터 읽기 (여러 인코딩 시도)
-    df_source = None
-    encodings = ['cp949', 'euc-kr', 'utf-8', 'utf-8-sig']
-
-    for encoding in encodings:
-        try:
-            df_source = pd.read_csv(source_file, encoding=encoding)
-            print(f"원본 데이터 로드 성공 ({encoding}): {len(df_source)}행, {len(df_source.columns)}열")
-            break
-        except UnicodeDecodeError:
-            continue
-        except Exception as e:
-            print(f"{encoding} 인코딩 시도 중 오류: {e}")
-            continue
-
-    if df_source is None:
-        print("모든 인코딩 시도 실패. 파일을 확인해주세요.")
-        return None
+# 집계표 컬럼 순서 (기존 생성된 모의 데이터와 동일한 구조)
+BASE_COLUMNS = ['기준년월_시도', '시도', '시군구', '기업체수', '임시및일용근로자수', '상용근로자수',
+                '매출액', '근로자수', '총종사자수', '평균종사자수']
+DATE_COLUMNS = ['등록일자수', '개업일자수', '폐업일자수']
+ORG_COLUMNS = [f'기업({code})' for code in ORG_CODES] + ['법인구분코드합계']
+CLOSURE_COLUMNS = [f'폐업({code})' for code in CLOSURE_CODES]
+INDUSTRY_COLUMNS = [f'산업({code})' for code in INDUSTRY_CODES]
+FINAL_COLUMNS = BASE_COLUMNS + DATE_COLUMNS + ORG_COLUMNS + CLOSURE_COLUMNS + INDUSTRY_COLUMNS
 
-    print(f"컬럼명: {list(df_source.columns[:10])}...")  # 처음 10개만 출력
+# 스트리밍 모드 청크 크기
+STREAM_CHUNKSIZE = 200_000
 
-    # 빈 행 제거 (모든 컬럼이 NaN인 행)
-    df_source = df_source.dropna(how='all')
-    print(f"빈 행 제거 후: {len(df_source)}행")
 
-    # 실제 컬럼명 확인 후 필요한 컬럼 매핑
-    # CSV 파일의 실제 구조에 맞게 조정 (Read tool 결과 기반)
-    print("\n1. 컬럼 매핑 및 전처리")
+def map_columns(columns):
+    """
+    원본 CSV 컬럼명에서 집계에 필요한 컬럼 찾기
 
-    # 실제 CSV 파일의 컬럼 구조 (Read tool에서 확인된 구조)
-    actual_columns = list(df_source.columns)
+    Args:
+        columns (list): 원본 데이터 컬럼명 목록
 
-    # 필요한 컬럼들의 인덱스 또는 이름 확인
+    Returns:
+        dict: 집계 항목명 -> 원본 컬럼명
+    """
     column_mapping = {}
 
-    # 시도명, 시군구명 찾기
-    for col in actual_columns:
+    for col in columns:
         if '시도' in col and '명' in col:
             column_mapping['시도'] = col
         elif '시군구' in col and '명' in col:
@@ -90,6 +68,280 @@ def data_translate():
         elif '기준년' in col:
             column_mapping['기준년월'] = col
 
+    return column_mapping
+
+
+def _has_value(values):
+    """NULL과 빈 문자열이 아닌 값 여부"""
+    return values.notna() & (values != '')
+
+
+def _to_int_codes(values):
+    """코드 값을 정수로 변환 (소수점은 버림, 변환 불가능한 값은 NaN)"""
+    numbers = pd.to_numeric(values, errors='coerce')
+    return np.trunc(numbers.where(np.isfinite(numbers)))
+
+
+def classify_org_codes(values):
+    """
+    법인구분코드를 1~5로 분류 (NULL, 변환 불가능한 값, 범위 밖 값은 1: 개인사업자)
+
+    Args:
+        values (pandas.Series): 원본 법인구분코드
+
+    Returns:
+        pandas.Series: 1~5 정수 코드
+    """
+    codes = _to_int_codes(values)
+    return codes.where(codes.between(1, 5), 1).astype(int)
+
+
+def classify_closure_codes(values):
+    """
+    폐업구분코드를 1~4, 99로 분류 (5~20은 99로 통합, 공백/변환 불가능/범위 밖 값은 NaN)
+
+    Args:
+        values (pandas.Series): 원본 폐업구분코드
+
+    Returns:
+        pandas.Series: 1~4, 99 코드 (집계 제외 행은 NaN)
+    """
+    codes = _to_int_codes(values.where(_has_value(values)))
+    codes = codes.where(codes.between(1, 4) | codes.between(5, 20))
+    return codes.mask(codes >= 5, 99)
+
+
+def classify_industry_codes(values):
+    """
+    산업분류코드에서 대분류(A~S) 추출 (NULL, 빈 값, 유효하지 않은 대분류는 C: 제조업)
+
+    Args:
+        values (pandas.Series): 원본 산업분류코드
+
+    Returns:
+        pandas.Series: A~S 대분류 문자
+    """
+    codes = values.fillna('C').astype(str)
+    major = codes.str[:1].str.upper()
+    return major.where(major.isin(INDUSTRY_CODES) & (codes != 'nan'), 'C')
+
+
+def _count_codes(work, group_cols, code_col, categories, index):
+    """시도/시군구 x 코드별 건수표 (없는 조합은 0)"""
+    counts = work.groupby(group_cols + [code_col]).size().unstack(fill_value=0)
+    return counts.reindex(index=index, columns=categories, fill_value=0).astype(int)
+
+
+def count_source(df_valid, column_mapping, sido_col, sigungu_col):
+    """
+    원본 데이터의 시도/시군구별 부분 집계 (청크별 결과를 더해서 합칠 수 있는 건수만 계산)
+
+    Args:
+        df_valid (pandas.DataFrame): 시도명이 있는 원본 데이터
+        column_mapping (dict): map_columns() 결과
+        sido_col (str): 시도 컬럼명
+        sigungu_col (str): 시군구 컬럼명
+
+    Returns:
+        pandas.DataFrame: (시도, 시군구) 인덱스의 건수표 (기업체수, 코드별 건수, 원본에 있는 일자 컬럼 건수)
+    """
+    def source(key):
+        col = column_mapping.get(key)
+        return df_valid[col] if col in df_valid.columns else None
+
+    # 분류된 코드만 담은 작업용 프레임 (그룹 키 + 코드/일자 여부)
+    group_cols = ['시도', '시군구']
+    work = pd.DataFrame({'시도': df_valid[sido_col], '시군구': df_valid[sigungu_col]})
+
+    org_values = source('법인구분코드')
+    closure_values = source('폐업구분코드')
+    industry_values = source('산업분류코드')
+    work['기업'] = classify_org_codes(org_values) if org_values is not None else 1
+    work['폐업'] = classify_closure_codes(closure_values) if closure_values is not None else np.nan
+    work['산업'] = classify_industry_codes(industry_values) if industry_values is not None else 'C'
+
+    date_sources = {'등록일자수': '등록일자', '개업일자수': '개업일자', '폐업일자수': '폐업일자'}
+    present = []
+    for result_col, key in date_sources.items():
+        values = source(key)
+        if values is not None:
+            work[result_col] = _has_value(values)
+            present.append(result_col)
+
+    # 시군구가 NULL인 행은 groupby에서 제외됨
+    grouped = work.groupby(group_cols)
+    sizes = grouped.size()
+    index = sizes.index
+
+    counts = pd.DataFrame({'기업체수': sizes}, index=index)
+
+    # 법인구분코드별 집계 (기업(1)~기업(5))
+    org_counts = _count_codes(work, group_cols, '기업', ORG_CODES, index)
+    for code in ORG_CODES:
+        counts[f'기업({code})'] = org_counts[code]
+
+    # 폐업구분코드별 집계 (폐업(1)~폐업(99), 집계 제외 행은 groupby에서 빠짐)
+    closure_counts = _count_codes(work, group_cols, '폐업', [float(code) for code in CLOSURE_CODES], index)
+    for code in CLOSURE_CODES:
+        counts[f'폐업({code})'] = closure_counts[float(code)]
+
+    # 산업분류코드별 집계 (산업(A)~산업(S))
+    industry_counts = _count_codes(work, group_cols, '산업', INDUSTRY_CODES, index)
+    for code in INDUSTRY_CODES:
+        counts[f'산업({code})'] = industry_counts[code]
+
+    # 일자 관련 집계 (값이 있는 항목만 카운트)
+    if present:
+        date_counts = grouped[present].sum()
+        for result_col in present:
+            counts[result_col] = date_counts[result_col].astype(int)
+
+    return counts
+
+
+def merge_counts(total, partial):
+    """
+    부분 집계 두 개를 시도/시군구 기준으로 합산
+
+    Args:
+        total (pandas.DataFrame): 지금까지의 누적 건수표 (None이면 partial 반환)
+        partial (pandas.DataFrame): 새 청크의 건수표
+
+    Returns:
+        pandas.DataFrame: 합산된 건수표
+    """
+    if total is None:
+        return partial
+    return total.add(partial, fill_value=0).astype('int64')
+
+
+def finalize_counts(counts, yearmonth='202412'):
+    """
+    누적 건수표를 집계표 형식으로 완성 (원본에 없는 일자 컬럼은 추정값으로 채움)
+
+    Args:
+        counts (pandas.DataFrame): count_source()/merge_counts() 결과
+        yearmonth (str): 기준년월
+
+    Returns:
+        pandas.DataFrame: FINAL_COLUMNS 순서의 집계표
+    """
+    counts = counts.sort_index()
+    sizes = counts['기업체수']
+
+    result = counts.copy()
+    result.insert(0, '기준년월_시도', yearmonth)  # 실제 데이터에서 추출하거나 설정
+    result['법인구분코드합계'] = counts[[f'기업({code})' for code in ORG_CODES]].sum(axis=1)
+
+    # 일자 컬럼이 원본에 없으면 추정값 (등록 100%, 개업 95%, 폐업 5%)
+    defaults = {'등록일자수': 1.0, '개업일자수': 0.95, '폐업일자수': 0.05}
+    for result_col, ratio in defaults.items():
+        if result_col not in result.columns:
+            result[result_col] = (sizes * ratio).astype(int)
+
+    # 기타 수치 데이터 (실제 데이터에 해당 컬럼이 있다면 집계, 없으면 0)
+    for col in ['임시및일용근로자수', '상용근로자수', '매출액', '근로자수', '총종사자수', '평균종사자수']:
+        result[col] = 0
+
+    result = result.reset_index()
+    for col in ['시도', '시군구']:
+        result[col] = result[col].astype(object)
+    return result[FINAL_COLUMNS]
+
+
+def aggregate_source(df_valid, column_mapping, sido_col, sigungu_col, yearmonth='202412'):
+    """
+    원본 데이터를 시도/시군구별 집계표로 변환 (코드 분류와 건수 집계를 벡터 연산으로 수행)
+
+    Args:
+        df_valid (pandas.DataFrame): 시도명이 있는 원본 데이터
+        column_mapping (dict): map_columns() 결과
+        sido_col (str): 시도 컬럼명
+        sigungu_col (str): 시군구 컬럼명
+        yearmonth (str): 기준년월
+
+    Returns:
+        pandas.DataFrame: FINAL_COLUMNS 순서의 집계표
+    """
+    return finalize_counts(count_source(df_valid, column_mapping, sido_col, sigungu_col), yearmonth)
+
+
+def _valid_rows(df_source, sido_col, sigungu_col):
+    """시도명이 있는 행만 남기고, 시군구 컬럼이 없으면 '전체'로 채움"""
+    df_valid = df_source[_has_value(df_source[sido_col])]
+    if not sigungu_col or sigungu_col not in df_valid.columns:
+        df_valid = df_valid.assign(시군구_temp='전체')
+        sigungu_col = '시군구_temp'
+    return df_valid, sigungu_col
+
+
+def stream_source_counts(source_file, chunksize=STREAM_CHUNKSIZE):
+    """
+    원본 CSV를 청크 단위로 읽으며 시도/시군구별 건수를 누적 (메모리 사용량은 지역 수에 비례)
+
+    파일 앞부분 바이트로 판별한 인코딩으로 읽고, 집계에 쓰는 컬럼만 문자열 타입으로 읽는다.
+    판별이 틀려 도중에 디코딩 오류가 나면 누적 건수를 버리고 다음 인코딩으로 처음부터 다시 읽는다.
+
+    Args:
+        source_file (Path): 원본 CSV 경로
+        chunksize (int): 청크당 행 수
+
+    Returns:
+        tuple: (누적 건수표, 컬럼 매핑, 읽은 행 수, 유효 행 수) - 읽기 실패 시 건수표는 None
+    """
+    def read(encoding):
+        header = pd.read_csv(source_file, encoding=encoding, nrows=0)
+        column_mapping = map_columns(list(header.columns))
+        if '시도' not in column_mapping:
+            return None, column_mapping, 0, 0
+
+        sido_col = column_mapping['시도']
+        sigungu_col = column_mapping.get('시군구', None)
+        usecols = sorted(set(column_mapping.values()))
+
+        counts = None
+        total_rows = valid_rows = 0
+        reader = pd.read_csv(source_file, encoding=encoding, usecols=usecols,
+                             dtype=str, chunksize=chunksize)
+        for chunk in reader:
+            total_rows += len(chunk)
+            df_valid, chunk_sigungu_col = _valid_rows(chunk, sido_col, sigungu_col)
+            valid_rows += len(df_valid)
+            counts = merge_counts(counts, count_source(df_valid, column_mapping, sido_col, chunk_sigungu_col))
+            print(f"  {total_rows:,}행 처리 ({len(counts)}개 시도/시군구)")
+
+        print(f"원본 데이터 스트리밍 집계 완료 ({encoding}): {total_rows:,}행, 사용 컬럼 {len(usecols)}개")
+        return counts, column_mapping, total_rows, valid_rows
+
+    try:
+        result, _ = read_with_fallback(source_file, read)
+        return result
+    except Exception as e:
+        print(f"원본 데이터 읽기 오류: {e}")
+
+    return None, None, 0, 0
+
+
+def _aggregate_in_memory(source_file, yearmonth):
+    """원본 CSV 전체를 메모리에 읽어 한 번에 집계 (집계 실패 시 None)"""
+    # 원본 데이터 읽기 (파일 앞부분 바이트로 판별한 인코딩으로 읽고, 디코딩 오류가 나면 대체 인코딩으로 다시 읽음)
+    try:
+        df_source, encoding = read_with_fallback(source_file, lambda encoding: pd.read_csv(source_file, encoding=encoding))
+        print(f"원본 데이터 로드 성공 ({encoding}): {len(df_source)}행, {len(df_source.columns)}열")
+    except Exception as e:
+        print(f"원본 데이터 읽기 오류: {e}")
+        print("원본 데이터를 읽을 수 없습니다. 파일을 확인해주세요.")
+        return None
+
+    print(f"컬럼명: {list(df_source.columns[:10])}...")  # 처음 10개만 출력
+
+    # 빈 행 제거 (모든 컬럼이 NaN인 행)
+    df_source = df_source.dropna(how='all')
+    print(f"빈 행 제거 후: {len(df_source)}행")
+
+    # 실제 컬럼명 확인 후 필요한 컬럼 매핑
+    print("\n1. 컬럼 매핑 및 전처리")
+    column_mapping = map_columns(list(df_source.columns))
     print(f"매핑된 컬럼: {column_mapping}")
 
     # 유효한 데이터만 필터링 (시도명이 있는 행만)
@@ -101,7 +353,7 @@ def data_translate():
     sigungu_col = column_mapping.get('시군구', None)
 
     # 유효한 데이터 필터링
-    df_valid = df_source[df_source[sido_col].notna() & (df_source[sido_col] != '')]
+    df_valid, sigungu_grouping_col = _valid_rows(df_source, sido_col, sigungu_col)
     print(f"유효한 데이터: {len(df_valid)}행")
 
     if len(df_valid) == 0:
@@ -110,214 +362,82 @@ def data_translate():
 
     # 시도/시군구별 그룹핑
     if sigungu_col and sigungu_col in df_valid.columns:
-        group_cols = [sido_col, sigungu_col]
-        print(f"시도/시군구별 그룹핑: {group_cols}")
+        print(f"시도/시군구별 그룹핑: {[sido_col, sigungu_col]}")
     else:
-        group_cols = [sido_col]
-        print(f"시도별 그룹핑: {group_cols}")
         # 시군구가 없는 경우 '전체'로 설정
-        df_valid = df_valid.copy()
-        df_valid['시군구_temp'] = '전체'
-        group_cols.append('시군구_temp')
-        sigungu_col = '시군구_temp'
-
-    grouped = df_valid.groupby(group_cols)
+        print(f"시도별 그룹핑: {[sido_col]}")
 
-    print(f"\n2. 시도/시군구별 집계 처리 시작 (총 {len(grouped)}개 그룹)")
+    print(f"\n2. 시도/시군구별 집계 처리 시작")
+    df_final = aggregate_source(df_valid, column_mapping, sido_col, sigungu_grouping_col, yearmonth)
+    print(f"  {len(df_final)}개 시도/시군구 집계 완료")
+    return df_final
 
-    # 기본 집계표 생성
-    result_list = []
 
-    for group_key, group in grouped:
-        if isinstance(group_key, tuple):
-            sido = group_key[0]
-            sigungu = group_key[1] if len(group_key) > 1 else '전체'
-        else:
-            sido = group_key
-            sigungu = '전체'
-
-        print(f"  처리 중: {sido} {sigungu} ({len(group)}건)")
-
-        # 기본 정보
-        row_data = {
-            '기준년월_시도': '202412',  # 실제 데이터에서 추출하거나 설정
-            '시도': sido,
-            '시군구': sigungu,
-            '기업체수': len(group)  # 전체 기업체수
-        }
-
-        # 3. 법인구분코드별 집계 (기업(1)~기업(5))
-        if '법인구분코드' in column_mapping and column_mapping['법인구분코드'] in group.columns:
-            print(f"    법인구분코드 집계 중...")
-
-            # 법인구분코드 전처리 (숫자로 변환)
-            org_codes_raw = group[column_mapping['법인구분코드']].dropna()
-            org_codes = []
-
-            for code in org_codes_raw:
-                try:
-                    code_int = int(float(code))  # float를 거쳐 int로 변환 (소수점 포함 문자열 대응)
-                    if 1 <= code_int <= 5:  # 유효한 범위만
-                        org_codes.append(code_int)
-                    else:
-                        org_codes.append(1)  # 범위 밖은 기본값 1 (개인사업자)
-                except (ValueError, TypeError):
-                    org_codes.append(1)  # 변환 불가능한 값은 기본값 1
-
-            # 부족한 개수는 기본값 1로 채움
-            while len(org_codes) < len(group):
-                org_codes.append(1)
-
-            org_counts = Counter(org_codes)
-
-            # 법인구분코드 1~5 분배
-            for i in range(1, 6):
-                row_data[f'기업({i})'] = org_counts.get(i, 0)
-
-            # 법인구분코드 합계 (검증용)
-            row_data['법인구분코드합계'] = sum(org_counts.values())
-        else:
-            # 법인구분코드가 없는 경우 모든 기업을 개인사업자(1)로 분류
-            row_data['기업(1)'] = len(group)
-            for i in range(2, 6):
-                row_data[f'기업({i})'] = 0
-            row_data['법인구분코드합계'] = len(group)
-
-        # 4. 폐업구분코드별 집계 (폐업(1)~폐업(99))
-        print(f"    폐업구분코드 집계 중...")
-
-        # 폐업구분코드 처리 - 실제 값이 있는 기업만 처리
-        if '폐업구분코드' in column_mapping and column_mapping['폐업구분코드'] in group.columns:
-            # 폐업구분코드가 있는 기업만 (공백, NULL 제외)
-            closure_codes_raw = group[column_mapping['폐업구분코드']].dropna()
-            closure_codes_raw = closure_codes_raw[closure_codes_raw != '']  # 빈 문자열도 제외
-
-            if len(closure_codes_raw) > 0:
-                # 문자열을 숫자로 변환
-                closure_codes_int = []
-                for code in closure_codes_raw:
-                    try:
-                        code_int = int(float(code))  # float를 거쳐 int로 변환
-                        closure_codes_int.append(code_int)
-                    except (ValueError, TypeError):
-                        continue  # 변환 불가능한 값은 제외
-
-                closure_counter = Counter(closure_codes_int)
-
-                # 1~4는 그대로, 5~20은 99로 통합
-                final_closure_counts = {1: 0, 2: 0, 3: 0, 4: 0, 99: 0}
-
-                for code, count in closure_counter.items():
-                    if 1 <= code <= 4:
-                        final_closure_counts[code] = count
-                    elif 5 <= code <= 20:
-                        final_closure_counts[99] += count
-                    # 20 초과 값은 무시 (잘못된 데이터로 간주)
-
-                # 폐업구분코드 할당
-                for code in [1, 2, 3, 4, 99]:
-                    row_data[f'폐업({code})'] = final_closure_counts[code]
-            else:
-                # 폐업구분코드가 없는 경우 모두 0
-                for code in [1, 2, 3, 4, 99]:
-                    row_data[f'폐업({code})'] = 0
-        else:
-            # 폐업구분코드 컬럼이 없는 경우 모두 0
-            for code in [1, 2, 3, 4, 99]:
-                row_data[f'폐업({code})'] = 0
-
-        # 5. 산업분류코드별 집계 (산업(A)~산업(S))
-        print(f"    산업분류코드 집계 중...")
-
-        if '산업분류코드' in column_mapping and column_mapping['산업분류코드'] in group.columns:
-            # 산업분류코드에서 대분류 추출 (첫 번째 문자)
-            industry_codes_raw = group[column_mapping['산업분류코드']].fillna('C').astype(str)
-            industry_major = []
-
-            for code in industry_codes_raw:
-                if len(str(code)) > 0 and str(code) != 'nan':
-                    first_char = str(code)[0].upper()
-                    # 유효한 산업분류 대분류인지 확인
-                    if first_char in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']:
-                        industry_major.append(first_char)
-                    else:
-                        industry_major.append('C')  # 기본값 C (제조업)
-                else:
-                    industry_major.append('C')  # 기본값
-
-            industry_counter = Counter(industry_major)
-
-            # A~S 산업분류 대분류
-            for code in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']:
-                row_data[f'산업({code})'] = industry_counter.get(code, 0)
-        else:
-            # 산업분류코드가 없는 경우 모든 기업을 C(제조업)으로 분류
-            row_data['산업(C)'] = len(group)
-            for code in ['A', 'B', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']:
-                row_data[f'산업({code})'] = 0
-
-        # 6. 일자 관련 집계
-        print(f"    일자 관련 집계 중...")
-
-        # 등록일자수: 등록일자가 있는 기업체수 (값이 있는 항목만 카운트)
-        if '등록일자' in column_mapping and column_mapping['등록일자'] in group.columns:
-            registration_dates = group[column_mapping['등록일자']].dropna()
-            registration_dates = registration_dates[registration_dates != '']
-            row_data['등록일자수'] = len(registration_dates)
-        else:
-            row_data['등록일자수'] = len(group)  # 기본값: 모든 기업이 등록되어 있다고 가정
+def data_translate(chunksize=None, source_file=None, output_file=None, yearmonth='202412'):
+    """
+    실제 원본 데이터(giup_source.csv)를 읽어서 집계표로 변환하는 함수
 
-        # 개업일자수: 개업일자가 있는 기업체수
-        if '개업일자' in column_mapping and column_mapping['개업일자'] in group.columns:
-            opening_dates = group[column_mapping['개업일자']].dropna()
-            opening_dates = opening_dates[opening_dates != '']
-            row_data['개업일자수'] = len(opening_dates)
-        else:
-            row_data['개업일자수'] = int(len(group) * 0.95)  # 기본값: 95%가 개업했다고 가정
+    주요 집계 내용:
+    1. 시도/시군구별 기업체수 집계
+    2. 법인구분코드별 분배 (1:개인사업자, 2:법인사업자, 3:법인이외법인, 4:국가지자체, 5:기타)
+    3. 폐업구분코드별 분배 (1~4는 그대로, 5~20은 99로 통합, 공백은 제외)
+    4. 산업분류코드별 분배 (A~S 대분류별)
+    5. 일자 관련 집계 (등록일자수, 개업일자수, 폐업일자수)
 
-        # 폐업일자수: 폐업일자가 있는 기업체수 (실제 폐업일자 항목에 값이 있는 개수)
-        if '폐업일자' in column_mapping and column_mapping['폐업일자'] in group.columns:
-            closure_dates = group[column_mapping['폐업일자']].dropna()
-            closure_dates = closure_dates[closure_dates != '']
-            row_data['폐업일자수'] = len(closure_dates)
-        else:
-            row_data['폐업일자수'] = int(len(group) * 0.05)  # 기본값: 5%가 폐업했다고 가정
+    폐업구분코드 처리 규칙:
+    - 1~4: 사업부진(폐업), 행정처분(폐업), 계절사유(폐업), 법인전환(폐업)
+    - 5~20: 모두 99(기타)로 통합
+    - 공백(NULL)이나 빈 문자열: 개수에 포함하지 않음
 
-        # 7. 기타 수치 데이터 (실제 데이터에 해당 컬럼이 있다면 집계, 없으면 0 또는 추정값)
-        row_data['임시및일용근로자수'] = 0  # 실제 데이터 컬럼이 있다면 해당 컬럼 합계
-        row_data['상용근로자수'] = 0
-        row_data['매출액'] = 0
-        row_data['근로자수'] = 0
-        row_data['총종사자수'] = 0
-        row_data['평균종사자수'] = 0
+    폐업일자 처리:
+    - 폐업일자 항목에 값이 있는 개수만 폐업일자수에 계산
 
-        result_list.append(row_data)
+    Args:
+        chunksize (int): 청크당 행 수 (지정하면 스트리밍 모드로 집계, None이면 전체를 메모리에 읽음)
+        source_file (Path): 원본 CSV 경로 (None이면 data/giup_source.csv)
+        output_file (Path): 저장할 집계표 경로 (None이면 data/집계표_{기준년월}.xlsx)
+        yearmonth (str): 기준년월
 
-    # 결과 DataFrame 생성
-    df_result = pd.DataFrame(result_list)
+    Returns:
+        pandas.DataFrame: 집계표 (실패 시 None)
+    """
 
-    print(f"\n3. 집계 결과 정리 및 저장")
+    print("실제 원본 데이터 집계 시작")
+    print("=" * 60)
 
-    # 컬럼 순서 정리 (기존 생성된 모의 데이터와 동일한 구조)
-    base_columns = ['기준년월_시도', '시도', '시군구', '기업체수', '임시및일용근로자수', '상용근로자수',
-                   '매출액', '근로자수', '총종사자수', '평균종사자수']
-    date_columns = ['등록일자수', '개업일자수', '폐업일자수']
-    org_columns = ['기업(1)', '기업(2)', '기업(3)', '기업(4)', '기업(5)', '법인구분코드합계']
-    closure_columns = ['폐업(1)', '폐업(2)', '폐업(3)', '폐업(4)', '폐업(99)']
-    industry_columns = [f'산업({code})' for code in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']]
-
-    final_columns = base_columns + date_columns + org_columns + closure_columns + industry_columns
-
-    # 누락된 컬럼 0으로 채움
-    for col in final_columns:
-        if col not in df_result.columns:
-            if col in ['기준년월_시도', '시도', '시군구']:
-                df_result[col] = ''
-            else:
-                df_result[col] = 0
+    # 데이터 파일 경로 설정
+    data_path = Path(__file__).parent / 'data'
+    source_file = Path(source_file) if source_file else data_path / 'giup_source.csv'
+    output_file = Path(output_file) if output_file else data_path / f'집계표_{yearmonth}.xlsx'
+
+    if chunksize:
+        # 스트리밍 모드: 필요한 컬럼만 청크 단위로 읽으며 지역별 건수만 누적
+        print(f"스트리밍 모드 (청크 {chunksize:,}행)")
+        print("\n1. 컬럼 매핑 및 청크별 집계")
+        counts, column_mapping, total_rows, valid_rows = stream_source_counts(source_file, chunksize)
+        print(f"매핑된 컬럼: {column_mapping}")
+
+        if column_mapping is None:
+            print("원본 데이터를 읽을 수 없습니다. 파일을 확인해주세요.")
+            return None
+        if '시도' not in column_mapping:
+            print("경고: 시도명 컬럼을 찾을 수 없습니다. 첫 번째 분석을 통해 컬럼 구조를 확인해주세요.")
+            return None
+
+        print(f"유효한 데이터: {valid_rows:,}행 / 전체 {total_rows:,}행")
+        if valid_rows == 0:
+            print("유효한 데이터가 없습니다.")
+            return None
+
+        print(f"\n2. 시도/시군구별 집계표 생성")
+        df_final = finalize_counts(counts, yearmonth)
+        print(f"  {len(df_final)}개 시도/시군구 집계 완료")
+    else:
+        df_final = _aggregate_in_memory(source_file, yearmonth)
+        if df_final is None:
+            return None
 
-    # 최종 컬럼 순서로 정리
-    df_final = df_result[final_columns]
+    print(f"\n3. 집계 결과 정리 및 저장")
 
     # Excel 파일로 저장
     df_final.to_excel(output_file, index=False, engine='openpyxl')
@@ -344,12 +464,12 @@ def data_translate():
     print(f"- 법인구분코드합계: {org_total:,} {'OK' if org_total == total_business else 'NG'}")
 
     # 폐업구분코드 검증 (폐업한 기업들만의 합계)
-    closure_code_total = df_final[closure_columns].sum().sum()
+    closure_code_total = df_final[CLOSURE_COLUMNS].sum().sum()
     print(f"- 폐업구분코드합계: {closure_code_total:,}")
     print(f"  * 폐업하지않은기업: {total_business - closure_code_total:,}, 폐업기업: {closure_code_total:,}")
 
     # 산업분류코드 검증
-    industry_total = df_final[industry_columns].sum().sum()
+    industry_total = df_final[INDUSTRY_COLUMNS].sum().sum()
     print(f"- 산업분류코드합계: {industry_total:,} {'OK' if industry_total == total_business else 'NG'}")
 
     # 시도별 통계
@@ -371,6 +491,126 @@ def data_translate():
 
     return df_final
 
+
+def extract_yearmonth(source_file):
+    """
+    원본 파일명에서 기준년월(YYYYMM) 추출
+
+    Args:
+        source_file (Path): 원본 CSV 경로 (예: giup_source_202401.csv)
+
+    Returns:
+        str: 기준년월 (찾지 못하면 None)
+    """
+    match = re.search(r'(?<!\d)((?:19|20)\d{2})[-_.]?(0[1-9]|1[0-2])(?!\d)', Path(source_file).stem)
+    return match.group(1) + match.group(2) if match else None
+
+
+def translate_month(source_file, output_dir, chunksize=STREAM_CHUNKSIZE):
+    """
+    월별 원본 하나를 집계표로 변환 (배치 모드의 작업 프로세스에서 실행)
+
+    Args:
+        source_file (Path): 월별 원본 CSV 경로
+        output_dir (Path): 집계표 저장 폴더
+        chunksize (int): 스트리밍 청크당 행 수
+
+    Returns:
+        dict: 기준년월, 출력 파일, 기업체수, 원본 크기, 소요 시간, 오류 메시지
+    """
+    source_file = Path(source_file)
+    yearmonth = extract_yearmonth(source_file)
+    output_file = Path(output_dir) / f'집계표_{yearmonth}.xlsx'
+    result = {'yearmonth': yearmonth, 'source': source_file.name, 'output': str(output_file),
+              'businesses': 0, 'bytes': source_file.stat().st_size, 'elapsed': 0.0, 'error': None}
+
+    start = time.perf_counter()
+    log = io.StringIO()
+    try:
+        # 여러 달이 동시에 출력하면 섞이므로 월별 로그는 모아서 실패 시에만 보여줌
+        with contextlib.redirect_stdout(log):
+            df_final = data_translate(chunksize=chunksize, source_file=source_file,
+                                      output_file=output_file, yearmonth=yearmonth)
+        if df_final is None:
+            lines = log.getvalue().strip().splitlines()
+            result['error'] = lines[-1] if lines else '집계 실패'
+        else:
+            result['businesses'] = int(df_final['기업체수'].sum())
+    except Exception as e:
+        result['error'] = str(e)
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def batch_translate(source_dir, output_dir=None, max_workers=None, chunksize=STREAM_CHUNKSIZE, pattern='*.csv'):
+    """
+    폴더의 월별 원본들을 프로세스 풀로 나눠 집계표로 일괄 변환 (작업 프로세스 하나당 한 달)
+
+    Args:
+        source_dir (Path): 월별 원본 CSV 폴더 (파일명에 YYYYMM 포함)
+        output_dir (Path): 집계표 저장 폴더 (None이면 원본 폴더)
+        max_workers (int): 작업 프로세스 수 (None이면 CPU 수와 월 수 중 작은 값)
+        chunksize (int): 스트리밍 청크당 행 수
+        pattern (str): 원본 파일 패턴
+
+    Returns:
+        list: 기준년월 순 translate_month() 결과 목록
+    """
+    source_dir = Path(source_dir)
+    output_dir = Path(output_dir) if output_dir else source_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    sources = {}
+    for source_file in sorted(source_dir.glob(pattern)):
+        yearmonth = extract_yearmonth(source_file)
+        if yearmonth is None:
+            print(f"기준년월을 찾을 수 없어 제외: {source_file.name}")
+        elif yearmonth in sources:
+            print(f"기준년월 중복으로 제외: {source_file.name} ({yearmonth})")
+        else:
+            sources[yearmonth] = source_file
+
+    if not sources:
+        print(f"변환할 월별 원본이 없습니다: {source_dir}")
+        return []
+
+    max_workers = max_workers or min(len(sources), os.cpu_count() or 1)
+    print(f"월별 집계표 일괄 변환 시작: {len(sources)}개월, 작업 프로세스 {max_workers}개")
+    print("=" * 60)
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(translate_month, source_file, output_dir, chunksize)
+                   for source_file in sources.values()]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['error']:
+                print(f"  [실패] {result['yearmonth']} {result['source']}: {result['error']}")
+            else:
+                rate = result['businesses'] / result['elapsed'] if result['elapsed'] > 0 else 0
+                print(f"  [완료] {result['yearmonth']} {result['source']}: 기업체 {result['businesses']:,}개, "
+                      f"{result['elapsed']:.2f}초 ({rate:,.0f}개/초)")
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda r: r['yearmonth'])
+    succeeded = [r for r in results if not r['error']]
+    total_businesses = sum(r['businesses'] for r in succeeded)
+    total_mb = sum(r['bytes'] for r in succeeded) / (1024 * 1024)
+    worker_time = sum(r['elapsed'] for r in results)
+
+    print(f"\n일괄 변환 완료: {len(succeeded)}/{len(results)}개월 성공, 총 {elapsed:.2f}초")
+    if elapsed > 0:
+        print(f"- 처리량: 기업체 {total_businesses / elapsed:,.0f}개/초, 원본 {total_mb / elapsed:.1f}MB/초")
+        print(f"- 월별 소요 시간 합계 {worker_time:.2f}초 (병렬 효율 {worker_time / elapsed:.1f}배)")
+    return results
+
+
 if __name__ == "__main__":
-    # 실제 데이터 변환 실행
-    result_df = data_translate()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        # 배치 모드: python data_translate.py <월별 원본 폴더> [집계표 저장 폴더]
+        batch_translate(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    else:
+        # 실제 데이터 변환 실행 (전체 월간 추출본도 처리할 수 있도록 스트리밍 모드 사용)
+        result_df = data_translate(chunksize=STREAM_CHUNKSIZE)
@@ -2,8 +2,58 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
-def generate_correct_timeseries():
-    """실제 데이터 기반으로 정확한 3개년도 시계열 집계표 생성"""
+# 코드별 분배 비율 (법인구분코드 1~5, 폐업구분코드, 산업분류 대분류 A~S)
+ORG_CODES = ['1', '2', '3', '4', '5']
+ORG_RATIOS = [0.65, 0.25, 0.06, 0.03, 0.01]
+CLOSURE_CODES = ['1.1', '2.1', '3.1', '4.1', '99']
+CLOSURE_RATIOS = [0.85, 0.05, 0.03, 0.02, 0.05]
+INDUSTRY_CODES = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']
+INDUSTRY_RATIOS = [0.05, 0.02, 0.25, 0.03, 0.02, 0.08, 0.15, 0.06, 0.08, 0.05, 0.03, 0.04, 0.08, 0.05, 0.02, 0.03, 0.04, 0.02, 0.01]
+
+# 기본 생성 연도 (기준년월, 연도, 월, 증감률)
+DEFAULT_YEARS = [
+    ('202212', 2022, 12, 0.95),  # 2022년 12월, 5% 감소
+    ('202312', 2023, 12, 1.0),   # 2023년 12월, 기준
+    ('202412', 2024, 12, 1.05)   # 2024년 12월, 5% 증가
+]
+
+
+def allocate_counts(totals, ratios):
+    """
+    행별 총수를 비율대로 정수 분배 (최대 잔여법, 각 행의 분배 합계 = 총수)
+
+    총수 x 비율을 내림한 뒤, 모자란 개수만큼 소수부가 큰 항목부터 1씩 더한다.
+
+    Args:
+        totals (array-like): 행별 총수 (n,)
+        ratios (array-like): 항목별 비율 (k,) - 합이 1이 아니면 정규화
+
+    Returns:
+        numpy.ndarray: (n, k) 정수 분배 결과
+    """
+    totals = np.clip(np.asarray(totals, dtype=np.int64), 0, None)
+    ratios = np.asarray(ratios, dtype=float)
+    ratios = ratios / ratios.sum()
+
+    exact = totals[:, None] * ratios[None, :]
+    counts = np.floor(exact).astype(np.int64)
+    shortfall = totals - counts.sum(axis=1)
+
+    # 소수부 내림차순 순위가 부족분보다 작은 항목에 1 추가 (동률은 앞 항목 우선)
+    order = np.argsort(-(exact - counts), axis=1, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(ratios))[None, :], axis=1)
+    counts += ranks < shortfall[:, None]
+    return counts
+
+
+def generate_correct_timeseries(years=None):
+    """
+    실제 데이터 기반으로 정확한 시계열 집계표 생성
+
+    Args:
+        years (list): (기준년월, 연도, 월, 증감률) 목록 (None이면 2022~2024년 12월 3개년도)
+    """
 
     print("정확한 시계열 집계표 생성 시작")
     print("=" * 50)
@@ -64,12 +114,8 @@ def generate_correct_timeseries():
     print(f"변환 후 컬럼: {list(df_base.columns)}")
     print(f"총 기업체수: {df_base['기업체수'].sum():,}")
 
-    # 3개년도별 집계표 생성
-    years = [
-        ('202212', 2022, 12, 0.95),  # 2022년 12월, 5% 감소
-        ('202312', 2023, 12, 1.0),   # 2023년 12월, 기준
-        ('202412', 2024, 12, 1.05)   # 2024년 12월, 5% 증가
-    ]
+    # 연도별 집계표 생성
+    years = years or DEFAULT_YEARS
 
     for year_month, year, month, growth_rate in years:
         print(f"\n{year_month} 집계표 생성 중...")
@@ -90,85 +136,22 @@ def generate_correct_timeseries():
                 # 음수 방지
                 df_year[col] = df_year[col].clip(lower=0)
 
-        # 각 행별로 정확한 분배 실행
-        for idx, row in df_year.iterrows():
-            total_businesses = row['기업체수']
+        # 기업체수를 코드별로 분배 (행렬 연산 + 최대 잔여법으로 행별 합계를 정확히 맞춤)
+        totals = df_year['기업체수'].to_numpy()
+        org_counts = allocate_counts(totals, ORG_RATIOS)
+        closure_counts = allocate_counts(totals, CLOSURE_RATIOS)
+        industry_counts = allocate_counts(totals, INDUSTRY_RATIOS)
 
-            if total_businesses > 0:
-                # 1. 법인구분코드별 분배 (정확히 총합이 맞도록)
-                org_ratios = [0.65, 0.25, 0.06, 0.03, 0.01]  # 1,2,3,4,5
-                org_counts = []
-
-                for i, ratio in enumerate(org_ratios[:-1]):  # 마지막 제외
-                    count = int(total_businesses * ratio)
-                    org_counts.append(count)
-
-                # 마지막은 나머지로 계산하여 정확히 맞춤
-                last_count = total_businesses - sum(org_counts)
-                org_counts.append(max(0, last_count))
-
-                # 법인구분코드 할당
-                for i, count in enumerate(org_counts, 1):
-                    df_year.loc[idx, str(i)] = count
-
-                # 법인구분코드합계 (검증용)
-                df_year.loc[idx, '법인구분코드합계'] = sum(org_counts)
-
-                # 2. 폐업구분코드별 분배 (정확히 총합이 맞도록)
-                closure_ratios = [0.85, 0.05, 0.03, 0.02, 0.05]  # 1.1, 2.1, 3.1, 4.1, 99
-                closure_codes = ['1.1', '2.1', '3.1', '4.1', '99']
-                closure_counts = []
-
-                for i, ratio in enumerate(closure_ratios[:-1]):  # 마지막 제외
-                    count = int(total_businesses * ratio)
-                    closure_counts.append(count)
-
-                # 마지막은 나머지로 계산
-                last_count = total_businesses - sum(closure_counts)
-                closure_counts.append(max(0, last_count))
-
-                # 폐업구분코드 할당
-                for code, count in zip(closure_codes, closure_counts):
-                    df_year.loc[idx, code] = count
-
-                # 3. 산업분류코드별 분배 (정확히 총합이 맞도록)
-                industry_codes = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']
-                industry_ratios = [0.05, 0.02, 0.25, 0.03, 0.02, 0.08, 0.15, 0.06, 0.08, 0.05, 0.03, 0.04, 0.08, 0.05, 0.02, 0.03, 0.04, 0.02, 0.01]
-
-                # 비율 정규화 (합이 1이 되도록)
-                total_ratio = sum(industry_ratios)
-                industry_ratios = [r/total_ratio for r in industry_ratios]
-
-                industry_counts = []
-
-                for i, ratio in enumerate(industry_ratios[:-1]):  # 마지막 제외
-                    count = int(total_businesses * ratio)
-                    industry_counts.append(count)
-
-                # 마지막은 나머지로 계산하여 정확히 맞춤
-                last_count = total_businesses - sum(industry_counts)
-                industry_counts.append(max(0, last_count))
-
-                # 산업분류코드 할당
-                for code, count in zip(industry_codes, industry_counts):
-                    df_year.loc[idx, code] = count
-
-            else:
-                # 기업체수가 0인 경우 모든 코드도 0
-                for code in ['1', '2', '3', '4', '5', '법인구분코드합계']:
-                    df_year.loc[idx, code] = 0
-                for code in ['1.1', '2.1', '3.1', '4.1', '99']:
-                    df_year.loc[idx, code] = 0
-                for code in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']:
-                    df_year.loc[idx, code] = 0
+        allocated = pd.DataFrame(
+            np.hstack([org_counts, org_counts.sum(axis=1, keepdims=True), closure_counts, industry_counts]),
+            columns=ORG_CODES + ['법인구분코드합계'] + CLOSURE_CODES + INDUSTRY_CODES,
+            index=df_year.index
+        )
+        df_year = pd.concat([df_year.drop(columns=allocated.columns, errors='ignore'), allocated], axis=1)
 
         # 컬럼 순서 정리
         base_columns = ['기준년월_시도', '시도', '시군구', '기업체수', '임시및일용근로자수', '상용근로자수', '매출액', '근로자수', '총종사자수', '평균종사자수', '전년동월']
-        org_columns = ['1', '2', '3', '4', '5', '법인구분코드합계']
-        closure_columns = ['1.1', '2.1', '3.1', '4.1', '99']
-        industry_columns = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']
-
-        final_columns = base_columns + org_columns + closure_columns + industry_columns
+        final_columns = base_columns + ORG_CODES + ['법인구분코드합계'] + CLOSURE_CODES + INDUSTRY_CODES
 
         # 누락 컬럼 0으로 채움
         for col in final_columns:
@@ -185,8 +168,8 @@ def generate_correct_timeseries():
         # 검증 출력
         total_business = df_final['기업체수'].sum()
         org_total = df_final['법인구분코드합계'].sum()
-        closure_total = df_final[['1.1', '2.1', '3.1', '4.1', '99']].sum().sum()
-        industry_total = df_final[['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S']].sum().sum()
+        closure_total = df_final[CLOSURE_CODES].sum().sum()
+        industry_total = df_final[INDUSTRY_CODES].sum().sum()
 
         print(f"저장 완료: {output_file}")
         print(f"  - 총 {len(df_final)}행 × {len(df_final.columns)}열")
@@ -198,4 +181,4 @@ def generate_correct_timeseries():
     print(f"\n정확한 시계열 집계표 생성 완료!")
 
 if __name__ == "__main__":
-    generate_correct_timeseries()
\ No newline at end of file
+    generate_correct_timeseries()
@@ -16,6 +16,16 @@ from reportlab.lib.units import inch
 import tempfile
 import os
 from datetime import datetime
+import sys
+
+# 프로젝트 루트를 sys.path에 추가 (routes 폴더 기준)
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from module.giup_cube import AggregationCube
+from module.giup_dataset import get_giup_dataset
+from module.page_cache import UncachedHTML
 
 # 한글 폰트 설정
 plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
@@ -57,97 +67,36 @@ def convert_to_native_types(data):
         return data
 
 def load_data():
-    """4개년 모의 데이터 로드 및 통합"""
+    """4개년 집계표 데이터 로드 (공유 데이터셋 레지스트리 사용)"""
     try:
-        # 4개년 집계표 파일 경로 설정
-        data_path = Path(__file__).parent.parent / 'data'
-        files = [
-            '집계표_202212.xlsx',  # 2022년 12월
-            '집계표_202312.xlsx',  # 2023년 12월
-            '집계표_202406.xlsx',  # 2024년 6월
-            '집계표_202412.xlsx'   # 2024년 12월
-        ]
-
-        # 각 파일 로드 및 통합
-        all_data = []
-
-        for file_name in files:
-            file_path = data_path / file_name
-            if file_path.exists():
-                print(f"로드 중: {file_name}")
-                df = pd.read_excel(file_path)
-
-                # 기준년월에서 년도와 월 추출
-                year_month = file_name.split('_')[1].split('.')[0]  # 202212, 202312, 202412 (.xlsx 제거)
-                df['년도'] = int(year_month[:4])
-                df['월'] = int(year_month[4:])
-
-                all_data.append(df)
-            else:
-                print(f"파일이 존재하지 않습니다: {file_name}")
-
-        if not all_data:
+        dataset = get_giup_dataset()
+        df = dataset.view()
+
+        if df.empty:
             print("로드할 데이터가 없습니다.")
             return pd.DataFrame(), [], [], [], []
 
-        # 모든 데이터 통합
-        df = pd.concat(all_data, ignore_index=True)
-        print(f"통합 데이터: {len(df)}행, {len(df.columns)}열")
-
-        # 결측값 제거
-        df = df.dropna(subset=['시도', '시군구'])
-
-        # 숫자형 컬럼들 정의 (3개년 집계표 구조에 맞게)
-        numeric_cols = [
-            '기업체수', '임시및일용근로자수', '상용근로자수', '매출액',
-            '근로자수', '총종사자수', '평균종사자수', '등록일자수',
-            '개업일자수', '폐업일자수'
-        ]
-
-        # 폐업구분 컬럼들
-        closure_cols = ['폐업(1)', '폐업(2)', '폐업(3)', '폐업(4)', '폐업(99)']
-
-        # 기업구분 컬럼들
-        business_cols = ['기업(1)', '기업(2)', '기업(3)', '기업(4)', '기업(5)']
+        groups = dataset.column_groups
 
-        # 산업구분 컬럼들 (A-S)
-        industry_cols = [f'산업({chr(65+i)})' for i in range(19)]  # A-S
+        print(f"사용 가능한 숫자형 컬럼: {groups.numeric}")
+        print(f"폐업구분 컬럼: {groups.closure}")
+        print(f"기업구분 컬럼: {groups.business}")
+        print(f"산업구분 컬럼: {len(groups.industry)}개")
 
-        # 모든 숫자형 컬럼들 (기본 + 구분별) 전처리
-        all_numeric_cols = numeric_cols + closure_cols + business_cols + industry_cols
-
-        for col in all_numeric_cols:
-            if col in df.columns:
-                if df[col].dtype == 'object':
-                    # 쉼표, 특수문자 제거하고 숫자로 변환
-                    df[col] = pd.to_numeric(
-                        df[col].astype(str).str.replace(',', '').str.replace('*', '1'),
-                        errors='coerce'
-                    )
-                df[col] = df[col].fillna(0)  # NaN을 0으로 대체
-
-        # 실제 존재하는 컬럼들만 필터링
-        numeric_cols = [col for col in numeric_cols if col in df.columns]
-        closure_cols = [col for col in closure_cols if col in df.columns]
-        business_cols = [col for col in business_cols if col in df.columns]
-        industry_cols = [col for col in industry_cols if col in df.columns]
-
-        print(f"사용 가능한 숫자형 컬럼: {numeric_cols}")
-        print(f"폐업구분 컬럼: {closure_cols}")
-        print(f"기업구분 컬럼: {business_cols}")
-        print(f"산업구분 컬럼: {len(industry_cols)}개")
-        print(f"시도별 데이터 수: {df['시도'].value_counts().head()}")
-
-        return df, numeric_cols, closure_cols, business_cols, industry_cols
+        return df, groups.numeric, groups.closure, groups.business, groups.industry
 
     except Exception as e:
         print(f"데이터 로드 중 오류: {e}")
         return pd.DataFrame(), [], [], [], []
 
-def create_comprehensive_dashboard(df, numeric_cols, closure_cols, business_cols, industry_cols):
+def create_comprehensive_dashboard(df, numeric_cols, closure_cols, business_cols, industry_cols, cube=None):
     """종합 대시보드 생성 (폐업구분, 기업구분, 산업구분 포함)"""
     if df.empty or not numeric_cols:
-        return "<p>데이터를 불러올 수 없습니다.</p>"
+        return UncachedHTML("<p>데이터를 불러올 수 없습니다.</p>")
+
+    # 집계는 미리 계산된 큐브의 배열 슬라이스로 처리
+    if cube is None:
+        cube = AggregationCube(df, numeric_cols + closure_cols + business_cols + industry_cols)
 
     # 기본 분석 지표 선택
     selected_metric = numeric_cols[0]
@@ -190,38 +139,40 @@ def create_comprehensive_dashboard(df, numeric_cols, closure_cols, business_cols
     }
 
     # 기본 통계 계산
-    latest_df = df[df['년도'] == latest_year]
-    total_companies = latest_df[selected_metric].sum()
+    total_companies = cube.sum(selected_metric, year=latest_year)
 
     # 성장률 계산
     growth_rate = 0
     if len(available_years) >= 2:
         first_year = min(available_years)
         last_year = max(available_years)
-        first_value = df[df['년도'] == first_year][selected_metric].sum()
-        last_value = df[df['년도'] == last_year][selected_metric].sum()
+        first_value = cube.sum(selected_metric, year=first_year)
+        last_value = cube.sum(selected_metric, year=last_year)
         if first_value > 0:
             growth_rate = ((last_value - first_value) / first_value) * 100
 
     # 시도별 데이터 준비
-    sido_summary = latest_df.groupby('시도')[selected_metric].sum().sort_values(ascending=False)
+    sido_summary = cube.group_sum(selected_metric, by='시도', year=latest_year).sort_values(ascending=False)
 
-    # 구분별 데이터 준비
+    # 구분별 데이터 준비 (최신 년도 합계를 한 번에 계산)
     closure_data = {}
     business_data = {}
     industry_data = {}
 
+    breakdown_cols = [col for col in closure_cols + business_cols + industry_cols if col in cube.metrics]
+    breakdown_totals = cube.sum(breakdown_cols, year=latest_year)
+
     for col in closure_cols:
-        if col in latest_df.columns:
-            closure_data[col] = latest_df[col].sum()
+        if col in breakdown_totals.index:
+            closure_data[col] = breakdown_totals[col]
 
     for col in business_cols:
-        if col in latest_df.columns:
-            business_data[col] = latest_df[col].sum()
+        if col in breakdown_totals.index:
+            business_data[col] = breakdown_totals[col]
 
     for col in industry_cols:
-        if col in latest_df.columns:
-            industry_data[col] = latest_df[col].sum()
+        if col in breakdown_totals.index:
+            industry_data[col] = breakdown_totals[col]
 
     # JSON 데이터 생성
     dashboard_data = {
@@ -876,4 +827,5 @@ def create_comprehensive_dashboard(df, numeric_cols, closure_cols, business_cols
 def render():
     """Flask main_app.py에서 호출하는 함수"""
     df, numeric_cols, closure_cols, business_cols, industry_cols = load_data()
-    return create_comprehensive_dashboard(df, numeric_cols, closure_cols, business_cols, industry_cols)
\ No newline at end of file
+    cube = get_giup_dataset().cube() if not df.empty else None
+    return create_comprehensive_dashboard(df, numeric_cols, closure_cols, business_cols, industry_cols, cube)
\ No newline at end of file
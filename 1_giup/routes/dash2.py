@@ -5,6 +5,16 @@ from pathlib import Path
 import json
 import numpy as np
 import random
+import sys
+
+# 프로젝트 루트를 sys.path에 추가 (routes 폴더 기준)
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from module.giup_cube import AggregationCube
+from module.giup_dataset import get_giup_dataset
+from module.page_cache import UncachedHTML
 
 class NumpyEncoder(json.JSONEncoder):
     """JSON encoder for numpy data types"""
@@ -41,68 +51,19 @@ def convert_to_native_types(data):
         return data
 
 def load_data():
-    """3개년 모의 데이터 로드 및 통합 (경상북도 지역 특화)"""
+    """3개년 연말(12월) 집계표 데이터 로드 (경상북도 지역 특화, 공유 데이터셋 레지스트리 사용)"""
     try:
-        # 3개년 집계표 파일 경로 설정
-        data_path = Path(__file__).parent.parent / 'data'
-        files = [
-            '집계표_202212.xlsx',  # 2022년 12월
-            '집계표_202312.xlsx',  # 2023년 12월
-            '집계표_202412.xlsx'   # 2024년 12월
-        ]
-
-        # 각 파일 로드 및 통합
-        all_data = []
-
-        for file_name in files:
-            file_path = data_path / file_name
-            if file_path.exists():
-                print(f"로드 중: {file_name}")
-                df = pd.read_excel(file_path)
-
-                # 기준년월에서 년도와 월 추출
-                year_month = file_name.split('_')[1].split('.')[0]  # 202212, 202312, 202412 (.xlsx 제거)
-                df['년도'] = int(year_month[:4])
-                df['월'] = int(year_month[4:])
-
-                all_data.append(df)
-            else:
-                print(f"파일이 존재하지 않습니다: {file_name}")
-
-        if not all_data:
-            print("로드할 데이터가 없습니다.")
-            return pd.DataFrame(), []
-
-        # 모든 데이터 통합
-        df = pd.concat(all_data, ignore_index=True)
-        print(f"통합 데이터: {len(df)}행, {len(df.columns)}열")
+        dataset = get_giup_dataset()
 
-        # 결측값 제거
-        df = df.dropna(subset=['시도', '시군구'])
+        # 년도별 비교를 위해 12월 기준 집계표만 사용
+        df = dataset.view(months=[12])
 
-        # 숫자형 컬럼들 정의 (3개년 집계표 구조에 맞게)
-        numeric_cols = [
-            '기업체수', '임시및일용근로자수', '상용근로자수', '매출액',
-            '근로자수', '총종사자수', '평균종사자수', '등록일자수',
-            '개업일자수', '폐업일자수'
-        ]
-
-        # 숫자형 컬럼들 전처리 (문자열이나 특수문자 처리)
-        for col in numeric_cols:
-            if col in df.columns:
-                if df[col].dtype == 'object':
-                    # 쉼표, 특수문자 제거하고 숫자로 변환
-                    df[col] = pd.to_numeric(
-                        df[col].astype(str).str.replace(',', '').str.replace('*', '1'),
-                        errors='coerce'
-                    )
-                df[col] = df[col].fillna(0)  # NaN을 0으로 대체
-
-        # 실제 존재하는 숫자형 컬럼만 반환
-        numeric_cols = [col for col in numeric_cols if col in df.columns]
+        if df.empty:
+            print("로드할 데이터가 없습니다.")
+            return pd.DataFrame(), []
 
+        numeric_cols = dataset.column_groups.numeric
         print(f"사용 가능한 숫자형 컬럼: {numeric_cols}")
-        print(f"시도별 데이터 수: {df['시도'].value_counts().head()}")
 
         return df, numeric_cols
 
@@ -150,17 +111,22 @@ def create_sample_gyeongbuk_data(base_df, numeric_cols):
 
     return pd.DataFrame(sample_data)
 
-def create_gyeongbuk_charts(df, numeric_cols):
+def create_gyeongbuk_charts(df, numeric_cols, cube=None):
     """경상북도 시군별 3개년 시계열 차트 생성"""
     if df.empty or not numeric_cols:
-        return "<p>데이터를 불러올 수 없습니다.</p>"
+        return UncachedHTML("<p>데이터를 불러올 수 없습니다.</p>")
 
     # 경상북도 데이터 필터링
-    gyeongbuk_df = df[df['시도'] == '경상북도'].copy()
+    gyeongbuk_df = df[df['시도'] == '경상북도']
 
     if len(gyeongbuk_df) == 0:
         # 샘플 데이터 생성 (모의 데이터가 없는 경우)
         gyeongbuk_df = create_sample_gyeongbuk_data(df, numeric_cols)
+        cube = None
+
+    # 집계는 미리 계산된 큐브의 배열 슬라이스로 처리
+    if cube is None:
+        cube = AggregationCube(gyeongbuk_df, numeric_cols)
 
     # 기본 분석 지표 선택
     selected_metric = numeric_cols[0]
@@ -184,12 +150,9 @@ def create_gyeongbuk_charts(df, numeric_cols):
 
     # 최신 년도 기준 시군구별 집계
     latest_year = max(available_years) if available_years else 2024
-    latest_gyeongbuk = gyeongbuk_df[gyeongbuk_df['년도'] == latest_year]
 
     # 시군구별 집계 (최신 년도 기준)
-    sigungu_summary = latest_gyeongbuk.groupby('시군구').agg({
-        selected_metric: 'sum'
-    }).reset_index()
+    sigungu_summary = cube.group_sum(selected_metric, by='시군구', sido='경상북도', year=latest_year).reset_index()
     sigungu_summary = sigungu_summary.sort_values(selected_metric, ascending=False)
 
     # 3개년 성장률 계산
@@ -198,8 +161,8 @@ def create_gyeongbuk_charts(df, numeric_cols):
         first_year = min(available_years)
         last_year = max(available_years)
 
-        first_year_data = gyeongbuk_df[gyeongbuk_df['년도'] == first_year].groupby('시군구')[selected_metric].sum()
-        last_year_data = gyeongbuk_df[gyeongbuk_df['년도'] == last_year].groupby('시군구')[selected_metric].sum()
+        first_year_data = cube.group_sum(selected_metric, by='시군구', sido='경상북도', year=first_year)
+        last_year_data = cube.group_sum(selected_metric, by='시군구', sido='경상북도', year=last_year)
 
         for city in first_year_data.index:
             if city in last_year_data.index and first_year_data[city] > 0:
@@ -207,9 +170,7 @@ def create_gyeongbuk_charts(df, numeric_cols):
                 growth_data[city] = round(growth_rate, 1)
 
     # 시계열 데이터 생성 (경상북도 전체)
-    timeseries_total = gyeongbuk_df.groupby('년도').agg({
-        selected_metric: 'sum'
-    }).reset_index()
+    timeseries_total = cube.group_sum(selected_metric, by='년도', sido='경상북도').reset_index()
 
     # JSON 직렬화를 위해 데이터타입 변환
     timeseries_total['년도'] = timeseries_total['년도'].astype(int)
@@ -220,9 +181,7 @@ def create_gyeongbuk_charts(df, numeric_cols):
     timeseries_by_city = {}
 
     for city in top_cities:
-        city_data = gyeongbuk_df[gyeongbuk_df['시군구'] == city].groupby('년도').agg({
-            selected_metric: 'sum'
-        }).reset_index()
+        city_data = cube.group_sum(selected_metric, by='년도', sido='경상북도', sigungu=city).reset_index()
         timeseries_by_city[city] = {
             'years': [int(x) for x in city_data['년도'].tolist()],
             'values': [float(x) for x in city_data[selected_metric].tolist()]
@@ -368,13 +327,13 @@ def create_gyeongbuk_charts(df, numeric_cols):
                     </div>
                     <div class="col-md-3">
                         <div class="metric-card">
-                            <h3 id="totalCompanies">{len(latest_gyeongbuk):,}</h3>
+                            <h3 id="totalCompanies">{cube.count(sido='경상북도', year=latest_year):,}</h3>
                             <p>총 기업 수 ({latest_year}년)</p>
                         </div>
                     </div>
                     <div class="col-md-3">
                         <div class="metric-card">
-                            <h3 id="totalMetric">{latest_gyeongbuk[selected_metric].sum():,.0f}</h3>
+                            <h3 id="totalMetric">{cube.sum(selected_metric, sido='경상북도', year=latest_year):,.0f}</h3>
                             <p>총 {metric_display_names.get(selected_metric, selected_metric)} ({latest_year}년)</p>
                         </div>
                     </div>
@@ -883,4 +842,5 @@ def create_gyeongbuk_charts(df, numeric_cols):
 def render():
     """Flask main_app.py에서 호출하는 함수"""
     df, numeric_cols = load_data()
-    return create_gyeongbuk_charts(df, numeric_cols)
\ No newline at end of file
+    cube = get_giup_dataset().cube(months=[12]) if not df.empty else None
+    return create_gyeongbuk_charts(df, numeric_cols, cube)
\ No newline at end of file
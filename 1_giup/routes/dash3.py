@@ -5,8 +5,6 @@ import seaborn as sns
 import numpy as np
 from pathlib import Path
 import json
-import base64
-import io
 from matplotlib import font_manager
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
@@ -16,6 +14,17 @@ from reportlab.lib.units import inch
 import tempfile
 import os
 from datetime import datetime
+import sys
+
+# 프로젝트 루트를 sys.path에 추가 (routes 폴더 기준)
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from module.chart_cache import chart_cache
+from module.chart_renderer import chart_renderer
+from module.giup_dataset import get_giup_dataset
+from module.page_cache import UncachedHTML
 
 # 한글 폰트 설정
 import matplotlib.font_manager as fm
@@ -40,6 +49,14 @@ if platform.system() == 'Windows':
 plt.rcParams['axes.unicode_minus'] = False
 sns.set_style("whitegrid")
 
+# 렌더링 프로세스에 전달할 차트 스타일 (한글 폰트 + seaborn whitegrid)
+# seaborn 전용 컬러맵(image.cmap)은 seaborn을 임포트하지 않는 렌더링 프로세스에 없으므로 제외
+CHART_RC = {
+    **{key: value for key, value in sns.axes_style("whitegrid").items() if key != 'image.cmap'},
+    'font.family': list(plt.rcParams['font.family']),
+    'axes.unicode_minus': False
+}
+
 # 현재 설정된 폰트 확인
 print(f"현재 설정된 폰트: {plt.rcParams['font.family']}")
 
@@ -78,63 +95,16 @@ def convert_to_native_types(data):
         return data
 
 def load_data():
-    """4개년 모의 데이터 로드 및 통합"""
+    """4개년 집계표 데이터 로드 (공유 데이터셋 레지스트리 사용)"""
     try:
-        # 4개년 집계표 파일 경로 설정
-        data_path = Path(__file__).parent.parent / 'data'
-        files = [
-            '집계표_202212.xlsx',  # 2022년 12월
-            '집계표_202312.xlsx',  # 2023년 12월
-            '집계표_202406.xlsx',  # 2024년 6월
-            '집계표_202412.xlsx'   # 2024년 12월
-        ]
-
-        # 각 파일 로드 및 통합
-        all_data = []
-
-        for file_name in files:
-            file_path = data_path / file_name
-            if file_path.exists():
-                print(f"로드 중: {file_name}")
-                df = pd.read_excel(file_path)
-
-                # 기준년월에서 년도와 월 추출
-                year_month = file_name.split('_')[1].split('.')[0]  # 202212, 202312, 202412 (.xlsx 제거)
-                df['년도'] = int(year_month[:4])
-                df['월'] = int(year_month[4:])
-
-                all_data.append(df)
-            else:
-                print(f"파일이 존재하지 않습니다: {file_name}")
-
-        if not all_data:
+        # 공유 패널의 읽기 전용 뷰 (추가 컬럼은 이 뷰에만 반영됨)
+        dataset = get_giup_dataset()
+        df = dataset.view()
+
+        if df.empty:
             print("로드할 데이터가 없습니다.")
             return pd.DataFrame(), [], [], [], []
 
-        # 모든 데이터 통합
-        df = pd.concat(all_data, ignore_index=True)
-        print(f"통합 데이터: {len(df)}행, {len(df.columns)}열")
-
-        # 결측값 제거
-        df = df.dropna(subset=['시도', '시군구'])
-
-        # 숫자형 컬럼들 정의 (3개년 집계표 구조에 맞게)
-        numeric_cols = [
-            '기업체수', '임시및일용근로자수', '상용근로자수', '매출액',
-            '근로자수', '총종사자수', '평균종사자수', '등록일자수',
-            '개업일자수', '폐업일자수'
-        ]
-
-        # 사용 가능한 컬럼만 필터링
-        available_cols = [col for col in numeric_cols if col in df.columns]
-
-        # 숫자형 변환 및 특수문자 처리
-        for col in available_cols:
-            if col in df.columns:
-                # 문자열을 숫자로 변환 (특수문자 '*' 처리)
-                df[col] = df[col].astype(str).replace('*', '1').replace(',', '').replace('-', '0')
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-
         # 종사자수 계산 (상용 + 임시일용)
         if '상용근로자수' in df.columns and '임시및일용근로자수' in df.columns:
             df['종사자수'] = df['상용근로자수'] + df['임시및일용근로자수']
@@ -164,9 +134,10 @@ def load_data():
                                  'N_사업시설관리,사업지원및임대서비스업', 'O_공공행정,국방및사회보장행정', 'P_교육서비스업',
                                  'Q_보건업및사회복지서비스업', 'R_예술,스포츠및여가관련서비스업', 'S_협회및단체,수리및기타개인서비스업']
 
-            # 랜덤하게 산업분류 할당
+            # 랜덤하게 산업분류 할당 (데이터 버전으로 시드를 고정하여 같은 데이터면 요청/워커가 달라도 같은 결과)
             import random
-            df['산업분류'] = [random.choice(industry_categories) for _ in range(len(df))]
+            rng = random.Random(int(dataset.version, 16))
+            df['산업분류'] = [rng.choice(industry_categories) for _ in range(len(df))]
             industry_col = '산업분류'
 
         industry_list = sorted(df[industry_col].unique().tolist()) if industry_col else []
@@ -181,184 +152,75 @@ def load_data():
         print(f"데이터 로드 중 오류: {str(e)}")
         return pd.DataFrame(), [], [], [], []
 
-def create_region_table_chart(df, year=None, month=None):
-    """행정구역별 사업체 현황 표와 막대그래프 생성"""
+def _filter_period(df, year=None, month=None):
+    """년도/월 조건으로 데이터 필터링 ('전체'나 빈 값이면 필터하지 않음)"""
+    filtered_df = df
+    if year and year != '전체':
+        filtered_df = filtered_df[filtered_df['년도'] == int(year)]
+    if month and month != '전체':
+        filtered_df = filtered_df[filtered_df['월'] == int(month)]
+    return filtered_df
+
+def _summary_with_total(summary, name_col):
+    """합계 행을 맨 위에 추가하고 표시용 포맷 컬럼 생성"""
+    total_row = pd.DataFrame({
+        name_col: ['합계'],
+        '기업체수': [summary['기업체수'].sum()],
+        '종사자수': [summary['종사자수'].sum()],
+        '매출액': [summary['매출액'].sum()]
+    })
+    summary = pd.concat([total_row, summary], ignore_index=True)
+
+    # 수치 포맷팅
+    summary['기업체수_fmt'] = summary['기업체수'].apply(lambda x: f"{x:,}")
+    summary['종사자수_fmt'] = summary['종사자수'].apply(lambda x: f"{x:,}")
+    summary['매출액_fmt'] = summary['매출액'].apply(lambda x: f"{x/100000000:.1f}억원" if x >= 100000000 else f"{x/10000:.0f}만원")
+    return summary
+
+def _bar_values(chart_data, labels):
+    """막대그래프용 상위 항목 값 (파이썬 기본형 리스트)"""
+    return {
+        'labels': [str(label) for label in labels],
+        '기업체수': chart_data['기업체수'].tolist(),
+        '종사자수': chart_data['종사자수'].tolist(),
+        '매출액_억': (chart_data['매출액'] / 100000000).tolist()
+    }
+
+def build_region_spec(df, year=None, month=None):
+    """행정구역별 사업체 현황 차트 명세 생성 (렌더링은 chart_renderer에서 처리)"""
     try:
-        # 데이터 필터링
-        filtered_df = df.copy()
-        if year and year != '전체':
-            filtered_df = filtered_df[filtered_df['년도'] == int(year)]
-        if month and month != '전체':
-            filtered_df = filtered_df[filtered_df['월'] == int(month)]
-
+        filtered_df = _filter_period(df, year, month)
         if filtered_df.empty:
             return None
 
         # 시도별 집계
-        region_summary = filtered_df.groupby('시도').agg({
+        region_summary = filtered_df.groupby('시도', observed=True).agg({
             '기업체수': 'sum',
             '종사자수': 'sum',
             '매출액': 'sum'
         }).reset_index()
+        region_summary = _summary_with_total(region_summary, '시도')
 
-        # 합계 행 추가
-        total_row = pd.DataFrame({
-            '시도': ['합계'],
-            '기업체수': [region_summary['기업체수'].sum()],
-            '종사자수': [region_summary['종사자수'].sum()],
-            '매출액': [region_summary['매출액'].sum()]
-        })
-
-        # 합계를 맨 위에 추가
-        region_summary = pd.concat([total_row, region_summary], ignore_index=True)
-
-        # 수치 포맷팅
-        region_summary['기업체수_fmt'] = region_summary['기업체수'].apply(lambda x: f"{x:,}")
-        region_summary['종사자수_fmt'] = region_summary['종사자수'].apply(lambda x: f"{x:,}")
-        region_summary['매출액_fmt'] = region_summary['매출액'].apply(lambda x: f"{x/100000000:.1f}억원" if x >= 100000000 else f"{x/10000:.0f}만원")
-
-        # 시각화 생성 - 4개의 서브플롯 (표1개 + 그래프3개)
-        fig = plt.figure(figsize=(24, 16))
-
-        # 1. 표 생성 (좌측 상단)
-        ax1 = plt.subplot(2, 2, 1)
-        ax1.axis('tight')
-        ax1.axis('off')
-
-        # 표 데이터 준비
-        table_data = region_summary[['시도', '기업체수_fmt', '종사자수_fmt', '매출액_fmt']].values
-
-        # 표 생성
-        table = ax1.table(cellText=table_data,
-                         colLabels=['행정구역', '사업체수', '종사자수', '매출액'],
-                         cellLoc='center',
-                         loc='center',
-                         colWidths=[0.3, 0.25, 0.25, 0.2])
-
-        # 표 스타일링
-        table.auto_set_font_size(False)
-        table.set_fontsize(11)
-        table.scale(1.2, 1.8)
-
-        # 헤더 스타일
-        for i in range(4):
-            table[(0, i)].set_facecolor('#4472C4')
-            table[(0, i)].set_text_props(weight='bold', color='white', ha='center')
-
-        # 데이터 행 스타일링
-        for idx in range(len(table_data)):
-            # 행정구역명은 왼쪽 정렬, 숫자는 오른쪽 정렬
-            table[(idx + 1, 0)].set_text_props(ha='left')  # 행정구역
-            for j in range(1, 4):  # 숫자 컬럼들
-                table[(idx + 1, j)].set_text_props(ha='right')  # 우측 정렬
-
-            # 합계 행 스타일 (첫 번째 데이터 행)
-            if idx == 0:  # 합계 행
-                for i in range(4):
-                    table[(idx + 1, i)].set_facecolor('#B4C7E7')
-                    table[(idx + 1, i)].set_text_props(weight='bold')
-
-            # 경상북도 행 찾아서 진한 파란색으로 표시
-            elif '경상북도' in str(table_data[idx][0]) or '경북' in str(table_data[idx][0]):
-                for i in range(4):
-                    table[(idx + 1, i)].set_facecolor('#1f4e79')  # 진한 파란색
-                    table[(idx + 1, i)].set_text_props(color='white', weight='bold')
-
-        ax1.set_title('행정구역별 사업체 현황', fontsize=16, fontweight='bold', pad=20)
-
-        # 차트용 데이터 준비 (합계 제외)
-        chart_data = region_summary[region_summary['시도'] != '합계'].copy()
-        chart_data = chart_data.nlargest(10, '기업체수')  # 상위 10개만
-
-        # 경상북도 색상 구분 함수
-        def get_colors(regions, base_color):
-            return ['#1f4e79' if '경상북도' in region or '경북' in region else base_color for region in regions]
-
-        # 2. 사업체수 막대그래프 (우측 상단)
-        ax2 = plt.subplot(2, 2, 2)
-        colors = get_colors(chart_data['시도'], '#4472C4')
-        bars = ax2.bar(range(len(chart_data)), chart_data['기업체수'], color=colors)
-        ax2.set_xlabel('행정구역', fontweight='bold')
-        ax2.set_ylabel('사업체수', fontweight='bold')
-        ax2.set_title('행정구역별 사업체수 (상위 10개)', fontsize=14, fontweight='bold')
-        ax2.set_xticks(range(len(chart_data)))
-        ax2.set_xticklabels(chart_data['시도'], rotation=45, ha='right')
-        ax2.grid(True, alpha=0.3)
-
-        # 막대 위에 값 표시
-        for bar, value in zip(bars, chart_data['기업체수']):
-            height = bar.get_height()
-            ax2.annotate(f'{value:,}',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom', fontsize=9)
-
-        # 3. 종사자수 막대그래프 (좌측 하단)
-        ax3 = plt.subplot(2, 2, 3)
-        colors = get_colors(chart_data['시도'], '#70AD47')
-        bars = ax3.bar(range(len(chart_data)), chart_data['종사자수'], color=colors)
-        ax3.set_xlabel('행정구역', fontweight='bold')
-        ax3.set_ylabel('종사자수', fontweight='bold')
-        ax3.set_title('행정구역별 종사자수 (상위 10개)', fontsize=14, fontweight='bold')
-        ax3.set_xticks(range(len(chart_data)))
-        ax3.set_xticklabels(chart_data['시도'], rotation=45, ha='right')
-        ax3.grid(True, alpha=0.3)
-
-        # 막대 위에 값 표시
-        for bar, value in zip(bars, chart_data['종사자수']):
-            height = bar.get_height()
-            ax3.annotate(f'{value:,}',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom', fontsize=9)
-
-        # 4. 매출액 막대그래프 (우측 하단)
-        ax4 = plt.subplot(2, 2, 4)
-        chart_data['매출액_억'] = chart_data['매출액'] / 100000000
-        colors = get_colors(chart_data['시도'], '#FFC000')
-        bars = ax4.bar(range(len(chart_data)), chart_data['매출액_억'], color=colors)
-        ax4.set_xlabel('행정구역', fontweight='bold')
-        ax4.set_ylabel('매출액(억원)', fontweight='bold')
-        ax4.set_title('행정구역별 매출액 (상위 10개)', fontsize=14, fontweight='bold')
-        ax4.set_xticks(range(len(chart_data)))
-        ax4.set_xticklabels(chart_data['시도'], rotation=45, ha='right')
-        ax4.grid(True, alpha=0.3)
-
-        # 막대 위에 값 표시
-        for bar, value in zip(bars, chart_data['매출액_억']):
-            height = bar.get_height()
-            ax4.annotate(f'{value:.1f}억',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom', fontsize=9)
-
-        plt.tight_layout(pad=3.0)
-
-        # 이미지로 변환
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_str = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close()
-
-        return img_str
+        # 차트용 데이터 준비 (합계 제외, 상위 10개만)
+        chart_data = region_summary[region_summary['시도'] != '합계']
+        chart_data = chart_data.nlargest(10, '기업체수')
+
+        return {
+            'kind': 'region',
+            'rc': CHART_RC,
+            'table_title': '행정구역별 사업체 현황',
+            'table_rows': region_summary[['시도', '기업체수_fmt', '종사자수_fmt', '매출액_fmt']].values.tolist(),
+            'bars': _bar_values(chart_data, chart_data['시도'])
+        }
 
     except Exception as e:
         print(f"행정구역별 차트 생성 오류: {str(e)}")
         return None
 
-def create_industry_table_chart(df, year=None, month=None):
-    """산업분류별 사업체 현황 표와 막대그래프 생성"""
+def build_industry_spec(df, year=None, month=None):
+    """산업분류별 사업체 현황 차트 명세 생성 (렌더링은 chart_renderer에서 처리)"""
     try:
-        # 데이터 필터링
-        filtered_df = df.copy()
-        if year and year != '전체':
-            filtered_df = filtered_df[filtered_df['년도'] == int(year)]
-        if month and month != '전체':
-            filtered_df = filtered_df[filtered_df['월'] == int(month)]
-
+        filtered_df = _filter_period(df, year, month)
         if filtered_df.empty:
             return None
 
@@ -371,7 +233,7 @@ def create_industry_table_chart(df, year=None, month=None):
         industry_col = industry_cols[0]
 
         # 산업분류별 집계
-        industry_summary = filtered_df.groupby(industry_col).agg({
+        industry_summary = filtered_df.groupby(industry_col, observed=True).agg({
             '기업체수': 'sum',
             '종사자수': 'sum',
             '매출액': 'sum'
@@ -380,159 +242,76 @@ def create_industry_table_chart(df, year=None, month=None):
         # 산업분류명 정리 (A, B, C 등으로 시작하는 경우)
         industry_summary[industry_col] = industry_summary[industry_col].astype(str)
         industry_summary = industry_summary.sort_values(industry_col)
+        industry_summary = _summary_with_total(industry_summary, industry_col)
 
-        # 합계 행 추가
-        total_row = pd.DataFrame({
-            industry_col: ['합계'],
-            '기업체수': [industry_summary['기업체수'].sum()],
-            '종사자수': [industry_summary['종사자수'].sum()],
-            '매출액': [industry_summary['매출액'].sum()]
-        })
-
-        # 합계를 맨 위에 추가
-        industry_summary = pd.concat([total_row, industry_summary], ignore_index=True)
-
-        # 수치 포맷팅
-        industry_summary['기업체수_fmt'] = industry_summary['기업체수'].apply(lambda x: f"{x:,}")
-        industry_summary['종사자수_fmt'] = industry_summary['종사자수'].apply(lambda x: f"{x:,}")
-        industry_summary['매출액_fmt'] = industry_summary['매출액'].apply(lambda x: f"{x/100000000:.1f}억원" if x >= 100000000 else f"{x/10000:.0f}만원")
-
-        # 시각화 생성 - 4개의 서브플롯 (표1개 + 그래프3개)
-        fig = plt.figure(figsize=(24, 16))
-
-        # 1. 표 생성 (좌측 상단)
-        ax1 = plt.subplot(2, 2, 1)
-        ax1.axis('tight')
-        ax1.axis('off')
-
-        # 표 데이터 준비
-        table_data = industry_summary[[industry_col, '기업체수_fmt', '종사자수_fmt', '매출액_fmt']].values
-
-        # 긴 산업분류명 줄바꿈 처리
-        for i, row in enumerate(table_data):
+        # 표 데이터 준비 (25자 이상인 긴 산업분류명은 줄바꿈)
+        table_rows = industry_summary[[industry_col, '기업체수_fmt', '종사자수_fmt', '매출액_fmt']].values.tolist()
+        for row in table_rows:
             industry_name = str(row[0])
             if len(industry_name) > 25:
-                # 25자 이상이면 줄바꿈
-                table_data[i][0] = industry_name[:25] + '\\n' + industry_name[25:]
-
-        # 표 생성
-        table = ax1.table(cellText=table_data,
-                         colLabels=['산업분류', '사업체수', '종사자수', '매출액'],
-                         cellLoc='center',
-                         loc='center',
-                         colWidths=[0.4, 0.2, 0.2, 0.2])
-
-        # 표 스타일링
-        table.auto_set_font_size(False)
-        table.set_fontsize(10)
-        table.scale(1.2, 1.8)
-
-        # 헤더 스타일
-        for i in range(4):
-            table[(0, i)].set_facecolor('#4472C4')
-            table[(0, i)].set_text_props(weight='bold', color='white', ha='center')
-
-        # 데이터 행 스타일링
-        for idx in range(len(table_data)):
-            # 산업분류명은 왼쪽 정렬, 숫자는 오른쪽 정렬
-            table[(idx + 1, 0)].set_text_props(ha='left')  # 산업분류
-            for j in range(1, 4):  # 숫자 컬럼들
-                table[(idx + 1, j)].set_text_props(ha='right')  # 우측 정렬
-
-            # 합계 행 스타일 (첫 번째 데이터 행)
-            if idx == 0:  # 합계 행
-                for i in range(4):
-                    table[(idx + 1, i)].set_facecolor('#B4C7E7')
-                    table[(idx + 1, i)].set_text_props(weight='bold')
-            else:
-                # 나머지 행들은 교대로 색상 적용
-                color = '#F2F2F2' if idx % 2 == 0 else 'white'
-                for i in range(4):
-                    table[(idx + 1, i)].set_facecolor(color)
-
-        ax1.set_title('산업분류별 사업체 현황', fontsize=16, fontweight='bold', pad=20)
-
-        # 차트용 데이터 준비 (합계 제외)
-        chart_data = industry_summary[industry_summary[industry_col] != '합계'].copy()
-        chart_data = chart_data.nlargest(10, '기업체수')  # 상위 10개만
-
-        # 산업분류명 줄임 (그래프용)
-        chart_data['산업분류_short'] = chart_data[industry_col].apply(
+                row[0] = industry_name[:25] + '\\n' + industry_name[25:]
+
+        # 차트용 데이터 준비 (합계 제외, 상위 10개만, 그래프용 짧은 이름)
+        chart_data = industry_summary[industry_summary[industry_col] != '합계']
+        chart_data = chart_data.nlargest(10, '기업체수')
+        short_names = chart_data[industry_col].apply(
             lambda x: x[:12] + '...' if len(str(x)) > 12 else str(x)
         )
 
-        # 2. 사업체수 막대그래프 (우측 상단)
-        ax2 = plt.subplot(2, 2, 2)
-        bars = ax2.bar(range(len(chart_data)), chart_data['기업체수'], color='#4472C4')
-        ax2.set_xlabel('산업분류', fontweight='bold')
-        ax2.set_ylabel('사업체수', fontweight='bold')
-        ax2.set_title('산업분류별 사업체수 (상위 10개)', fontsize=14, fontweight='bold')
-        ax2.set_xticks(range(len(chart_data)))
-        ax2.set_xticklabels(chart_data['산업분류_short'], rotation=45, ha='right')
-        ax2.grid(True, alpha=0.3)
-
-        # 막대 위에 값 표시
-        for bar, value in zip(bars, chart_data['기업체수']):
-            height = bar.get_height()
-            ax2.annotate(f'{value:,}',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom', fontsize=9)
-
-        # 3. 종사자수 막대그래프 (좌측 하단)
-        ax3 = plt.subplot(2, 2, 3)
-        bars = ax3.bar(range(len(chart_data)), chart_data['종사자수'], color='#70AD47')
-        ax3.set_xlabel('산업분류', fontweight='bold')
-        ax3.set_ylabel('종사자수', fontweight='bold')
-        ax3.set_title('산업분류별 종사자수 (상위 10개)', fontsize=14, fontweight='bold')
-        ax3.set_xticks(range(len(chart_data)))
-        ax3.set_xticklabels(chart_data['산업분류_short'], rotation=45, ha='right')
-        ax3.grid(True, alpha=0.3)
-
-        # 막대 위에 값 표시
-        for bar, value in zip(bars, chart_data['종사자수']):
-            height = bar.get_height()
-            ax3.annotate(f'{value:,}',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom', fontsize=9)
-
-        # 4. 매출액 막대그래프 (우측 하단)
-        ax4 = plt.subplot(2, 2, 4)
-        chart_data['매출액_억'] = chart_data['매출액'] / 100000000
-        bars = ax4.bar(range(len(chart_data)), chart_data['매출액_억'], color='#FFC000')
-        ax4.set_xlabel('산업분류', fontweight='bold')
-        ax4.set_ylabel('매출액(억원)', fontweight='bold')
-        ax4.set_title('산업분류별 매출액 (상위 10개)', fontsize=14, fontweight='bold')
-        ax4.set_xticks(range(len(chart_data)))
-        ax4.set_xticklabels(chart_data['산업분류_short'], rotation=45, ha='right')
-        ax4.grid(True, alpha=0.3)
-
-        # 막대 위에 값 표시
-        for bar, value in zip(bars, chart_data['매출액_억']):
-            height = bar.get_height()
-            ax4.annotate(f'{value:.1f}억',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom', fontsize=9)
-
-        plt.tight_layout(pad=3.0)
-
-        # 이미지로 변환
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_str = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close()
-
-        return img_str
+        return {
+            'kind': 'industry',
+            'rc': CHART_RC,
+            'table_title': '산업분류별 사업체 현황',
+            'table_rows': table_rows,
+            'bars': _bar_values(chart_data, short_names)
+        }
 
     except Exception as e:
         print(f"산업분류별 차트 생성 오류: {str(e)}")
         return None
 
+# 차트 종류별 명세 생성 함수
+SPEC_BUILDERS = {
+    'region': build_region_spec,
+    'industry': build_industry_spec,
+}
+
+def create_region_table_chart(df, year=None, month=None):
+    """행정구역별 사업체 현황 표와 막대그래프 생성"""
+    return chart_renderer.render(build_region_spec(df, year, month))
+
+def create_industry_table_chart(df, year=None, month=None):
+    """산업분류별 사업체 현황 표와 막대그래프 생성"""
+    return chart_renderer.render(build_industry_spec(df, year, month))
+
+def get_cached_charts(year=None, month=None, df=None):
+    """
+    행정구역별/산업분류별 차트를 차트 캐시에서 가져오기 (없을 때만 렌더링)
+
+    Args:
+        year (str): 분석 년도 ('전체' 또는 년도)
+        month (str): 분석 월 ('전체' 또는 월)
+        df (pandas.DataFrame): 이미 로드한 데이터 (None이면 렌더링이 필요할 때만 로드)
+
+    Returns:
+        tuple: (행정구역별 차트, 산업분류별 차트) base64 PNG 문자열
+    """
+    year = str(year) if year else '전체'
+    month = str(month) if month else '전체'
+    version = get_giup_dataset().version
+
+    keys = [(kind, year, month, version) for kind in ('region', 'industry')]
+
+    def render_missing(missing_keys):
+        # 없는 차트만 명세를 만들어 렌더링 프로세스 풀에서 병렬 렌더링
+        frame = df if df is not None else load_data()[0]
+        specs = [SPEC_BUILDERS[kind](frame, year, month) for kind, _, _, _ in missing_keys]
+        return chart_renderer.render_many(specs)
+
+    charts = chart_cache.get_or_create_many(keys, render_missing)
+    region_chart, industry_chart = (charts[key] for key in keys)
+    return region_chart, industry_chart
+
 def render():
     """Flask에서 호출할 메인 렌더링 함수"""
     try:
@@ -540,7 +319,7 @@ def render():
         df, sido_list, industry_list, years, months = load_data()
 
         if df.empty:
-            return """
+            return UncachedHTML("""
             <div class="container mt-4">
                 <h1>기업통계등록부 현황 분석</h1>
                 <div class="alert alert-warning">
@@ -552,15 +331,14 @@ def render():
                     </ul>
                 </div>
             </div>
-            """
+            """)
 
         # 기본값으로 최신 년도 선택
         default_year = str(max(years)) if years else '전체'
         default_month = str(max(months)) if months else '전체'
 
         # 기본 차트 생성
-        region_chart = create_region_table_chart(df, default_year, default_month)
-        industry_chart = create_industry_table_chart(df, default_year, default_month)
+        region_chart, industry_chart = get_cached_charts(default_year, default_month, df)
 
         # HTML 템플릿
         html_template = f"""
@@ -774,7 +552,7 @@ def render():
         return html_template
 
     except Exception as e:
-        return f"""
+        return UncachedHTML(f"""
         <div class="container mt-4">
             <h1>기업통계등록부 현황 분석</h1>
             <div class="alert alert-danger">
@@ -783,7 +561,7 @@ def render():
                 <pre>{str(e)}</pre>
             </div>
         </div>
-        """
+        """)
 
 if __name__ == "__main__":
     print("dash3.py 테스트 실행")
@@ -17,7 +17,8 @@ sys.path.insert(0, str(project_root))
 # 환경변수 로드
 load_dotenv(project_root / '.env')
 
-from module.db_config import get_postgres_connection
+from module.db_config import get_postgres_connection, postgres_connection
+from module.bulk_loader import bulk_load_giup
 
 
 def create_table(conn):
@@ -136,64 +137,21 @@ def delete_existing_data(conn, yearmonth):
     return deleted_count
 
 
-def insert_data(conn, df, yearmonth):
+def insert_data(conn, df, yearmonth, batch_size=None):
     """
-    데이터를 PostgreSQL에 삽입
+    데이터를 PostgreSQL에 일괄 적재 (COPY FROM STDIN, 단일 트랜잭션)
 
     Args:
         conn: PostgreSQL 연결 객체
         df: 삽입할 데이터프레임
         yearmonth: 기준년월
-    """
-    cursor = conn.cursor()
+        batch_size: 배치당 행 수 (None이면 한 번에 전송)
 
-    insert_sql = """
-    INSERT INTO giup_statistics (
-        기준년월, 시도, 시군구,
-        기업체수, 임시및일용근로자수, 상용근로자수, 매출액, 근로자수,
-        총종사자수, 평균종사자수, 등록일자수, 개업일자수, 폐업일자수,
-        기업_1, 기업_2, 기업_3, 기업_4, 기업_5, 법인구분코드합계,
-        폐업_1, 폐업_2, 폐업_3, 폐업_4, 폐업_99,
-        산업_A, 산업_B, 산업_C, 산업_D, 산업_E, 산업_F,
-        산업_G, 산업_H, 산업_I, 산업_J, 산업_K, 산업_L,
-        산업_M, 산업_N, 산업_O, 산업_P, 산업_Q, 산업_R, 산업_S
-    ) VALUES (
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-        %s, %s, %s
-    )
+    Returns:
+        int: 삽입된 행 수 (실패한 행은 행 단위로 로그 출력)
     """
-
-    inserted_count = 0
-    error_count = 0
-
-    for idx, row in df.iterrows():
-        try:
-            cursor.execute(insert_sql, (
-                yearmonth, row['시도'], row['시군구'],
-                row['기업체수'], row['임시및일용근로자수'], row['상용근로자수'],
-                row['매출액'], row['근로자수'], row['총종사자수'], row['평균종사자수'],
-                row['등록일자수'], row['개업일자수'], row['폐업일자수'],
-                row['기업_1'], row['기업_2'], row['기업_3'], row['기업_4'], row['기업_5'],
-                row['법인구분코드합계'],
-                row['폐업_1'], row['폐업_2'], row['폐업_3'], row['폐업_4'], row['폐업_99'],
-                row['산업_A'], row['산업_B'], row['산업_C'], row['산업_D'], row['산업_E'],
-                row['산업_F'], row['산업_G'], row['산업_H'], row['산업_I'], row['산업_J'],
-                row['산업_K'], row['산업_L'], row['산업_M'], row['산업_N'], row['산업_O'],
-                row['산업_P'], row['산업_Q'], row['산업_R'], row['산업_S']
-            ))
-            inserted_count += 1
-        except Exception as e:
-            error_count += 1
-            print(f"[WARNING] Row {idx} 삽입 실패: {e}")
-
-    conn.commit()
-    cursor.close()
-
-    print(f"[OK] 데이터 삽입 완료: {inserted_count}건 성공, {error_count}건 실패")
-    return inserted_count
+    report = bulk_load_giup(conn, df, yearmonth, batch_size=batch_size)
+    return report.inserted
 
 
 def get_statistics(conn, yearmonth):
@@ -281,7 +239,7 @@ def show_upload_page():
                     <form method="POST" action="">
                         <button type="submit" class="btn btn-primary btn-upload btn-lg w-100">데이터 업로드 시작</button>
                     </form>
-                    <p class="text-warning mt-3">⚠️ Cloudtype에 배포 후 사용하세요 (로컬 환경에서는 타임아웃 발생 가능)</p>
+                    <p class="text-muted mt-3">COPY 일괄 적재로 한 달 분량을 수 초 내에 업로드합니다.</p>
                 </div>
             </div>
         </div>
@@ -307,41 +265,43 @@ def execute_and_show_result():
         if not excel_file.exists():
             message = f'Excel 파일을 찾을 수 없습니다: {excel_file}'
         else:
-            # PostgreSQL 연결
+            # PostgreSQL 연결 (풀에서 빌려 쓰고 자동 반납)
             logs.append("PostgreSQL 연결 중...")
-            conn = get_postgres_connection()
-            logs.append("PostgreSQL 연결 성공")
-
-            # 테이블 생성
-            logs.append("테이블 생성 중...")
-            create_table(conn)
-            logs.append("테이블 생성 완료")
-
-            # Excel 데이터 로드
-            logs.append("Excel 파일 로드 중...")
-            df, yearmonth = load_excel_data(excel_file)
-            logs.append(f"Excel 파일 로드 완료: {len(df)}건")
-
-            # 기존 데이터 삭제
-            logs.append("기존 데이터 확인 중...")
-            deleted_count = delete_existing_data(conn, yearmonth)
-            if deleted_count > 0:
-                logs.append(f"기존 데이터 삭제: {deleted_count}건")
-
-            # 데이터 삽입
-            logs.append("데이터 삽입 중...")
-            inserted_count = insert_data(conn, df, yearmonth)
-            logs.append(f"데이터 삽입 완료: {inserted_count}건")
-
-            # 통계 조회
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT COUNT(*) as total FROM giup_statistics WHERE 기준년월 = %s",
-                (yearmonth,)
-            )
-            total_count = cursor.fetchone()['total']
-            cursor.close()
-            conn.close()
+            with postgres_connection() as conn:
+                logs.append("PostgreSQL 연결 성공")
+
+                # 테이블 생성
+                logs.append("테이블 생성 중...")
+                create_table(conn)
+                logs.append("테이블 생성 완료")
+
+                # Excel 데이터 로드
+                logs.append("Excel 파일 로드 중...")
+                df, yearmonth = load_excel_data(excel_file)
+                logs.append(f"Excel 파일 로드 완료: {len(df)}건")
+
+                # 기존 데이터 삭제
+                logs.append("기존 데이터 확인 중...")
+                deleted_count = delete_existing_data(conn, yearmonth)
+                if deleted_count > 0:
+                    logs.append(f"기존 데이터 삭제: {deleted_count}건")
+
+                # 데이터 삽입 (COPY 일괄 적재)
+                logs.append("데이터 삽입 중...")
+                report = bulk_load_giup(conn, df, yearmonth)
+                inserted_count = report.inserted
+                logs.append(f"데이터 삽입 완료: {report.summary()}")
+                for error in report.errors[:20]:
+                    logs.append(f"Row {error.row} 적재 실패: {error.column or ''} {error.message}")
+
+                # 통계 조회
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT COUNT(*) as total FROM giup_statistics WHERE 기준년월 = %s",
+                    (yearmonth,)
+                )
+                total_count = cursor.fetchone()['total']
+                cursor.close()
 
             success = True
             message = "데이터 업로드 완료"
@@ -0,0 +1,221 @@
+"""
+분석 작업 대기열 모듈
+CSV 분석을 요청 처리와 분리하여 크기가 제한된 스레드 풀에서 실행하고,
+진행 상황(단계, 처리한 행 수)과 결과를 JSON 파일로 남겨 어느 웹 워커에서나 조회할 수 있게 하는 기능을 제공
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+# 진행 상황 파일을 다시 쓰는 최소 간격 (초)
+PROGRESS_INTERVAL = 0.5
+
+# 끝난 작업 파일 보관 기간 (초)
+JOB_RETENTION = 24 * 60 * 60
+
+
+class QueueFullError(RuntimeError):
+    """분석 대기열이 가득 차 작업을 받을 수 없는 경우"""
+
+
+def _pid_alive(pid: int) -> bool:
+    """프로세스가 살아 있는지 확인"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AnalysisJobQueue:
+    """크기가 제한된 분석 작업 대기열 클래스"""
+
+    def __init__(self, jobs_dir: Path, max_workers: Optional[int] = None, max_queued: Optional[int] = None):
+        """
+        분석 작업 대기열 초기화
+
+        Args:
+            jobs_dir (Path): 작업 상태/결과 JSON 파일을 저장할 디렉토리
+            max_workers (int): 동시에 실행할 분석 수 (None이면 CSV_ANALYSIS_WORKERS 환경변수, 기본 2)
+            max_queued (int): 실행을 기다릴 수 있는 작업 수 (None이면 CSV_ANALYSIS_QUEUE 환경변수, 기본 8)
+        """
+        self.jobs_dir = Path(jobs_dir)
+        self.max_workers = max_workers or int(os.getenv('CSV_ANALYSIS_WORKERS', 2))
+        self.max_queued = max_queued if max_queued is not None else int(os.getenv('CSV_ANALYSIS_QUEUE', 8))
+        self._executor = None
+        self._pid = None
+        self._slots = None
+        self._active: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """현재 프로세스용 스레드 풀 반환 (fork된 워커에서는 새로 생성)"""
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='csv-analysis')
+            self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queued)
+            self._active = {}
+            self._pid = os.getpid()
+        return self._executor
+
+    def _status_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f'{job_id}.json'
+
+    def _result_path(self, job_id: str) -> Path:
+        return self.jobs_dir / f'{job_id}.result.json'
+
+    def _write(self, path: Path, data: Any):
+        """JSON 파일을 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+        temp_path = path.with_name(f'.{path.name}.{threading.get_ident()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def submit(self, key: str, task: Callable[[Callable[[str, int], None]], Any], **meta) -> str:
+        """
+        분석 작업 등록
+
+        같은 key의 작업이 이미 대기/실행 중이면 새로 만들지 않고 그 작업 ID를 돌려준다.
+
+        Args:
+            key (str): 작업 식별 키 (파일 내용 해시 등)
+            task (callable): task(progress)를 호출하면 JSON으로 저장할 결과를 반환하는 함수
+            **meta: 상태 파일에 함께 기록할 정보 (파일명 등)
+
+        Returns:
+            str: 작업 ID
+
+        Raises:
+            QueueFullError: 실행 중인 작업과 대기 중인 작업이 한도에 도달한 경우
+        """
+        with self._lock:
+            executor = self._get_executor()
+            if key in self._active:
+                return self._active[key]
+            if not self._slots.acquire(blocking=False):
+                raise QueueFullError(f"분석 대기열이 가득 찼습니다 (실행 {self.max_workers}개 + 대기 {self.max_queued}개).")
+
+            self.jobs_dir.mkdir(parents=True, exist_ok=True)
+            self._cleanup()
+            job_id = uuid.uuid4().hex
+            status = {
+                'id': job_id,
+                'state': 'queued',
+                'stage': 'queued',
+                'rows_processed': 0,
+                'created_at': time.time(),
+                'started_at': None,
+                'finished_at': None,
+                'error': None,
+                'pid': os.getpid(),
+                **meta
+            }
+            self._write(self._status_path(job_id), status)
+            self._active[key] = job_id
+
+        try:
+            executor.submit(self._run, job_id, key, task, status)
+        except RuntimeError:
+            with self._lock:
+                self._active.pop(key, None)
+            self._slots.release()
+            raise
+        return job_id
+
+    def _run(self, job_id: str, key: str, task, status: Dict[str, Any]):
+        """작업 실행 (스레드 풀에서 호출)"""
+        last_write = 0.0
+
+        def progress(stage: str, rows: int):
+            nonlocal last_write
+            now = time.time()
+            # 단계가 바뀌면 바로, 같은 단계의 행 수는 PROGRESS_INTERVAL마다 기록
+            if stage != status['stage'] or now - last_write >= PROGRESS_INTERVAL:
+                status.update(stage=stage, rows_processed=rows)
+                self._write(self._status_path(job_id), status)
+                last_write = now
+
+        try:
+            status.update(state='running', stage='started', started_at=time.time())
+            self._write(self._status_path(job_id), status)
+            result = task(progress)
+            self._write(self._result_path(job_id), result)
+            status.update(state='done', stage='done')
+        except Exception as e:
+            status.update(state='failed', error=str(e))
+            print(f"분석 작업 실패 ({job_id}): {e}")
+        finally:
+            status['finished_at'] = time.time()
+            self._write(self._status_path(job_id), status)
+            with self._lock:
+                self._active.pop(key, None)
+            self._slots.release()
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 조회 (작업을 맡은 프로세스가 종료되었으면 실패로 표시)
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            dict: 상태 정보 (state: queued/running/done/failed, stage, rows_processed 등) - 없는 작업이면 None
+        """
+        if not job_id.isalnum():
+            return None
+        try:
+            with open(self._status_path(job_id), 'r', encoding='utf-8') as f:
+                status = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if status['state'] in ('queued', 'running') and not _pid_alive(status['pid']):
+            status.update(state='failed', error='분석을 맡은 프로세스가 종료되었습니다. 다시 시도해 주세요.')
+        return status
+
+    def result(self, job_id: str) -> Optional[Any]:
+        """
+        완료된 작업의 결과 조회
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            작업 결과 (없으면 None)
+        """
+        if not job_id.isalnum():
+            return None
+        try:
+            with open(self._result_path(job_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _cleanup(self):
+        """보관 기간이 지난 작업 파일 삭제"""
+        cutoff = time.time() - JOB_RETENTION
+        for path in self.jobs_dir.glob('*.json'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
+
+    def stats(self) -> Dict[str, int]:
+        """
+        현재 프로세스의 대기열 통계
+
+        Returns:
+            dict: 실행/대기 중인 작업 수와 한도
+        """
+        with self._lock:
+            active = len(self._active) if self._pid == os.getpid() else 0
+        return {'active': active, 'max_workers': self.max_workers, 'max_queued': self.max_queued}
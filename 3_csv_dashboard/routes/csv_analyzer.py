@@ -4,18 +4,232 @@ import plotly.utils
 import json
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
+import io
+import html
 import os
 from datetime import datetime
-import re
+
+from module.encoding_sniffer import read_with_fallback
+from .spreadsheet_reader import is_excel_file, list_sheets, read_sheet
+
+
+class ColumnStore:
+    """분석 1회 동안 정리된 컬럼을 보관하는 클래스 (숫자 컬럼 변환은 컬럼당 한 번만 수행)"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._numeric: Dict[str, pd.Series] = {}
+        self._filled: Dict[str, pd.Series] = {}
+
+    @staticmethod
+    def clean_numeric(series: pd.Series) -> pd.Series:
+        """쉼표 제거, '*'는 1로 치환 후 숫자로 변환 (변환할 수 없는 값은 NaN)"""
+        if pd.api.types.is_integer_dtype(series) or pd.api.types.is_float_dtype(series):
+            return series
+        cleaned = series.astype(str).str.replace(',', '').str.replace('*', '1').str.strip()
+        return pd.to_numeric(cleaned, errors='coerce')
+
+    def numeric(self, col) -> pd.Series:
+        """숫자로 변환한 컬럼 (결측/변환 불가 값은 NaN)"""
+        if col not in self._numeric:
+            self._numeric[col] = self.clean_numeric(self.df[col])
+        return self._numeric[col]
+
+    def numeric_filled(self, col) -> pd.Series:
+        """숫자로 변환한 컬럼 (결측/변환 불가 값은 0)"""
+        if col not in self._filled:
+            self._filled[col] = self.numeric(col).fillna(0)
+        return self._filled[col]
+
+
+class ColumnTypeInference:
+    """행 표본으로 컬럼 타입을 판별하고, 표본으로 확신할 수 없는 컬럼만 전체를 검사하는 클래스"""
+
+    # 표본 크기, 신뢰구간 z값, 판별 기준 (숫자 변환 가능 비율, 고유값 비율)
+    SAMPLE_ROWS = 10_000
+    Z = 3.0
+    NUMERIC_THRESHOLD = 0.9
+    CATEGORICAL_THRESHOLD = 0.5
+
+    def __init__(self, store: ColumnStore, sample_rows: int = SAMPLE_ROWS, seed: int = 0):
+        self.store = store
+        self.rows = len(store.df)
+        self.exact = self.rows <= sample_rows
+        if self.exact:
+            self.sample_index = None
+        else:
+            # 행 위치를 균등 비복원 추출 (순서 유지)
+            rng = np.random.default_rng(seed)
+            self.sample_index = np.sort(rng.choice(self.rows, sample_rows, replace=False))
+        self.full_scans: List[str] = []
+
+    def sample(self, col) -> pd.Series:
+        """컬럼 표본 (행 수가 표본 크기 이하이면 전체)"""
+        series = self.store.df[col]
+        return series if self.exact else series.take(self.sample_index)
+
+    def _interval(self, successes: int, trials: int) -> Tuple[float, float]:
+        """비율의 Wilson 신뢰구간"""
+        if trials == 0:
+            return 0.0, 1.0
+        z2 = self.Z ** 2
+        p = successes / trials
+        center = (p + z2 / (2 * trials)) / (1 + z2 / trials)
+        margin = self.Z * np.sqrt(p * (1 - p) / trials + z2 / (4 * trials ** 2)) / (1 + z2 / trials)
+        return center - margin, center + margin
+
+    def is_numeric(self, col) -> bool:
+        """
+        90% 초과가 숫자로 변환되는 컬럼인지 판별
+
+        이미 숫자 타입이거나 행 수가 적으면 전체로 계산하고, 표본의 신뢰구간이 기준값을 포함할 때만 전체를 변환한다.
+        """
+        series = self.store.df[col]
+        if self.exact or pd.api.types.is_numeric_dtype(series):
+            numeric = self.store.numeric(col)
+            return (numeric.notna().sum() / len(numeric)) > self.NUMERIC_THRESHOLD
+
+        converted = ColumnStore.clean_numeric(self.sample(col))
+        low, high = self._interval(int(converted.notna().sum()), len(converted))
+        if low > self.NUMERIC_THRESHOLD:
+            return True
+        if high <= self.NUMERIC_THRESHOLD:
+            return False
+
+        self.full_scans.append(col)
+        numeric = self.store.numeric(col)
+        return (numeric.notna().sum() / len(numeric)) > self.NUMERIC_THRESHOLD
+
+    def is_categorical(self, col) -> bool:
+        """
+        고유값 비율이 50% 미만인 컬럼인지 판별
+
+        표본에서 한 번만 나온 값의 비율(Good-Turing)로 고유값 비율의 상한을, 표본 내 같은 값 쌍의 비율(Simpson 지수)로
+        하한을 추정하여 기준값과 확실히 떨어져 있으면 전체 고유값 계산을 생략한다.
+        """
+        if self.exact:
+            return len(self.store.df[col].unique()) / self.rows < self.CATEGORICAL_THRESHOLD
+
+        counts = self.sample(col).value_counts(dropna=False).to_numpy()
+        sample_rows = counts.sum()
+        singletons = int((counts == 1).sum())
+
+        # 상한: 표본에 나온 값 + 아직 못 본 값의 확률 질량만큼 모두 새로운 값이라고 가정
+        # (한 번만 나온 값의 수에도 표본 오차가 있으므로 하한과 같은 z값으로 여유를 둠)
+        upper = len(counts) / self.rows + (singletons + self.Z * np.sqrt(singletons)) / sample_rows
+        if upper < self.CATEGORICAL_THRESHOLD:
+            return True
+
+        # 하한: 고유값 수 >= 1 / Σp² (같은 값 쌍 수에 여유를 두어 보수적으로 추정)
+        # 표본의 서로 다른 행 쌍으로 구한 Simpson 지수는 Σc(c-1)/n²의 추정치이므로 자기 자신과의 쌍 1/n을 더함
+        pairs = float((counts * (counts - 1) / 2).sum())
+        pairs_upper = pairs + self.Z * np.sqrt(pairs) + self.Z ** 2
+        simpson_upper = pairs_upper / (sample_rows * (sample_rows - 1) / 2)
+        lower = min(1.0, 1.0 / (simpson_upper * self.rows + 1))
+        if lower >= self.CATEGORICAL_THRESHOLD:
+            return False
+
+        self.full_scans.append(col)
+        return len(self.store.df[col].unique()) / self.rows < self.CATEGORICAL_THRESHOLD
+
+    def stats(self) -> Dict[str, Any]:
+        """표본 크기와 전체 검사로 넘어간 컬럼 목록"""
+        return {
+            'sample_rows': self.rows if self.exact else len(self.sample_index),
+            'full_scan_columns': list(self.full_scans)
+        }
+
+
+class LineCountingFile(io.FileIO):
+    """읽은 줄 수를 세어 콜백으로 알려주는 파일 객체 (pandas가 읽는 동안 진행률 보고용)"""
+    
+    def __init__(self, path, on_lines: Callable[[int], None]):
+        super().__init__(path, 'rb')
+        self.lines = 0
+        self.on_lines = on_lines
+    
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        if data:
+            self.lines += data.count(b'\n')
+            self.on_lines(self.lines)
+        return data
+
+
+# 시계열 trace 하나에 보낼 최대 점 수 (넘으면 LTTB로 줄임)와 원본 해상도 구간 조회의 최대 점 수
+TIMESERIES_MAX_POINTS = int(os.getenv('CSV_TIMESERIES_MAX_POINTS', 1000))
+TIMESERIES_WINDOW_MAX_POINTS = int(os.getenv('CSV_TIMESERIES_WINDOW_MAX_POINTS', 20000))
+
+# 분석 결과/차트 형식 버전 (형식이 바뀌면 올려서 이전 버전으로 캐시된 결과를 쓰지 않게 함)
+# 3: file_info.sheet/sheets, 시계열 LTTB trace(column/points/downsampled)
+ANALYSIS_SCHEMA_VERSION = 3
+
+
+def lttb_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링으로 남길 점의 위치 선택
+
+    첫 점과 마지막 점은 유지하고, 나머지는 threshold - 2개 구간마다 이전에 고른 점과 다음 구간 평균점으로
+    만든 삼각형의 넓이가 가장 큰 점을 고른다. 전체 최솟값/최댓값 위치는 항상 포함한다.
+    시간 컬럼은 집계 시 정렬되므로 x 좌표는 순서 위치를 사용한다.
+
+    Args:
+        y (np.ndarray): 값 (시간 순서)
+        threshold (int): 남길 점 수 (3 미만이거나 점 수 이상이면 전체 유지)
+
+    Returns:
+        np.ndarray: 남길 점의 위치 (오름차순)
+    """
+    n = len(y)
+    if threshold < 3 or n <= threshold:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=float)
+    every = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        # 다음 구간 평균점 (마지막 구간이면 마지막 점)
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = (avg_start + avg_end - 1) / 2
+        avg_y = y[avg_start:avg_end].mean()
+
+        # 현재 구간에서 삼각형 넓이가 가장 큰 점
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        xs = np.arange(start, end)
+        area = np.abs((a - avg_x) * (y[start:end] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    selected[-1] = n - 1
+
+    return np.union1d(selected, [int(y.argmin()), int(y.argmax())])
 
 
 class CSVAnalyzer:
     """CSV 파일 자동 분석 및 차트 생성 클래스"""
     
-    def __init__(self, csv_path: str):
+    def __init__(self, csv_path: str, progress: Optional[Callable[[str, int], None]] = None,
+                 sheet: Optional[str] = None):
+        """
+        Args:
+            csv_path (str): CSV 또는 Excel 파일 경로
+            progress (callable): 진행 상황 콜백 progress(단계, 처리한 행 수) (None이면 보고하지 않음)
+            sheet (str): Excel 파일에서 분석할 시트 (None이면 첫 번째 시트)
+        """
         self.csv_path = Path(csv_path)
+        self.progress = progress
+        self.sheet = sheet
+        self.sheets = None
+        self.rows_processed = 0
+        self.max_points = TIMESERIES_MAX_POINTS
         self.df = None
+        self.encoding = None
+        self.store = None
+        self.inference = None
         self.analysis_results = {}
         self.detected_columns = {
             'time_columns': [],
@@ -27,39 +241,73 @@ class CSVAnalyzer:
     def load_and_analyze_csv(self) -> Dict[str, Any]:
         """CSV 파일 로드 및 기본 분석 수행"""
         try:
-            # CSV 파일 로드 (다양한 인코딩 시도)
-            encodings = ['utf-8', 'cp949', 'euc-kr', 'utf-8-sig']
-            for encoding in encodings:
-                try:
-                    self.df = pd.read_csv(self.csv_path, encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
+            self._report('loading')
+            if is_excel_file(self.csv_path):
+                # Excel 통합문서는 시트 하나를 스트리밍으로 읽어 CSV와 같은 파이프라인에 넘김
+                self.sheets = list_sheets(self.csv_path)
+                if self.sheet is None:
+                    self.sheet = self.sheets[0]
+                self.df = read_sheet(self.csv_path, self.sheet, progress=lambda rows: self._report('loading', rows))
+            else:
+                self._load_csv()
             
-            if self.df is None:
-                raise ValueError("파일 인코딩을 인식할 수 없습니다.")
+            # 정리된 컬럼 저장소 (분석/차트 생성에서 공유)와 표본 기반 타입 판별
+            self.store = ColumnStore(self.df)
+            self.inference = ColumnTypeInference(self.store)
             
             # 컬럼 타입 자동 감지
+            self._report('detecting', len(self.df))
             self._detect_column_types()
             
+            self._report('summarizing', len(self.df))
             # 기본 통계 정보
             self.analysis_results = {
                 'file_info': {
                     'filename': self.csv_path.name,
                     'rows': len(self.df),
                     'columns': len(self.df.columns),
+                    'encoding': self.encoding,
                     'upload_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 },
                 'columns': dict(self.detected_columns),
                 'sample_data': self.df.head(5).to_dict('records'),
-                'summary_stats': self._generate_summary_stats()
+                'summary_stats': self._generate_summary_stats(),
+                'type_inference': self.inference.stats()
             }
+            if self.sheets is not None:
+                self.analysis_results['file_info'].update(sheet=self.sheet, sheets=self.sheets)
             
             return self.analysis_results
             
         except Exception as e:
             return {'error': f"파일 분석 중 오류 발생: {str(e)}"}
     
+    def _load_csv(self):
+        """
+        CSV 파일 로드 (파일 앞부분 바이트로 인코딩을 판별하여 한 번만 읽음)
+
+        판별이 틀려 디코딩 오류가 나면 FALLBACK_ENCODINGS 순서로 다시 읽는다.
+        """
+        def read(encoding):
+            if self.progress is None:
+                return pd.read_csv(self.csv_path, encoding=encoding)
+            # 헤더 줄을 빼고 읽은 줄 수를 처리한 행 수로 보고
+            with LineCountingFile(self.csv_path, lambda lines: self._report('loading', max(lines - 1, 0))) as f:
+                return pd.read_csv(f, encoding=encoding)
+        
+        try:
+            self.df, self.encoding = read_with_fallback(self.csv_path, read)
+        except UnicodeDecodeError:
+            self.df = None
+            raise ValueError("파일 인코딩을 인식할 수 없습니다.")
+    
+    def _report(self, stage: str, rows: Optional[int] = None):
+        """진행 상황 콜백 호출"""
+        if rows is not None:
+            self.rows_processed = rows
+        if self.progress is not None:
+            self.progress(stage, self.rows_processed)
+    
     def _detect_column_types(self):
         """컬럼 타입 자동 감지"""
         # 시간/날짜 컬럼 패턴
@@ -87,18 +335,22 @@ class CSVAnalyzer:
                 self.detected_columns['location_columns'].append(col)
             
             # 숫자 컬럼 감지 (숫자로 변환 가능한 컬럼)
-            elif self._is_numeric_column(self.df[col]):
+            elif self._is_numeric_column(col):
                 self.detected_columns['numeric_columns'].append(col)
             
-            # 범주형 컬럼
-            else:
-                unique_ratio = len(self.df[col].unique()) / len(self.df)
-                if unique_ratio < 0.5:  # 고유값 비율이 50% 미만인 경우 범주형으로 간주
-                    self.detected_columns['categorical_columns'].append(col)
+            # 범주형 컬럼 (고유값 비율이 50% 미만인 경우 범주형으로 간주)
+            elif self.inference.is_categorical(col):
+                self.detected_columns['categorical_columns'].append(col)
     
     def _is_time_column(self, series: pd.Series) -> bool:
         """시계열 컬럼인지 판단"""
-        sample = series.dropna().astype(str).head(10)
+        # 앞쪽 값 10개만 검사 (결측값이 많으면 더 넓게 찾음)
+        sample = series.head(1000).dropna()
+        if len(sample) < 10:
+            sample = series.dropna()
+        sample = sample.head(10).astype(str)
+        if len(sample) == 0:
+            return False
         time_patterns = [
             r'\d{4}',  # 년도
             r'\d{4}\d{2}',  # 년월
@@ -107,19 +359,16 @@ class CSVAnalyzer:
         ]
         
         for pattern in time_patterns:
-            matches = sum(1 for val in sample if re.match(pattern, str(val)))
+            matches = sample.str.match(pattern).sum()
             if matches / len(sample) > 0.8:  # 80% 이상 매칭되면 시간 컬럼으로 간주
                 return True
         return False
     
-    def _is_numeric_column(self, series: pd.Series) -> bool:
+    def _is_numeric_column(self, col) -> bool:
         """숫자 컬럼인지 판단"""
         try:
-            # 문자열을 숫자로 변환 시도 (쉼표, 특수문자 제거)
-            cleaned = series.astype(str).str.replace(',', '').str.replace('*', '1').str.strip()
-            numeric_converted = pd.to_numeric(cleaned, errors='coerce')
-            # 90% 이상이 숫자로 변환 가능하면 숫자 컬럼으로 간주
-            return (numeric_converted.notna().sum() / len(series)) > 0.9
+            # 쉼표, 특수문자 제거 후 90% 이상이 숫자로 변환 가능하면 숫자 컬럼으로 간주 (표본으로 먼저 판별)
+            return self.inference.is_numeric(col)
         except:
             return False
     
@@ -129,9 +378,8 @@ class CSVAnalyzer:
         
         for col in self.detected_columns['numeric_columns']:
             try:
-                # 숫자 컬럼 정리
-                cleaned = self.df[col].astype(str).str.replace(',', '').str.replace('*', '1').str.strip()
-                numeric_data = pd.to_numeric(cleaned, errors='coerce').fillna(0)
+                # 정리된 숫자 컬럼
+                numeric_data = self.store.numeric_filled(col)
                 
                 stats[col] = {
                     'sum': int(numeric_data.sum()),
@@ -152,6 +400,8 @@ class CSVAnalyzer:
         if not self.detected_columns['numeric_columns']:
             return {'error': '차트 생성을 위한 숫자 데이터를 찾을 수 없습니다.'}
         
+        self._report('charts')
+        
         # 시계열 차트 생성
         if self.detected_columns['time_columns']:
             charts['timeseries'] = self._create_timeseries_charts()
@@ -165,60 +415,73 @@ class CSVAnalyzer:
         
         return charts
     
+    def timeseries_series(self, numeric_col) -> List[Tuple[str, pd.Series, pd.Series]]:
+        """
+        시간별 합계 원본 시계열 (지역 컬럼이 있으면 합계 상위 5개 지역별)
+
+        Args:
+            numeric_col: 숫자 컬럼
+
+        Returns:
+            List[Tuple[str, pd.Series, pd.Series]]: [(trace 이름, 시간 값, 합계)] (시간 순서)
+        """
+        time_col = self.detected_columns['time_columns'][0]  # 첫 번째 시간 컬럼 사용
+        
+        # 정리된 숫자 컬럼 (원본 DataFrame은 복사하지 않음)
+        values = self.store.numeric_filled(numeric_col)
+        
+        # 그룹별 집계
+        if self.detected_columns['location_columns']:
+            location_col = self.detected_columns['location_columns'][0]
+            grouped = values.groupby([self.df[time_col], self.df[location_col]]).sum().reset_index()
+            
+            # 상위 지역만 표시
+            top_locations = values.groupby(self.df[location_col]).sum().nlargest(5).index
+            
+            series = []
+            for location in top_locations:
+                location_data = grouped[grouped[location_col] == location]
+                if len(location_data) > 0:
+                    series.append((str(location), location_data[time_col], location_data[numeric_col]))
+            return series
+        
+        # 지역 컬럼이 없는 경우 전체 합계
+        grouped = values.groupby(self.df[time_col]).sum().reset_index()
+        return [(str(numeric_col), grouped[time_col], grouped[numeric_col])]
+    
+    @staticmethod
+    def _timeseries_trace(name: str, x: pd.Series, y: pd.Series, max_points: int, by_location: bool) -> Dict[str, Any]:
+        """시계열 trace 생성 (점이 max_points를 넘으면 LTTB로 줄임)"""
+        keep = lttb_indices(y.to_numpy(dtype=float), max_points)
+        return {
+            'x': x.iloc[keep].tolist(),
+            'y': y.iloc[keep].tolist(),
+            'type': 'scatter',
+            'mode': 'lines+markers',
+            'name': name,
+            'line': {'width': 2 if by_location else 3},
+            'marker': {'size': 8 if by_location else 10}
+        }
+    
     def _create_timeseries_charts(self) -> List[Dict[str, Any]]:
-        """시계열 차트 생성"""
+        """시계열 차트 생성 (trace마다 최대 self.max_points개 점으로 다운샘플링)"""
         charts = []
         
         time_col = self.detected_columns['time_columns'][0]  # 첫 번째 시간 컬럼 사용
         
         for numeric_col in self.detected_columns['numeric_columns'][:3]:  # 상위 3개만
             try:
-                # 데이터 정리
-                df_copy = self.df.copy()
-                df_copy[numeric_col] = pd.to_numeric(
-                    df_copy[numeric_col].astype(str).str.replace(',', '').str.replace('*', '1'),
-                    errors='coerce'
-                ).fillna(0)
-                
-                # 시간 컬럼 정리
-                time_data = df_copy[time_col].astype(str)
-                
-                # 그룹별 집계
-                if self.detected_columns['location_columns']:
-                    location_col = self.detected_columns['location_columns'][0]
-                    grouped = df_copy.groupby([time_col, location_col])[numeric_col].sum().reset_index()
-                    
-                    # 상위 지역만 표시
-                    top_locations = df_copy.groupby(location_col)[numeric_col].sum().nlargest(5).index
-                    
-                    traces = []
-                    for location in top_locations:
-                        location_data = grouped[grouped[location_col] == location]
-                        if len(location_data) > 0:
-                            traces.append({
-                                'x': location_data[time_col].tolist(),
-                                'y': location_data[numeric_col].tolist(),
-                                'type': 'scatter',
-                                'mode': 'lines+markers',
-                                'name': str(location),
-                                'line': {'width': 2},
-                                'marker': {'size': 8}
-                            })
-                else:
-                    # 지역 컬럼이 없는 경우 전체 합계
-                    grouped = df_copy.groupby(time_col)[numeric_col].sum().reset_index()
-                    traces = [{
-                        'x': grouped[time_col].tolist(),
-                        'y': grouped[numeric_col].tolist(),
-                        'type': 'scatter',
-                        'mode': 'lines+markers',
-                        'name': numeric_col,
-                        'line': {'width': 3},
-                        'marker': {'size': 10}
-                    }]
+                series = self.timeseries_series(numeric_col)
+                by_location = bool(self.detected_columns['location_columns'])
+                traces = [self._timeseries_trace(name, x, y, self.max_points, by_location) for name, x, y in series]
+                total_points = sum(len(y) for _, _, y in series)
+                shown_points = sum(len(trace['y']) for trace in traces)
                 
                 charts.append({
                     'title': f'{numeric_col} 시계열 추이',
+                    'column': str(numeric_col),
+                    'points': {'shown': shown_points, 'total': total_points},
+                    'downsampled': shown_points < total_points,
                     'traces': traces,
                     'layout': {
                         'title': f'{numeric_col} 시계열 추이',
@@ -233,6 +496,66 @@ class CSVAnalyzer:
         
         return charts
     
+    @staticmethod
+    def _window_mask(x: pd.Series, start: Optional[str], end: Optional[str]) -> pd.Series:
+        """
+        시간 값 중 [start, end] 구간에 드는 위치 (숫자 → 날짜 → 문자열 순으로 비교 방식 결정)
+
+        Args:
+            x (pd.Series): 시간 값
+            start (str): 구간 시작 (None이면 처음부터)
+            end (str): 구간 끝 (None이면 끝까지)
+        """
+        mask = pd.Series(True, index=x.index)
+        bounds = [(value, op) for value, op in ((start, 'ge'), (end, 'le')) if value not in (None, '')]
+        if not bounds:
+            return mask
+        
+        numeric = pd.to_numeric(x, errors='coerce')
+        if numeric.notna().all():
+            keys, convert = numeric, float
+        else:
+            dates = pd.to_datetime(x.astype(str), errors='coerce')
+            if dates.notna().all():
+                keys, convert = dates, pd.Timestamp
+            else:
+                keys, convert = x.astype(str), str
+        
+        for value, op in bounds:
+            mask &= getattr(keys, op)(convert(value))
+        return mask
+    
+    @classmethod
+    def timeseries_window(cls, series: List[Tuple[str, pd.Series, pd.Series]], by_location: bool,
+                          start: Optional[str] = None, end: Optional[str] = None,
+                          max_points: int = TIMESERIES_WINDOW_MAX_POINTS) -> Dict[str, Any]:
+        """
+        확대한 시간 구간의 원본 해상도 시계열 (구간 안의 점이 max_points를 넘을 때만 줄임)
+
+        Args:
+            series (list): timeseries_series()로 만든 원본 시계열
+            by_location (bool): 지역별 trace인지 여부 (선/점 크기)
+            start (str): 구간 시작 시간 값
+            end (str): 구간 끝 시간 값
+            max_points (int): trace당 최대 점 수
+
+        Returns:
+            dict: traces, points(shown/total), downsampled
+        """
+        traces = []
+        total_points = 0
+        for name, x, y in series:
+            mask = cls._window_mask(x, start, end)
+            total_points += int(mask.sum())
+            traces.append(cls._timeseries_trace(name, x[mask], y[mask], max_points, by_location))
+        
+        shown_points = sum(len(trace['y']) for trace in traces)
+        return {
+            'traces': traces,
+            'points': {'shown': shown_points, 'total': total_points},
+            'downsampled': shown_points < total_points
+        }
+    
     def _create_regional_charts(self) -> List[Dict[str, Any]]:
         """지역별 차트 생성"""
         charts = []
@@ -244,15 +567,9 @@ class CSVAnalyzer:
         
         for numeric_col in self.detected_columns['numeric_columns'][:3]:
             try:
-                # 데이터 정리
-                df_copy = self.df.copy()
-                df_copy[numeric_col] = pd.to_numeric(
-                    df_copy[numeric_col].astype(str).str.replace(',', '').str.replace('*', '1'),
-                    errors='coerce'
-                ).fillna(0)
-                
-                # 지역별 집계
-                regional_data = df_copy.groupby(location_col)[numeric_col].sum().sort_values(ascending=False)
+                # 지역별 집계 (정리된 숫자 컬럼 사용)
+                values = self.store.numeric_filled(numeric_col)
+                regional_data = values.groupby(self.df[location_col]).sum().sort_values(ascending=False)
                 top_regions = regional_data.head(10)  # 상위 10개 지역
                 
                 # 막대 차트
@@ -285,22 +602,22 @@ class CSVAnalyzer:
         
         for numeric_col in self.detected_columns['numeric_columns'][:2]:  # 상위 2개만
             try:
-                # 데이터 정리
-                df_copy = self.df.copy()
-                numeric_data = pd.to_numeric(
-                    df_copy[numeric_col].astype(str).str.replace(',', '').str.replace('*', '1'),
-                    errors='coerce'
-                ).fillna(0)
+                # 정리된 숫자 컬럼을 서버에서 구간별로 집계 (구간 경계와 빈도만 전송)
+                numeric_data = self.store.numeric_filled(numeric_col)
+                counts, edges = self._histogram_bins(numeric_data.to_numpy(dtype=float))
                 
-                # 히스토그램
+                # 히스토그램 (막대 하나 = 구간 하나)
                 charts.append({
                     'title': f'{numeric_col} 분포',
                     'traces': [{
-                        'x': numeric_data.tolist(),
-                        'type': 'histogram',
+                        'x': ((edges[:-1] + edges[1:]) / 2).tolist(),
+                        'y': counts.tolist(),
+                        'width': np.diff(edges).tolist(),
+                        'customdata': np.column_stack([edges[:-1], edges[1:]]).tolist(),
+                        'hovertemplate': '%{customdata[0]:,.4~g} ~ %{customdata[1]:,.4~g}<br>빈도수: %{y:,}<extra></extra>',
+                        'type': 'bar',
                         'name': numeric_col,
-                        'marker': {'color': 'rgba(255, 127, 14, 0.7)'},
-                        'nbinsx': 20
+                        'marker': {'color': 'rgba(255, 127, 14, 0.7)'}
                     }],
                     'layout': {
                         'title': f'{numeric_col} 분포',
@@ -315,9 +632,56 @@ class CSVAnalyzer:
         
         return charts
     
-    def generate_dashboard_html(self, title: str = "CSV 데이터 대시보드") -> str:
-        """동적 대시보드 HTML 생성"""
-        charts = self.generate_charts()
+    @staticmethod
+    def _histogram_bins(values: np.ndarray, max_bins: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        히스토그램 구간 집계 (Freedman-Diaconis 규칙, 사분위 범위가 0이면 Sturges 규칙)
+
+        Args:
+            values (np.ndarray): 숫자 값 (무한대는 제외)
+            max_bins (int): 최대 구간 수 (이상치로 구간이 지나치게 많아지는 것 방지)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (구간별 빈도, 구간 경계)
+        """
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return np.histogram(values, bins=1)
+
+        low, high = values.min(), values.max()
+        q1, q3 = np.percentile(values, [25, 75])
+        iqr = q3 - q1
+        if iqr > 0 and high > low:
+            width = 2 * iqr / np.cbrt(len(values))
+            bins = int(np.ceil((high - low) / width))
+        else:
+            bins = int(np.ceil(np.log2(len(values)))) + 1
+        bins = max(1, min(bins, max_bins))
+        return np.histogram(values, bins=bins, range=(low, high))
+    
+    def generate_dashboard_html(self, title: str = "CSV 데이터 대시보드", charts: Optional[Dict[str, Any]] = None,
+                                sheet_links: Optional[List[Tuple[str, str]]] = None,
+                                timeseries_url: Optional[str] = None) -> str:
+        """
+        동적 대시보드 HTML 생성 (charts가 없으면 새로 생성, 캐시된 차트가 있으면 그대로 사용)
+        
+        Args:
+            title (str): 대시보드 제목
+            charts (dict): 차트 데이터
+            sheet_links (list): Excel 시트 이동 링크 [(시트 이름, URL)] (시트가 여러 개일 때 표시)
+            timeseries_url (str): 시계열 원본 해상도 구간 조회 URL (있으면 다운샘플링된 차트에 원본 해상도 스위치 표시)
+        """
+        if charts is None:
+            charts = self.generate_charts()
+        
+        current_sheet = self.analysis_results['file_info'].get('sheet')
+        sheet_nav = ''
+        if sheet_links and len(sheet_links) > 1:
+            sheet_nav = '<ul class="nav nav-pills mb-4">'
+            for name, url in sheet_links:
+                active = ' active' if name == current_sheet else ''
+                sheet_nav += f'<li class="nav-item"><a class="nav-link{active}" href="{html.escape(url)}">{html.escape(name)}</a></li>'
+            sheet_nav += '</ul>'
         
         html_template = f'''
 <!DOCTYPE html>
@@ -356,6 +720,7 @@ class CSVAnalyzer:
 <body>
     <div class="container-fluid py-4">
         <h1 class="text-center mb-4">{title}</h1>
+        {sheet_nav}
         
         <!-- 파일 정보 -->
         <div class="dashboard-card">
@@ -390,10 +755,21 @@ class CSVAnalyzer:
         # 시계열 차트
         if 'timeseries' in charts and charts['timeseries']:
             for chart in charts['timeseries']:
+                resolution_toggle = ''
+                if chart.get('downsampled') and timeseries_url:
+                    points = chart['points']
+                    resolution_toggle = f'''
+                    <div class="d-flex justify-content-between align-items-center mb-2">
+                        <small class="text-muted" id="points_{chart_id}">{points['shown']:,} / {points['total']:,} 점</small>
+                        <div class="form-check form-switch mb-0">
+                            <input class="form-check-input" type="checkbox" id="full_{chart_id}">
+                            <label class="form-check-label" for="full_{chart_id}">원본 해상도 (확대 구간)</label>
+                        </div>
+                    </div>'''
                 html_template += f'''
             <div class="col-lg-6">
                 <div class="dashboard-card">
-                    <h4>{chart['title']}</h4>
+                    <h4>{chart['title']}</h4>{resolution_toggle}
                     <div id="chart_{chart_id}" class="chart-container"></div>
                 </div>
             </div>
@@ -465,8 +841,9 @@ class CSVAnalyzer:
     
     <script>
         const chartsData = {json.dumps(charts, ensure_ascii=False)};
+        const timeseriesUrl = {json.dumps(timeseries_url)};
         
-        $(document).ready(function() {{
+        document.addEventListener('DOMContentLoaded', function() {{
             renderCharts();
         }});
         
@@ -477,6 +854,9 @@ class CSVAnalyzer:
             if (chartsData.timeseries) {{
                 chartsData.timeseries.forEach(chart => {{
                     Plotly.newPlot(`chart_${{chartId}}`, chart.traces, chart.layout, {{responsive: true}});
+                    if (chart.downsampled && timeseriesUrl) {{
+                        bindResolutionToggle(chartId, chart);
+                    }}
                     chartId++;
                 }});
             }}
@@ -497,6 +877,96 @@ class CSVAnalyzer:
                 }});
             }}
         }}
+        
+        // 원본 해상도 스위치: 켜면 현재 보이는 시간 구간의 원본 점을 서버에서 받아오고, 확대할 때마다 다시 받아옴
+        function bindResolutionToggle(chartId, chart) {{
+            const el = document.getElementById(`chart_${{chartId}}`);
+            const toggle = document.getElementById(`full_${{chartId}}`);
+            const info = document.getElementById(`points_${{chartId}}`);
+            let loading = false;
+            
+            function showPoints(points) {{
+                info.textContent = `${{points.shown.toLocaleString()}} / ${{points.total.toLocaleString()}} 점`;
+            }}
+            
+            function load() {{
+                if (!toggle.checked) {{
+                    Plotly.react(el, chart.traces, Object.assign({{}}, el.layout));
+                    showPoints(chart.points);
+                    return;
+                }}
+                
+                const url = new URL(timeseriesUrl, window.location.origin);
+                url.searchParams.set('column', chart.column);
+                const axis = el._fullLayout.xaxis;
+                if (!axis.autorange) {{
+                    let [start, end] = axis.range;
+                    if (axis.type === 'category') {{
+                        const categories = axis._categories;
+                        start = categories[Math.max(0, Math.floor(start))];
+                        end = categories[Math.min(categories.length - 1, Math.ceil(end))];
+                    }}
+                    url.searchParams.set('start', start);
+                    url.searchParams.set('end', end);
+                }}
+                
+                loading = true;
+                fetchWindow(url, 1)
+                    .then(data => {{
+                        if (data.error) {{
+                            throw new Error(data.error);
+                        }}
+                        return Plotly.react(el, data.traces, Object.assign({{}}, el.layout)).then(() => showPoints(data.points));
+                    }})
+                    .catch(error => {{
+                        toggle.checked = false;
+                        alert(`원본 해상도 데이터를 불러오지 못했습니다: ${{error.message}}`);
+                    }})
+                    .finally(() => {{ loading = false; }});
+            }}
+            
+            // 원본 시계열이 아직 없으면(202) 분석 작업이 끝날 때까지 기다린 뒤 한 번 더 요청
+            function fetchWindow(url, retries) {{
+                return fetch(url).then(response => response.json().then(data => {{
+                    if (response.status !== 202) {{
+                        return data;
+                    }}
+                    if (retries === 0) {{
+                        throw new Error('원본 데이터를 아직 준비하지 못했습니다.');
+                    }}
+                    info.textContent = '원본 데이터 준비 중...';
+                    return waitForJob(data.status_url).then(() => fetchWindow(url, retries - 1));
+                }}));
+            }}
+            
+            function waitForJob(statusUrl) {{
+                return new Promise((resolve, reject) => {{
+                    function poll() {{
+                        fetch(statusUrl)
+                            .then(response => response.json())
+                            .then(job => {{
+                                if (job.state === 'done') {{
+                                    resolve();
+                                }} else if (job.state === 'failed' || job.error) {{
+                                    reject(new Error(job.error || '분석 작업이 실패했습니다.'));
+                                }} else {{
+                                    setTimeout(poll, 1000);
+                                }}
+                            }})
+                            .catch(reject);
+                    }}
+                    poll();
+                }});
+            }}
+            
+            toggle.addEventListener('change', load);
+            el.on('plotly_relayout', event => {{
+                const zoomed = 'xaxis.range[0]' in event || 'xaxis.range' in event || 'xaxis.autorange' in event;
+                if (toggle.checked && !loading && zoomed) {{
+                    load();
+                }}
+            }});
+        }}
     </script>
 </body>
 </html>
@@ -1,10 +1,20 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, Response
 from werkzeug.utils import secure_filename
 from pathlib import Path
 import os
 import json
 from datetime import datetime
-from .csv_analyzer import CSVAnalyzer
+from collections import OrderedDict
+import threading
+from .csv_analyzer import CSVAnalyzer, ANALYSIS_SCHEMA_VERSION, TIMESERIES_MAX_POINTS
+from .upload_store import UploadIndex, store_upload
+from .analysis_jobs import AnalysisJobQueue, QueueFullError
+from .spreadsheet_reader import is_excel_file, list_sheets
+from .row_index import RowIndexStore
+from .query_engine import QueryEngine, QueryError, SnapshotPendingError
+from .timeseries_store import TimeseriesStore
+from module.analysis_cache import analysis_cache, sanitize_json
+import hashlib
 
 # Blueprint 생성
 dashboard_bp = Blueprint('dashboard', __name__, 
@@ -14,18 +24,235 @@ dashboard_bp = Blueprint('dashboard', __name__,
 UPLOAD_FOLDER = Path(__file__).parent.parent / 'data'
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
 
+# 내용 해시 → 업로드 파일명 색인 (중복 업로드 판별용)
+upload_index = UploadIndex(UPLOAD_FOLDER / '.cache' / 'upload_index.json')
+
+# 백그라운드 분석 작업 대기열 (요청 처리 시간 제한을 넘는 큰 파일 분석용)
+analysis_jobs = AnalysisJobQueue(UPLOAD_FOLDER / '.cache' / 'jobs')
+
+# CSV 행 위치 색인 (행 페이지 조회용)
+row_indexes = RowIndexStore(UPLOAD_FOLDER / '.cache' / 'rows')
+
+# 행 페이지 조회 기본/최대 행 수
+ROWS_PAGE_LIMIT = 100
+ROWS_MAX_LIMIT = 1000
+
+# 업로드 파일을 테이블로 질의하는 내장 SQL 엔진 (컬럼형 스냅샷 사용)
+query_engine = QueryEngine(UPLOAD_FOLDER, UPLOAD_FOLDER / '.cache' / 'parquet')
+
+# SQL 질의 JSON 응답 기본 행 수 (최대 행 수는 CSV_QUERY_MAX_ROWS 환경변수)
+QUERY_PAGE_LIMIT = 1000
+
+# 분석 작업에서 저장한 원본 해상도 시계열 (확대 구간 조회 시 파일을 다시 파싱하지 않음)
+timeseries_store = TimeseriesStore(UPLOAD_FOLDER / '.cache' / 'timeseries')
+
+# 원본 해상도 구간 조회용 시계열 (캐시 키, 컬럼) → (원본 시계열, 지역별 여부), 최근 사용 순으로 보관
+TIMESERIES_CACHE_SIZE = 8
+_timeseries_cache = OrderedDict()
+_timeseries_lock = threading.Lock()
+
 def allowed_file(filename):
     """허용된 파일 확장자 확인"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def resolve_sheet(file_path, sheet):
+    """
+    요청한 Excel 시트 확인 (첫 번째 시트는 None으로 바꿔 시트 지정 없는 요청과 같은 캐시를 사용)
+
+    Args:
+        file_path (Path): 파일 경로
+        sheet (str): 요청한 시트 이름
+
+    Returns:
+        str: 분석할 시트 이름 (첫 번째 시트이거나 CSV이면 None)
+
+    Raises:
+        ValueError: 통합문서에 없는 시트인 경우
+    """
+    if not sheet or not is_excel_file(file_path):
+        return None
+    sheets = list_sheets(file_path)
+    if sheet not in sheets:
+        raise ValueError(f"'{sheet}' 시트를 찾을 수 없습니다.")
+    return None if sheet == sheets[0] else sheet
+
+def analysis_key(file_path, sheet=None):
+    """
+    분석 캐시/작업 키 (파일 내용 해시, 시트 이름, 분석 결과 형식 버전을 함께 해시)
+
+    분석기 코드가 바뀌어 결과 형식 버전이나 시계열 점 수 한도가 달라지면 키도 달라지므로
+    이전 형식으로 캐시된 결과는 미스로 처리된다.
+
+    Args:
+        file_path (Path): 파일 경로
+        sheet (str): resolve_sheet()로 확인한 시트 이름
+
+    Returns:
+        str: 64자리 16진수 키
+    """
+    file_hash = analysis_cache.file_hash(file_path)
+    version = f'v{ANALYSIS_SCHEMA_VERSION}/{TIMESERIES_MAX_POINTS}'
+    return hashlib.sha256(f'{file_hash}\0{sheet or ""}\0{version}'.encode('utf-8')).hexdigest()
+
+def with_file_info(file_path, analysis_results):
+    """
+    캐시된 결과의 파일명/업로드 시각을 요청한 파일 기준으로 교체
+    (같은 내용의 파일은 결과를 공유하므로 처음 분석한 파일의 값이 들어 있을 수 있음)
+
+    Args:
+        file_path (Path): 요청한 파일 경로
+        analysis_results (dict): 분석 결과
+
+    Returns:
+        dict: file_info가 교체된 분석 결과
+    """
+    analysis_results['file_info'].update(
+        filename=file_path.name,
+        upload_time=datetime.fromtimestamp(file_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+    )
+    return analysis_results
+
+def save_timeseries(analyzer, cache_key):
+    """
+    시계열 차트를 그리는 숫자 컬럼(상위 3개)의 원본 해상도 시계열 저장 (시간 컬럼이 없으면 빈 파일)
+
+    Args:
+        analyzer (CSVAnalyzer): 분석을 마친 분석기
+        cache_key (str): 분석 키
+    """
+    series_by_column = {}
+    if analyzer.detected_columns['time_columns']:
+        for column in analyzer.detected_columns['numeric_columns'][:3]:
+            series_by_column[column] = analyzer.timeseries_series(column)
+    timeseries_store.save(cache_key, series_by_column, bool(analyzer.detected_columns['location_columns']))
+
+def run_analysis(file_path, cache_key, progress=None, sheet=None):
+    """
+    분석을 실행하고 성공하면 결과와 차트를 캐시에, 원본 해상도 시계열을 시계열 저장소에 저장
+
+    Args:
+        file_path (Path): 분석할 파일 경로
+        cache_key (str): 캐시 키 (analysis_key())
+        progress (callable): 진행 상황 콜백 progress(단계, 처리한 행 수)
+        sheet (str): Excel 시트 이름 (None이면 첫 번째 시트)
+
+    Returns:
+        tuple: (CSVAnalyzer, 차트 데이터 - 분석 오류 시 None)
+    """
+    analyzer = CSVAnalyzer(str(file_path), progress, sheet)
+    analysis_results = analyzer.load_and_analyze_csv()
+    if 'error' in analysis_results:
+        return analyzer, None
+
+    charts = analyzer.generate_charts()
+    analysis_cache.put(cache_key, file_path.name, analysis_results, charts)
+    try:
+        save_timeseries(analyzer, cache_key)
+    except Exception as e:
+        print(f"원본 시계열 저장 실패 ({file_path.name}): {e}")
+    return analyzer, charts
+
+def render_dashboard(filename, analysis_results, charts):
+    """분석 결과와 차트로 대시보드 HTML 생성 (Excel이면 시트 이동 링크 포함)"""
+    analyzer = CSVAnalyzer(str(UPLOAD_FOLDER / filename))
+    analyzer.analysis_results = with_file_info(UPLOAD_FOLDER / filename, analysis_results)
+    sheet = analysis_results['file_info'].get('sheet')
+    sheet_links = [(name, url_for('dashboard.analyze', filename=filename, sheet=name))
+                   for name in analysis_results['file_info'].get('sheets') or []]
+    timeseries_url = url_for('dashboard.api_timeseries', filename=filename, sheet=sheet)
+    return analyzer.generate_dashboard_html(f'{filename} 분석 대시보드', charts, sheet_links, timeseries_url)
+
+def load_timeseries(cache_key, column):
+    """
+    원본 해상도 시계열 조회 (같은 파일/컬럼은 최근 TIMESERIES_CACHE_SIZE개까지 메모리에 보관)
+
+    Args:
+        cache_key (str): 분석 키
+        column (str): 숫자 컬럼
+
+    Returns:
+        tuple: (원본 시계열 목록, 지역별 여부) - 분석 작업이 아직 시계열을 만들지 않았으면 None
+
+    Raises:
+        ValueError: 해당 컬럼의 시계열이 없는 경우
+    """
+    key = (cache_key, column)
+    with _timeseries_lock:
+        if key in _timeseries_cache:
+            _timeseries_cache.move_to_end(key)
+            return _timeseries_cache[key]
+    
+    entry = timeseries_store.load(cache_key, column)
+    if entry is None:
+        return None
+    
+    with _timeseries_lock:
+        _timeseries_cache[key] = entry
+        while len(_timeseries_cache) > TIMESERIES_CACHE_SIZE:
+            _timeseries_cache.popitem(last=False)
+    return entry
+
+def submit_analysis_job(file_path, cache_key, sheet=None):
+    """
+    분석을 백그라운드 작업으로 등록
+
+    Args:
+        file_path (Path): 분석할 파일 경로
+        cache_key (str): 캐시 키 (같은 키의 작업은 하나만 실행)
+        sheet (str): Excel 시트 이름
+
+    Returns:
+        str: 작업 ID
+
+    Raises:
+        QueueFullError: 분석 대기열이 가득 찬 경우
+    """
+    def task(progress):
+        analyzer, charts = run_analysis(file_path, cache_key, progress, sheet)
+        if 'error' in analyzer.analysis_results:
+            raise ValueError(analyzer.analysis_results['error'])
+        return sanitize_json({'analysis': analyzer.analysis_results, 'charts': charts})
+
+    return analysis_jobs.submit(cache_key, task, filename=file_path.name, sheet=sheet, cache_key=cache_key)
+
+def submit_snapshot_job(tables):
+    """
+    SQL 질의용 스냅샷 생성을 백그라운드 작업으로 등록 (같은 테이블 묶음의 작업은 하나만 실행)
+
+    Args:
+        tables (dict): 테이블 이름 → query_engine.tables()의 항목
+
+    Returns:
+        str: 작업 ID
+
+    Raises:
+        QueueFullError: 분석 대기열이 가득 찬 경우
+    """
+    def task(progress):
+        query_engine.build_snapshots(tables, progress)
+        return {'tables': list(tables)}
+
+    key = 'snapshot\0' + '\0'.join(f"{info['filename']}\0{info['sheet_index']}" for info in tables.values())
+    filenames = sorted({info['filename'] for info in tables.values()})
+    return analysis_jobs.submit(key, task, kind='snapshot', filename=', '.join(filenames), tables=list(tables))
+
+def job_accepted(job_id):
+    """API: 백그라운드 작업을 등록했다는 202 응답 (status_url로 진행 상황을 확인한 뒤 같은 요청을 다시 보냄)"""
+    return jsonify({
+        'job_id': job_id,
+        'status_url': url_for('dashboard.api_job_status', job_id=job_id)
+    }), 202
+
 @dashboard_bp.route('/')
 def index():
     """메인 페이지 - CSV 업로드 폼"""
     # 기존 업로드된 파일 목록
     uploaded_files = []
     if UPLOAD_FOLDER.exists():
-        for file_path in UPLOAD_FOLDER.glob('*.csv'):
+        for file_path in sorted(UPLOAD_FOLDER.glob('*.*')):
+            if not allowed_file(file_path.name):
+                continue
             uploaded_files.append({
                 'name': file_path.name,
                 'size': f"{file_path.stat().st_size / 1024:.1f} KB",
@@ -51,17 +278,24 @@ def upload_file():
         # 파일명 안전하게 처리
         filename = secure_filename(file.filename)
         
-        # 업로드 폴더 생성
-        UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
+        # 청크 단위로 저장하며 해시 계산 (같은 내용의 파일이 있으면 기존 파일 사용)
+        stored = store_upload(file.stream, UPLOAD_FOLDER, filename, upload_index)
+        analysis_cache.remember_hash(stored.path, stored.file_hash)
         
-        # 파일 저장
-        file_path = UPLOAD_FOLDER / filename
-        file.save(str(file_path))
+        # 행 페이지 조회용 색인 생성 (실패해도 업로드는 유지, 조회할 때 다시 시도)
+        if not is_excel_file(stored.path):
+            try:
+                row_indexes.ensure(stored.path)
+            except Exception as e:
+                print(f"행 색인 생성 실패 ({stored.filename}): {e}")
         
-        flash(f'파일 {filename}이 성공적으로 업로드되었습니다!')
+        if stored.duplicate:
+            flash(f'파일 {filename}은 이미 업로드된 {stored.filename}과 내용이 같아 기존 분석 결과를 사용합니다.')
+        else:
+            flash(f'파일 {filename}이 성공적으로 업로드되었습니다!')
         
         # 자동 분석 페이지로 리다이렉트
-        return redirect(url_for('dashboard.analyze', filename=filename))
+        return redirect(url_for('dashboard.analyze', filename=stored.filename))
     
     else:
         flash('허용되지 않는 파일 형식입니다. CSV, Excel 파일만 업로드 가능합니다.')
@@ -69,7 +303,7 @@ def upload_file():
 
 @dashboard_bp.route('/analyze/<filename>')
 def analyze(filename):
-    """CSV 파일 분석 및 대시보드 생성"""
+    """CSV 파일 분석 및 대시보드 생성 (캐시에 없으면 백그라운드 작업으로 분석)"""
     file_path = UPLOAD_FOLDER / filename
     
     if not file_path.exists():
@@ -77,47 +311,233 @@ def analyze(filename):
         return redirect(url_for('dashboard.index'))
     
     try:
-        # CSV 분석 실행
-        analyzer = CSVAnalyzer(str(file_path))
-        analysis_results = analyzer.load_and_analyze_csv()
-        
-        if 'error' in analysis_results:
-            flash(f'파일 분석 중 오류가 발생했습니다: {analysis_results["error"]}')
-            return redirect(url_for('dashboard.index'))
-        
-        # 대시보드 HTML 생성
-        dashboard_html = analyzer.generate_dashboard_html(f'{filename} 분석 대시보드')
+        # 같은 내용의 파일(시트)은 캐시된 결과로 바로 대시보드 생성
+        sheet = resolve_sheet(file_path, request.args.get('sheet'))
+        cache_key = analysis_key(file_path, sheet)
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            analysis_results, charts = cached
+            return render_dashboard(filename, analysis_results, charts)
         
-        return dashboard_html
+        # 분석은 요청 처리 시간 제한을 받지 않도록 백그라운드에서 실행
+        job_id = submit_analysis_job(file_path, cache_key, sheet)
+        return redirect(url_for('dashboard.job_page', job_id=job_id))
         
+    except QueueFullError:
+        flash('분석 대기열이 가득 찼습니다. 잠시 후 다시 시도해 주세요.')
+        return redirect(url_for('dashboard.index'))
     except Exception as e:
         flash(f'분석 중 예상치 못한 오류가 발생했습니다: {str(e)}')
         return redirect(url_for('dashboard.index'))
 
+@dashboard_bp.route('/jobs/<job_id>')
+def job_page(job_id):
+    """분석 작업 진행 상황 페이지 (완료되면 결과 페이지로 이동)"""
+    job = analysis_jobs.status(job_id)
+    
+    if job is None:
+        flash('분석 작업을 찾을 수 없습니다.')
+        return redirect(url_for('dashboard.index'))
+    
+    if job['state'] == 'done':
+        return redirect(url_for('dashboard.job_result', job_id=job_id))
+    
+    return render_template('csv_dashboard/job.html', job=job)
+
+@dashboard_bp.route('/jobs/<job_id>/result')
+def job_result(job_id):
+    """완료된 분석 작업의 대시보드"""
+    job = analysis_jobs.status(job_id)
+    
+    if job is None:
+        flash('분석 작업을 찾을 수 없습니다.')
+        return redirect(url_for('dashboard.index'))
+    
+    if job['state'] != 'done':
+        return redirect(url_for('dashboard.job_page', job_id=job_id))
+    
+    result = analysis_jobs.result(job_id)
+    if result is None or 'analysis' not in result:
+        flash('분석 결과가 만료되었습니다. 다시 분석해 주세요.')
+        return redirect(url_for('dashboard.index'))
+    
+    return render_dashboard(job['filename'], result['analysis'], result['charts'])
+
+@dashboard_bp.route('/api/jobs/<job_id>')
+def api_job_status(job_id):
+    """API: 분석 작업 상태 JSON 반환 (state, stage, rows_processed)"""
+    job = analysis_jobs.status(job_id)
+    
+    if job is None:
+        return jsonify({'error': '분석 작업을 찾을 수 없습니다.'}), 404
+    
+    if job['state'] == 'done' and job.get('kind', 'analysis') == 'analysis':
+        job['result_url'] = url_for('dashboard.job_result', job_id=job_id)
+    
+    return jsonify(job)
+
 @dashboard_bp.route('/api/analyze/<filename>')
 def api_analyze(filename):
-    """API: CSV 파일 분석 결과 JSON 반환"""
+    """API: CSV 파일 분석 결과 JSON 반환 (캐시에 없으면 백그라운드 작업을 등록하고 202 반환)"""
     file_path = UPLOAD_FOLDER / filename
     
     if not file_path.exists():
         return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
     
     try:
-        analyzer = CSVAnalyzer(str(file_path))
-        analysis_results = analyzer.load_and_analyze_csv()
+        try:
+            sheet = resolve_sheet(file_path, request.args.get('sheet'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 404
+        
+        cache_key = analysis_key(file_path, sheet)
+        cached = analysis_cache.get(cache_key)
+        if cached is None:
+            return job_accepted(submit_analysis_job(file_path, cache_key, sheet))
         
-        if 'error' in analysis_results:
-            return jsonify(analysis_results), 400
+        analysis_results, charts = cached
+        with_file_info(file_path, analysis_results)
         
         # 차트 데이터도 포함
-        charts = analyzer.generate_charts()
         analysis_results['charts'] = charts
         
         return jsonify(analysis_results)
         
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 503
     except Exception as e:
         return jsonify({'error': f'분석 중 오류 발생: {str(e)}'}), 500
 
+@dashboard_bp.route('/api/timeseries/<filename>')
+def api_timeseries(filename):
+    """API: 시계열 원본 해상도 구간 JSON 반환 (?column=숫자 컬럼&start=시작&end=끝&sheet=시트, 시계열이 아직 없으면 202)"""
+    file_path = UPLOAD_FOLDER / filename
+    
+    if not file_path.is_file():
+        return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
+    
+    column = request.args.get('column')
+    if not column:
+        return jsonify({'error': 'column을 지정해야 합니다.'}), 400
+    
+    try:
+        sheet = resolve_sheet(file_path, request.args.get('sheet'))
+        cache_key = analysis_key(file_path, sheet)
+        entry = load_timeseries(cache_key, column)
+        if entry is None:
+            # 원본 시계열은 분석 작업이 만들어 두므로 요청 안에서 파일을 다시 파싱하지 않음
+            return job_accepted(submit_analysis_job(file_path, cache_key, sheet))
+        series, by_location = entry
+        window = CSVAnalyzer.timeseries_window(series, by_location, request.args.get('start'), request.args.get('end'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    except Exception as e:
+        return jsonify({'error': f'시계열 조회 중 오류 발생: {str(e)}'}), 500
+    
+    return jsonify(sanitize_json(window))
+
+@dashboard_bp.route('/api/rows/<filename>')
+def api_rows(filename):
+    """API: CSV 행 페이지 JSON 반환 (?offset=시작 행&limit=행 수, 행 위치 색인으로 해당 부분만 읽음)"""
+    file_path = UPLOAD_FOLDER / filename
+    
+    if not file_path.is_file():
+        return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
+    
+    if is_excel_file(file_path):
+        return jsonify({'error': '행 페이지 조회는 CSV 파일만 지원합니다.'}), 400
+    
+    offset = request.args.get('offset', 0, type=int)
+    limit = request.args.get('limit', ROWS_PAGE_LIMIT, type=int)
+    if offset < 0 or limit < 1:
+        return jsonify({'error': 'offset은 0 이상, limit은 1 이상의 정수여야 합니다.'}), 400
+    limit = min(limit, ROWS_MAX_LIMIT)
+    
+    try:
+        page = row_indexes.read_page(file_path, offset, limit)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'행 조회 중 오류 발생: {str(e)}'}), 500
+    
+    page.update(filename=filename, limit=limit)
+    next_offset = page['offset'] + len(page['rows'])
+    page['next_offset'] = next_offset if next_offset < page['total_rows'] else None
+    return jsonify(sanitize_json(page))
+
+@dashboard_bp.route('/api/query/tables')
+def api_query_tables():
+    """API: SQL 질의에서 쓸 수 있는 테이블 목록 JSON 반환"""
+    tables = [{'table': name, 'filename': info['filename'], 'sheet': info['sheet']}
+              for name, info in query_engine.tables(ALLOWED_EXTENSIONS).items()]
+    return jsonify({'tables': tables, 'available': query_engine.available()})
+
+@dashboard_bp.route('/api/query', methods=['GET', 'POST'])
+def api_query():
+    """
+    API: 업로드 파일에 대한 읽기 전용 SQL 질의 (sql=SELECT 문&offset=건너뛸 행 수&limit=행 수&format=json|arrow)
+
+    POST는 같은 항목을 JSON 본문으로 받는다. format=arrow이면 Arrow IPC 스트림으로 응답한다.
+    """
+    params = request.get_json(silent=True) or request.values
+    sql = (params.get('sql') or '').strip()
+    if not sql:
+        return jsonify({'error': 'sql을 지정해야 합니다.'}), 400
+
+    output_format = params.get('format', 'json')
+    if output_format not in ('json', 'arrow'):
+        return jsonify({'error': 'format은 json 또는 arrow여야 합니다.'}), 400
+
+    try:
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', QUERY_PAGE_LIMIT if output_format == 'json' else query_engine.max_rows))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'offset과 limit은 정수여야 합니다.'}), 400
+    if offset < 0 or limit < 1:
+        return jsonify({'error': 'offset은 0 이상, limit은 1 이상의 정수여야 합니다.'}), 400
+
+    if not query_engine.available():
+        return jsonify({'error': 'duckdb가 설치되지 않아 SQL 질의를 사용할 수 없습니다.'}), 503
+
+    try:
+        result = query_engine.execute(sql, ALLOWED_EXTENSIONS, offset, limit)
+    except QueryError as e:
+        return jsonify({'error': str(e)}), 400
+    except SnapshotPendingError as e:
+        # 큰 파일의 스냅샷 생성은 요청 처리 시간 제한을 넘을 수 있으므로 백그라운드에서 만들고 다시 요청하게 함
+        try:
+            response, status = job_accepted(submit_snapshot_job(e.tables))
+        except QueueFullError as queue_error:
+            return jsonify({'error': str(queue_error)}), 503
+        response.headers['Retry-After'] = '2'
+        return response, status
+    except Exception as e:
+        return jsonify({'error': f'질의 중 오류 발생: {str(e)}'}), 500
+
+    table = result['table']
+    next_offset = result['offset'] + table.num_rows if result['truncated'] else None
+
+    if output_format == 'arrow':
+        import pyarrow as pa
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        response = Response(sink.getvalue().to_pybytes(), mimetype='application/vnd.apache.arrow.stream')
+        response.headers['X-Next-Offset'] = '' if next_offset is None else str(next_offset)
+        return response
+
+    return jsonify(sanitize_json({
+        'columns': table.column_names,
+        'types': [str(field.type) for field in table.schema],
+        'rows': table.to_pylist(),
+        'offset': result['offset'],
+        'limit': result['limit'],
+        'next_offset': next_offset,
+        'elapsed': result['elapsed']
+    }))
+
 @dashboard_bp.route('/delete/<filename>', methods=['POST'])
 def delete_file(filename):
     """업로드된 파일 삭제"""
@@ -126,6 +546,9 @@ def delete_file(filename):
     if file_path.exists():
         try:
             file_path.unlink()
+            upload_index.forget(filename)
+            row_indexes.forget(filename)
+            query_engine.forget(filename)
             flash(f'파일 {filename}이 삭제되었습니다.')
         except Exception as e:
             flash(f'파일 삭제 중 오류가 발생했습니다: {str(e)}')
@@ -148,4 +571,11 @@ def list_files():
                     'extension': file_path.suffix.lower()
                 })
     
-    return jsonify({'files': files})
\ No newline at end of file
+    return jsonify({'files': files})
+
+@dashboard_bp.route('/api/cache_stats')
+def cache_stats():
+    """API: 분석 캐시와 작업 대기열 통계 JSON 반환"""
+    stats = analysis_cache.stats()
+    stats['jobs'] = analysis_jobs.stats()
+    return jsonify(stats)
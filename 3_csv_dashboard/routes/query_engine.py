@@ -0,0 +1,334 @@
+"""
+SQL 질의 모듈
+업로드된 파일(Excel은 시트별)을 컬럼형 스냅샷(Parquet)으로 한 번 변환해 두고,
+내장 DuckDB에 테이블로 등록하여 읽기 전용 SELECT 질의를 행 수/실행 시간 제한 안에서 실행하는 기능을 제공
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from module.analysis_cache import analysis_cache
+from module.encoding_sniffer import sniff_encoding
+from .spreadsheet_reader import is_excel_file, list_sheets, read_sheet
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+    print("duckdb를 찾을 수 없어 SQL 질의 기능을 사용할 수 없습니다.")
+
+
+# 질의 한 번에 돌려줄 수 있는 최대 행 수와 실행 시간 제한 (초)
+QUERY_MAX_ROWS = int(os.getenv('CSV_QUERY_MAX_ROWS', 100_000))
+QUERY_TIMEOUT = float(os.getenv('CSV_QUERY_TIMEOUT', 10))
+
+# 질의 연결 하나가 쓸 수 있는 메모리와 스레드 수 (웹 워커마다 따로 적용)
+QUERY_MEMORY_LIMIT = os.getenv('CSV_QUERY_MEMORY_LIMIT', '512MB')
+QUERY_THREADS = int(os.getenv('CSV_QUERY_THREADS', 2))
+
+# 스냅샷 Parquet 행 그룹 크기 (질의 시 필요한 행 그룹만 읽음)
+ROW_GROUP_SIZE = 128 * 1024
+
+
+class QueryError(ValueError):
+    """실행할 수 없는 질의 (SELECT가 아님, 문법 오류, 시간 초과 등)"""
+
+
+class SnapshotPendingError(RuntimeError):
+    """질의에 나온 테이블의 스냅샷이 아직 없는 경우 (요청 안에서 만들지 않고 백그라운드 작업으로 넘김)"""
+
+    def __init__(self, tables: Dict[str, Dict[str, Any]]):
+        super().__init__(f"테이블 스냅샷을 준비하는 중입니다: {', '.join(tables)}")
+        self.tables = tables
+
+
+def table_name(filename: str, sheet: Optional[str] = None) -> str:
+    """
+    파일(시트)에 해당하는 테이블 이름 (파일명에서 확장자를 뺀 부분, 첫 번째가 아닌 시트는 '__시트명'을 붙임)
+
+    Args:
+        filename (str): 업로드 파일명
+        sheet (str): 첫 번째가 아닌 Excel 시트 이름
+
+    Returns:
+        str: 따옴표 없이 쓸 수 있는 테이블 이름 (영문/숫자/한글/밑줄)
+    """
+    name = Path(filename).stem if sheet is None else f'{Path(filename).stem}__{sheet}'
+    name = re.sub(r'\W+', '_', name).strip('_') or 'data'
+    return f't_{name}' if name[0].isdigit() else name
+
+
+class QueryEngine:
+    """업로드 파일을 테이블로 등록하고 읽기 전용 SQL 질의를 실행하는 클래스"""
+
+    def __init__(self, upload_dir: Path, snapshot_dir: Path, max_rows: int = QUERY_MAX_ROWS,
+                 timeout: float = QUERY_TIMEOUT):
+        """
+        Args:
+            upload_dir (Path): 업로드 파일 디렉토리
+            snapshot_dir (Path): 컬럼형 스냅샷을 저장할 디렉토리
+            max_rows (int): 질의 한 번에 돌려줄 최대 행 수
+            timeout (float): 질의 실행 시간 제한 (초)
+        """
+        self.upload_dir = Path(upload_dir)
+        self.snapshot_dir = Path(snapshot_dir)
+        self.max_rows = max_rows
+        self.timeout = timeout
+        self._sheets: Dict[Tuple[str, int], List[str]] = {}
+        self._build_lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        """duckdb가 설치되어 있는지 확인"""
+        return duckdb is not None
+
+    def _list_sheets(self, file_path: Path) -> List[str]:
+        """시트 목록 (파일이 바뀌지 않았으면 통합문서를 다시 열지 않음)"""
+        key = (file_path.name, file_path.stat().st_mtime_ns)
+        if key not in self._sheets:
+            self._sheets[key] = list_sheets(file_path)
+        return self._sheets[key]
+
+    def tables(self, allowed_extensions) -> Dict[str, Dict[str, Any]]:
+        """
+        질의할 수 있는 테이블 목록
+
+        이름이 겹치면(a.csv와 a.xlsx 등) 나중 파일의 테이블 이름에 확장자를 붙인다.
+
+        Args:
+            allowed_extensions (set): 업로드 허용 확장자 (점 없이 소문자)
+
+        Returns:
+            dict: 테이블 이름 → {'filename', 'sheet', 'sheet_index'}
+        """
+        tables = {}
+        if not self.upload_dir.exists():
+            return tables
+
+        for file_path in sorted(self.upload_dir.glob('*.*')):
+            extension = file_path.suffix.lower().lstrip('.')
+            if extension not in allowed_extensions or not file_path.is_file():
+                continue
+
+            sheets = [None]
+            if is_excel_file(file_path):
+                try:
+                    sheets = self._list_sheets(file_path)
+                except Exception as e:
+                    print(f"시트 목록 읽기 실패 ({file_path.name}): {e}")
+                    continue
+
+            for index, sheet in enumerate(sheets):
+                name = table_name(file_path.name, sheet if index else None)
+                if name.lower() in (key.lower() for key in tables):
+                    name = f'{name}_{extension}'
+                tables[name] = {'filename': file_path.name, 'sheet': sheet if index else None, 'sheet_index': index}
+        return tables
+
+    def _snapshot_path(self, file_path: Path, sheet_index: int) -> Path:
+        """파일 내용 해시가 들어간 스냅샷 경로 (파일이 바뀌면 경로도 바뀌어 다시 생성됨)"""
+        file_hash = analysis_cache.file_hash(file_path)
+        return self.snapshot_dir / file_path.name / f'{sheet_index}.{file_hash[:16]}.parquet'
+
+    def snapshot(self, filename: str, sheet: Optional[str] = None, sheet_index: int = 0) -> Path:
+        """
+        파일(시트)의 컬럼형 스냅샷 경로 (없으면 생성)
+
+        CSV는 pyarrow CSV 리더로 파일 전체를 보고 컬럼 타입을 정해 여러 스레드로 변환하고,
+        Excel은 스트리밍 리더로 읽은 시트를 변환한다.
+
+        Args:
+            filename (str): 업로드 파일명
+            sheet (str): Excel 시트 이름 (None이면 첫 번째 시트)
+            sheet_index (int): 시트 순서 (스냅샷 파일 이름에 사용)
+
+        Returns:
+            Path: Parquet 스냅샷 경로
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+
+        file_path = self.upload_dir / filename
+        snapshot_path = self._snapshot_path(file_path, sheet_index)
+        if snapshot_path.exists():
+            return snapshot_path
+
+        with self._build_lock:
+            if snapshot_path.exists():
+                return snapshot_path
+
+            print(f"질의용 스냅샷 생성 중: {filename}" + (f" ({sheet})" if sheet else ""))
+            if is_excel_file(file_path):
+                df = read_sheet(file_path, sheet)
+                df.columns = [str(col) for col in df.columns]
+                try:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    # 숫자와 문자가 섞인 컬럼은 문자열로 저장
+                    mixed = df.select_dtypes(include='object').columns
+                    df[mixed] = df[mixed].astype(str).where(df[mixed].notna(), None)
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+            else:
+                read_options = pa_csv.ReadOptions(encoding=sniff_encoding(file_path))
+                table = pa_csv.read_csv(file_path, read_options=read_options)
+
+            # 이 파일의 이전 내용으로 만든 스냅샷은 삭제
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in snapshot_path.parent.glob(f'{sheet_index}.*.parquet'):
+                stale.unlink(missing_ok=True)
+
+            temp_path = snapshot_path.with_name(f'.{snapshot_path.name}.{os.getpid()}.tmp')
+            pq.write_table(table, temp_path, row_group_size=ROW_GROUP_SIZE)
+            os.replace(temp_path, snapshot_path)
+            return snapshot_path
+
+    def snapshot_ready(self, info: Dict[str, Any]) -> bool:
+        """테이블(tables()의 항목)의 스냅샷이 이미 만들어져 있는지 확인"""
+        return self._snapshot_path(self.upload_dir / info['filename'], info['sheet_index']).exists()
+
+    def build_snapshots(self, tables: Dict[str, Dict[str, Any]], progress=None):
+        """
+        여러 테이블의 스냅샷 생성 (백그라운드 작업에서 호출)
+
+        Args:
+            tables (dict): 테이블 이름 → tables()의 항목
+            progress (callable): 진행 상황 콜백 progress(단계, 만든 스냅샷 수)
+        """
+        for built, info in enumerate(tables.values()):
+            if progress is not None:
+                progress('snapshot', built)
+            self.snapshot(info['filename'], info['sheet'], info['sheet_index'])
+
+    def forget(self, filename: str):
+        """파일 삭제 시 스냅샷 제거"""
+        snapshot_dir = self.snapshot_dir / filename
+        if snapshot_dir.is_dir():
+            for path in snapshot_dir.iterdir():
+                path.unlink(missing_ok=True)
+            snapshot_dir.rmdir()
+
+    @staticmethod
+    def _select_statement(sql: str) -> str:
+        """
+        질의가 SELECT 문 하나인지 확인
+
+        Returns:
+            str: 끝의 세미콜론을 뺀 질의
+
+        Raises:
+            QueryError: 문법 오류이거나 SELECT 문 하나가 아닌 경우
+        """
+        try:
+            statements = duckdb.extract_statements(sql)
+        except duckdb.Error as e:
+            raise QueryError(f"질의를 해석할 수 없습니다: {e}")
+        if len(statements) != 1:
+            raise QueryError("SELECT 문 하나만 실행할 수 있습니다.")
+        if statements[0].type != duckdb.StatementType.SELECT:
+            raise QueryError("읽기 전용 SELECT 문만 실행할 수 있습니다.")
+        return statements[0].query.strip().rstrip(';')
+
+    @staticmethod
+    def _referenced_tables(con, query: str) -> List[str]:
+        """
+        질의 구문 트리에서 FROM/JOIN에 나온 테이블 이름 목록 (바인딩하지 않으므로 등록 전에도 USING/NATURAL JOIN을 해석할 수 있음)
+
+        Raises:
+            QueryError: 질의를 해석할 수 없는 경우
+        """
+        try:
+            tree = json.loads(con.execute("SELECT json_serialize_sql(?)", [query]).fetchone()[0])
+        except duckdb.Error as e:
+            raise QueryError(f"질의를 해석할 수 없습니다: {e}")
+        if tree.get('error'):
+            raise QueryError(f"질의를 해석할 수 없습니다: {tree.get('error_message', '')}")
+
+        names, stack = [], [tree]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if node.get('type') == 'BASE_TABLE' and node.get('table_name'):
+                    names.append(node['table_name'])
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return names
+
+    def execute(self, sql: str, allowed_extensions, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        읽기 전용 SELECT 질의 실행
+
+        질의마다 새 메모리 연결을 만들어 질의에 나온 테이블의 스냅샷만 pyarrow 데이터셋으로 등록하고
+        (필요한 컬럼과 행 그룹만 읽음), 파일 접근과 설정 변경을 막은 뒤 실행한다.
+        스냅샷이 없는 테이블이 있으면 요청 안에서 만들지 않고 SnapshotPendingError를 낸다.
+        시간 제한을 넘기면 실행을 중단한다. 페이지 순서를 고정하려면 질의에 ORDER BY를 넣어야 한다.
+
+        Args:
+            sql (str): SELECT 질의
+            allowed_extensions (set): 업로드 허용 확장자
+            offset (int): 결과에서 건너뛸 행 수
+            limit (int): 돌려줄 최대 행 수 (None이거나 max_rows보다 크면 max_rows)
+
+        Returns:
+            dict: table(pyarrow.Table), offset, limit, truncated(뒤에 행이 더 있는지), elapsed(초)
+
+        Raises:
+            QueryError: SELECT가 아니거나, 없는 테이블/컬럼, 문법 오류, 시간 초과인 경우
+            SnapshotPendingError: 질의에 나온 테이블의 스냅샷이 아직 없는 경우
+            RuntimeError: duckdb가 설치되지 않은 경우
+        """
+        import pyarrow.dataset as ds
+
+        if duckdb is None:
+            raise RuntimeError("duckdb가 설치되지 않아 SQL 질의를 실행할 수 없습니다.")
+
+        query = self._select_statement(sql)
+        limit = min(limit or self.max_rows, self.max_rows)
+
+        con = duckdb.connect(':memory:', config={'threads': QUERY_THREADS, 'memory_limit': QUERY_MEMORY_LIMIT})
+        try:
+            # 질의에 나온 테이블만 등록 (대소문자 구분 없음, CTE 이름 등 업로드 파일이 아닌 이름은 무시)
+            tables = {name.lower(): (name, info) for name, info in self.tables(allowed_extensions).items()}
+            referenced = dict(tables[table.lower()] for table in self._referenced_tables(con, query) if table.lower() in tables)
+
+            pending = {name: info for name, info in referenced.items() if not self.snapshot_ready(info)}
+            if pending:
+                raise SnapshotPendingError(pending)
+            for name, info in referenced.items():
+                path = self._snapshot_path(self.upload_dir / info['filename'], info['sheet_index'])
+                con.register(name, ds.dataset(path, format='parquet'))
+
+            # 질의에서 다른 파일을 읽거나 확장/설정을 바꾸지 못하도록 잠금
+            con.execute("SET enable_external_access = false")
+            con.execute("SET lock_configuration = true")
+
+            timer = threading.Timer(self.timeout, con.interrupt)
+            timer.start()
+            started = time.time()
+            try:
+                table = con.execute(
+                    f"SELECT * FROM (\n{query}\n) AS q LIMIT {limit + 1} OFFSET {int(offset)}"
+                ).to_arrow_table()
+            except duckdb.InterruptException:
+                raise QueryError(f"질의 실행 시간이 {self.timeout:g}초를 넘어 중단했습니다.")
+            except duckdb.Error as e:
+                raise QueryError(str(e))
+            finally:
+                timer.cancel()
+            elapsed = time.time() - started
+        finally:
+            con.close()
+
+        return {
+            'table': table.slice(0, limit),
+            'offset': offset,
+            'limit': limit,
+            'truncated': table.num_rows > limit,
+            'elapsed': round(elapsed, 4)
+        }
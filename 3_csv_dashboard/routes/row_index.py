@@ -0,0 +1,280 @@
+"""
+행 위치 색인 모듈
+CSV 파일의 각 데이터 행이 시작하는 바이트 위치를 .npy 배열로 저장해 두고,
+요청한 페이지의 행만 바로 찾아가 읽어 파싱하는 기능을 제공
+"""
+
+import codecs
+import io
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from module.encoding_sniffer import sniff_encoding
+
+
+SCAN_CHUNK_BYTES = 8 * 1024 * 1024
+
+NEWLINE, CARRIAGE_RETURN, QUOTE, COMMA = 0x0A, 0x0D, 0x22, 0x2C
+
+# 따옴표가 필드를 여는 것으로 볼 수 있는 앞 바이트 (필드/레코드 시작, 또는 ""의 두 번째 따옴표)
+FIELD_START_BYTES = np.array([COMMA, NEWLINE, CARRIAGE_RETURN, QUOTE], dtype=np.uint8)
+
+# 바이트 단위로 줄바꿈을 찾을 수 있는 인코딩 (UTF-16은 줄바꿈이 2바이트)
+INDEXABLE_ENCODINGS = {'utf-8', 'utf-8-sig', 'cp949'}
+
+# 색인 형식 버전 (레코드 경계 판정 방식이 바뀌면 올려서 이전 색인을 다시 만들게 함)
+INDEX_VERSION = 2
+
+
+def _read_chunks(path, chunk_size: int):
+    """
+    파일을 chunk_size 바이트씩 읽기
+
+    UTF-8 BOM은 같은 길이의 쉼표로 바꿔서 돌려준다 (BOM 바로 뒤의 따옴표도 필드 시작으로 보도록,
+    쉼표는 레코드 경계 판정에 쓰이지 않으므로 위치 계산에는 영향 없음).
+    """
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            if f.tell() == len(chunk) and chunk.startswith(codecs.BOM_UTF8):
+                chunk = b',' * len(codecs.BOM_UTF8) + chunk[len(codecs.BOM_UTF8):]
+            yield chunk
+
+
+def _parity_boundaries(chunk: bytes, quote_parity: int, prev_byte: int):
+    """
+    따옴표 개수의 누적 홀짝으로 따옴표 밖의 줄바꿈 위치 계산 (numpy, 빠른 경로)
+
+    따옴표가 모두 필드 시작에서 열리는 경우에만 pandas와 결과가 같으므로,
+    필드 중간에서 열리는 따옴표(예: 27" wide)가 있으면 None을 돌려 느린 경로를 쓰게 한다.
+
+    Returns:
+        tuple: (조각 안의 레코드 경계 줄바꿈 위치, 조각 끝의 따옴표 홀짝) - 판정할 수 없으면 None
+    """
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    quote_positions = np.flatnonzero(data == QUOTE)
+    opening = quote_positions[(np.arange(len(quote_positions)) + quote_parity) % 2 == 0]
+    if len(opening):
+        before = data[np.maximum(opening - 1, 0)]
+        before[opening == 0] = prev_byte
+        if not np.isin(before, FIELD_START_BYTES).all():
+            return None
+
+    quotes = np.cumsum(data == QUOTE) + quote_parity
+    newlines = np.flatnonzero(data == NEWLINE)
+    return newlines[quotes[newlines] % 2 == 0], int(quotes[-1] % 2)
+
+
+def _scan_line_starts_strict(path, chunk_size: int) -> np.ndarray:
+    """
+    pandas(C 파서)와 같은 규칙으로 따옴표를 해석하여 레코드 시작 위치 계산 (느린 경로)
+
+    따옴표는 필드 시작에서만 인용 필드를 열고, 필드 중간의 따옴표는 일반 문자로 본다.
+    인용 필드 안의 ""는 따옴표 문자이며, 그 밖의 따옴표가 인용 필드를 닫는다.
+    반복은 따옴표 위치에 대해서만 돌고 줄바꿈 판정은 numpy로 한다.
+    """
+    starts = [np.zeros(1, dtype=np.int64)]
+    in_quotes = False
+    pending_quote = False  # 인용 필드 안의 따옴표가 조각 끝에 있어 다음 바이트를 봐야 하는 경우
+    prev_byte = NEWLINE
+    position = 0
+    for chunk in _read_chunks(path, chunk_size):
+        data = np.frombuffer(chunk, dtype=np.uint8)
+        quote_positions = np.flatnonzero(data == QUOTE).tolist()
+        opens, closes = [], []
+        skip = -1
+        if pending_quote:
+            pending_quote = False
+            if data[0] == QUOTE:
+                skip = 0
+            else:
+                in_quotes = False
+        if in_quotes:
+            opens.append(-1)
+
+        for i in quote_positions:
+            if i == skip:
+                continue
+            if not in_quotes:
+                before = data[i - 1] if i else prev_byte
+                if before in (COMMA, NEWLINE, CARRIAGE_RETURN):
+                    in_quotes = True
+                    opens.append(i)
+            elif i + 1 == len(data):
+                pending_quote = True
+            elif data[i + 1] == QUOTE:
+                skip = i + 1
+            else:
+                in_quotes = False
+                closes.append(i)
+        if in_quotes:
+            closes.append(len(data))
+
+        newlines = np.flatnonzero(data == NEWLINE)
+        if opens:
+            interval = np.searchsorted(np.array(opens), newlines, side='right') - 1
+            quoted = (interval >= 0) & (newlines < np.array(closes)[np.maximum(interval, 0)])
+            newlines = newlines[~quoted]
+        starts.append(newlines.astype(np.int64) + position + 1)
+        prev_byte = int(data[-1])
+        position += len(chunk)
+
+    line_starts = np.concatenate(starts)
+    return line_starts[line_starts < position]
+
+
+def scan_line_starts(path, chunk_size: int = SCAN_CHUNK_BYTES) -> np.ndarray:
+    """
+    CSV 레코드가 시작하는 바이트 위치 (따옴표 안의 줄바꿈은 레코드 경계가 아님)
+
+    따옴표 개수의 누적 홀짝으로 따옴표 안인지 판단한다 (이스케이프된 ""는 홀짝을 바꾸지 않음).
+    필드 중간에 따옴표가 있는 파일은 pandas와 같은 규칙으로 다시 계산한다.
+    CP949의 2바이트 문자는 후행 바이트가 0x41 이상이라 줄바꿈/따옴표/쉼표와 겹치지 않는다.
+
+    Args:
+        path (Path): CSV 파일 경로
+        chunk_size (int): 한 번에 읽을 바이트 수
+
+    Returns:
+        numpy.ndarray: 첫 줄(0)을 포함한 레코드 시작 위치 (파일 끝 위치는 제외)
+    """
+    starts = [np.zeros(1, dtype=np.int64)]
+    quote_parity = 0
+    prev_byte = NEWLINE
+    position = 0
+    for chunk in _read_chunks(path, chunk_size):
+        scanned = _parity_boundaries(chunk, quote_parity, prev_byte)
+        if scanned is None:
+            return _scan_line_starts_strict(path, chunk_size)
+        boundaries, quote_parity = scanned
+        starts.append(boundaries.astype(np.int64) + position + 1)
+        prev_byte = chunk[-1]
+        position += len(chunk)
+
+    line_starts = np.concatenate(starts)
+    return line_starts[line_starts < position]
+
+
+def build_row_index(path) -> np.ndarray:
+    """
+    데이터 행 시작 위치 배열 생성 (헤더 줄과 빈 줄 제외)
+
+    Args:
+        path (Path): CSV 파일 경로
+
+    Returns:
+        numpy.ndarray: 행 시작 바이트 위치 (파일이 4GB 미만이면 uint32, 이상이면 int64)
+    """
+    size = os.path.getsize(path)
+    line_starts = scan_line_starts(path)
+    if len(line_starts) == 0:
+        return np.zeros(0, dtype=np.uint32)
+
+    # pandas처럼 빈 줄('\n', '\r\n')은 행으로 세지 않음
+    line_ends = np.append(line_starts[1:], size)
+    lengths = line_ends - line_starts
+    first_bytes = np.memmap(path, dtype=np.uint8, mode='r')[line_starts] if size else np.zeros(0, np.uint8)
+    blank = (lengths == 1) | ((lengths == 2) & (first_bytes == CARRIAGE_RETURN))
+    rows = line_starts[~blank][1:]
+
+    dtype = np.uint32 if size < 2 ** 32 else np.int64
+    return rows.astype(dtype)
+
+
+class RowIndexStore:
+    """업로드 CSV별 행 위치 색인(.npy)을 관리하고 페이지 단위로 행을 읽는 클래스"""
+
+    def __init__(self, index_dir: Path):
+        """
+        Args:
+            index_dir (Path): 색인 파일을 저장할 디렉토리
+        """
+        self.index_dir = Path(index_dir)
+
+    def path_for(self, file_path) -> Path:
+        """파일에 해당하는 색인 경로"""
+        return self.index_dir / f'{Path(file_path).name}.rows.v{INDEX_VERSION}.npy'
+
+    def ensure(self, file_path) -> Path:
+        """
+        색인이 없거나 파일보다 오래되었으면 새로 생성
+
+        Args:
+            file_path (Path): CSV 파일 경로
+
+        Returns:
+            Path: 색인 파일 경로
+
+        Raises:
+            ValueError: 바이트 단위로 줄을 나눌 수 없는 인코딩(UTF-16)인 경우
+        """
+        file_path = Path(file_path)
+        index_path = self.path_for(file_path)
+        if index_path.exists() and index_path.stat().st_mtime_ns >= file_path.stat().st_mtime_ns:
+            return index_path
+
+        encoding = sniff_encoding(file_path)
+        if encoding not in INDEXABLE_ENCODINGS:
+            raise ValueError(f"{encoding} 인코딩 파일은 행 색인을 만들 수 없습니다.")
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_name(f'.{index_path.name}.{os.getpid()}.tmp')
+        with open(temp_path, 'wb') as f:
+            np.save(f, build_row_index(file_path))
+        os.replace(temp_path, index_path)
+        return index_path
+
+    def forget(self, filename: str):
+        """파일 삭제 시 색인 제거"""
+        self.path_for(filename).unlink(missing_ok=True)
+
+    def read_page(self, file_path, offset: int, limit: int) -> Dict[str, Any]:
+        """
+        offset번째 데이터 행부터 limit개 행만 읽어 파싱
+
+        색인을 메모리 매핑으로 열어 필요한 두 위치만 읽으므로 페이지 위치와 관계없이 비용이 같다.
+        페이지마다 타입 추론 결과가 달라지지 않도록 값은 원본 문자열 그대로 돌려준다 (빈 칸은 None).
+
+        Args:
+            file_path (Path): CSV 파일 경로
+            offset (int): 시작 행 번호 (0부터)
+            limit (int): 행 수
+
+        Returns:
+            dict: total_rows, offset, columns, rows(레코드 목록)
+
+        Raises:
+            ValueError: 색인한 행 수와 파싱한 행 수가 다른 경우
+        """
+        file_path = Path(file_path)
+        offsets = np.load(self.ensure(file_path), mmap_mode='r')
+        total_rows = len(offsets)
+        size = file_path.stat().st_size
+        encoding = sniff_encoding(file_path)
+
+        offset = min(offset, total_rows)
+        end_row = min(offset + limit, total_rows)
+        header_end = int(offsets[0]) if total_rows else size
+        start = int(offsets[offset]) if offset < total_rows else size
+        end = int(offsets[end_row]) if end_row < total_rows else size
+
+        with open(file_path, 'rb') as f:
+            header = f.read(header_end)
+            f.seek(start)
+            body = f.read(end - start)
+
+        text = header.decode(encoding) + body.decode(encoding.replace('-sig', ''))
+        page = pd.read_csv(io.StringIO(text), dtype=str)
+        if len(page) != end_row - offset:
+            # 색인의 레코드 경계가 pandas와 다르면 행이 밀리거나 빠지므로 잘못된 페이지를 돌려주지 않음
+            raise ValueError(f"행 색인이 파일 내용과 맞지 않습니다 (색인 {end_row - offset}행, 파싱 {len(page)}행).")
+
+        return {
+            'total_rows': total_rows,
+            'offset': offset,
+            'columns': [str(col) for col in page.columns],
+            'rows': page.where(page.notna(), None).to_dict('records')
+        }
@@ -0,0 +1,166 @@
+"""
+스프레드시트 읽기 모듈
+Excel 통합문서를 openpyxl 읽기 전용(스트리밍) 모드로 한 행씩 읽어 시트 단위 DataFrame으로 변환하여,
+CSV와 같은 분석 파이프라인에 넘기는 기능을 제공
+"""
+
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+import pandas as pd
+
+
+# openpyxl로 스트리밍할 수 있는 형식과 pandas(xlrd)로 읽는 이전 형식
+OPENPYXL_EXTENSIONS = {'.xlsx', '.xlsm'}
+LEGACY_EXTENSIONS = {'.xls'}
+EXCEL_EXTENSIONS = OPENPYXL_EXTENSIONS | LEGACY_EXTENSIONS
+
+# .xls를 읽을 xlrd가 없을 때 안내 문구
+XLRD_REQUIRED = ".xls 파일을 읽으려면 xlrd 패키지가 필요합니다. .xlsx로 저장해서 올려주세요."
+
+# 행 튜플을 DataFrame 조각으로 바꾸는 단위 (파이썬 객체로 들고 있는 행 수의 상한)
+CHUNK_ROWS = 50_000
+
+
+def is_excel_file(path) -> bool:
+    """Excel 통합문서인지 확장자로 확인"""
+    return Path(path).suffix.lower() in EXCEL_EXTENSIONS
+
+
+def _open_workbook(path):
+    from openpyxl import load_workbook
+    # read_only: 시트 XML을 한 번에 불러오지 않고 행 단위로 스트리밍
+    return load_workbook(path, read_only=True, data_only=True)
+
+
+def list_sheets(path) -> List[str]:
+    """
+    통합문서의 시트 이름 목록
+
+    Args:
+        path (Path): Excel 파일 경로
+
+    Returns:
+        list: 시트 이름 (통합문서 순서)
+
+    Raises:
+        ValueError: .xls 파일인데 xlrd가 설치되지 않은 경우
+    """
+    path = Path(path)
+    if path.suffix.lower() in LEGACY_EXTENSIONS:
+        try:
+            return list(pd.ExcelFile(path).sheet_names)
+        except ImportError:
+            raise ValueError(XLRD_REQUIRED)
+
+    workbook = _open_workbook(path)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _header_names(row) -> List[str]:
+    """헤더 행을 컬럼명으로 변환 (빈 칸은 pandas와 같이 'Unnamed: n', 중복 이름은 '.n'을 붙임)"""
+    names = []
+    seen = {}
+    for i, value in enumerate(row):
+        name = f'Unnamed: {i}' if value is None or str(value).strip() == '' else str(value).strip()
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _frame(rows, columns) -> pd.DataFrame:
+    """행 튜플 조각을 DataFrame으로 변환 (숫자 컬럼은 numpy 배열로 압축됨)"""
+    width = len(columns)
+    rows = [row[:width] + (None,) * (width - len(row)) for row in rows]
+    return pd.DataFrame.from_records(rows, columns=columns).infer_objects()
+
+
+def iter_sheet_frames(path, sheet: Optional[str] = None, chunk_rows: int = CHUNK_ROWS,
+                      progress: Optional[Callable[[int], None]] = None) -> Iterator[pd.DataFrame]:
+    """
+    시트를 스트리밍으로 읽어 chunk_rows 행씩 DataFrame 조각으로 반환
+
+    첫 번째로 값이 있는 행을 헤더로 사용하고, 모든 칸이 빈 행은 건너뛴다.
+
+    Args:
+        path (Path): .xlsx/.xlsm 파일 경로
+        sheet (str): 시트 이름 (None이면 첫 번째 시트)
+        chunk_rows (int): 조각당 행 수
+        progress (callable): 읽은 데이터 행 수를 받는 콜백
+
+    Yields:
+        pandas.DataFrame: 데이터 조각
+    """
+    workbook = _open_workbook(path)
+    try:
+        worksheet = workbook[sheet] if sheet is not None else workbook.worksheets[0]
+        columns = None
+        rows = []
+        count = 0
+        for row in worksheet.iter_rows(values_only=True):
+            if all(value is None for value in row):
+                continue
+            if columns is None:
+                # 오른쪽 끝의 빈 헤더 칸은 서식만 있는 열이므로 제외
+                width = len(row)
+                while width and row[width - 1] is None:
+                    width -= 1
+                columns = _header_names(row[:width])
+                continue
+            rows.append(row)
+            if len(rows) >= chunk_rows:
+                count += len(rows)
+                yield _frame(rows, columns)
+                rows = []
+                if progress is not None:
+                    progress(count)
+
+        if columns is None:
+            raise ValueError(f"시트 '{worksheet.title}'에 데이터가 없습니다.")
+        if rows or count == 0:
+            count += len(rows)
+            yield _frame(rows, columns)
+            if progress is not None:
+                progress(count)
+    finally:
+        workbook.close()
+
+
+def read_sheet(path, sheet: Optional[str] = None, chunk_rows: int = CHUNK_ROWS,
+               progress: Optional[Callable[[int], None]] = None) -> pd.DataFrame:
+    """
+    시트 하나를 DataFrame으로 읽기
+
+    .xlsx/.xlsm은 openpyxl 읽기 전용 모드로 스트리밍하여 통합문서 전체를 메모리에 올리지 않는다.
+    .xls는 pandas(xlrd)로 읽는다.
+
+    Args:
+        path (Path): Excel 파일 경로
+        sheet (str): 시트 이름 (None이면 첫 번째 시트)
+        chunk_rows (int): 스트리밍 조각당 행 수
+        progress (callable): 읽은 데이터 행 수를 받는 콜백
+
+    Returns:
+        pandas.DataFrame: 시트 데이터
+    """
+    path = Path(path)
+    if path.suffix.lower() in LEGACY_EXTENSIONS:
+        try:
+            df = pd.read_excel(path, sheet_name=sheet if sheet is not None else 0)
+        except ImportError:
+            raise ValueError(XLRD_REQUIRED)
+        if progress is not None:
+            progress(len(df))
+        return df
+
+    frames = list(iter_sheet_frames(path, sheet, chunk_rows, progress))
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    # 조각마다 추론된 타입이 다를 수 있으므로 합친 뒤 다시 추론
+    return df.infer_objects()
@@ -0,0 +1,107 @@
+"""
+시계열 저장 모듈
+분석 작업에서 만든 원본 해상도 시계열(시간별 합계)을 분석 키별 Parquet 파일로 저장해 두고,
+확대 구간 조회 요청이 파일을 다시 파싱하지 않고 읽을 수 있게 하는 기능을 제공
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+# 마지막으로 읽거나 쓴 뒤 보관하는 기간 (초, 분석 캐시 기본 보관 기간과 같음)
+TIMESERIES_RETENTION = 30 * 24 * 60 * 60
+
+Series = List[Tuple[str, pd.Series, pd.Series]]
+
+
+class TimeseriesStore:
+    """분석 키별 원본 해상도 시계열 파일을 관리하는 클래스"""
+
+    def __init__(self, store_dir: Path):
+        """
+        Args:
+            store_dir (Path): 시계열 파일을 저장할 디렉토리
+        """
+        self.store_dir = Path(store_dir)
+
+    def path_for(self, cache_key: str) -> Path:
+        """분석 키에 해당하는 시계열 파일 경로 (같은 내용의 파일은 같은 시계열을 공유)"""
+        return self.store_dir / f'{cache_key}.parquet'
+
+    def save(self, cache_key: str, series_by_column: Dict[str, Series], by_location: bool):
+        """
+        컬럼별 원본 시계열 저장
+
+        Args:
+            cache_key (str): 분석 키
+            series_by_column (dict): 숫자 컬럼 → timeseries_series() 결과
+            by_location (bool): 지역별 trace인지 여부
+        """
+        frames = []
+        for column, series in series_by_column.items():
+            for trace, (name, x, y) in enumerate(series):
+                frames.append(pd.DataFrame({
+                    'column': str(column),
+                    'trace': trace,
+                    'name': name,
+                    'x': x.to_numpy(),
+                    'y': y.to_numpy()
+                }))
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['column', 'trace', 'name', 'x', 'y'])
+        df['by_location'] = by_location
+
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self._cleanup()
+        path = self.path_for(cache_key)
+        temp_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            df.to_parquet(temp_path, index=False)
+        except (TypeError, ValueError):
+            # 숫자와 문자가 섞인 시간 컬럼은 문자열로 저장
+            df['x'] = df['x'].astype(str)
+            df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+
+    def load(self, cache_key: str, column: str) -> Optional[Tuple[Series, bool]]:
+        """
+        저장된 원본 시계열 조회
+
+        Args:
+            cache_key (str): 분석 키
+            column (str): 숫자 컬럼
+
+        Returns:
+            tuple: (원본 시계열 목록, 지역별 여부) - 아직 만들어지지 않았으면 None
+
+        Raises:
+            ValueError: 시계열은 있지만 해당 컬럼이 없는 경우
+        """
+        path = self.path_for(cache_key)
+        try:
+            df = pd.read_parquet(path, filters=[('column', '==', str(column))])
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        if df.empty:
+            raise ValueError(f"'{column}' 컬럼의 시계열 데이터가 없습니다.")
+
+        series = []
+        for _, group in df.groupby('trace', sort=True):
+            series.append((group['name'].iloc[0], group['x'].reset_index(drop=True), group['y'].reset_index(drop=True)))
+        return series, bool(df['by_location'].iloc[0])
+
+    def _cleanup(self):
+        """보관 기간이 지난 시계열 파일 삭제"""
+        cutoff = time.time() - TIMESERIES_RETENTION
+        for path in self.store_dir.glob('*.parquet'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
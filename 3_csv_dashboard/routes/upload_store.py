@@ -0,0 +1,137 @@
+"""
+업로드 저장 모듈
+업로드 스트림을 고정 크기 청크로 디스크에 쓰면서 SHA-256을 함께 계산하고,
+임시 파일을 원자적으로 제자리에 옮기며 내용 해시로 중복 업로드를 판별하는 기능을 제공
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class StoredUpload(NamedTuple):
+    """업로드 저장 결과"""
+    filename: str
+    path: Path
+    file_hash: str
+    size: int
+    duplicate: bool
+
+
+def stream_to_temp(stream, directory: Path, chunk_size: int = UPLOAD_CHUNK_BYTES):
+    """
+    업로드 스트림을 같은 디렉토리의 임시 파일로 청크 단위 저장하며 SHA-256 계산
+
+    Args:
+        stream: read(size)를 지원하는 업로드 스트림
+        directory (Path): 임시 파일을 만들 디렉토리 (최종 위치와 같은 파일시스템이어야 원자적 이동 가능)
+        chunk_size (int): 청크 크기 (bytes)
+
+    Returns:
+        tuple: (임시 파일 경로, SHA-256 해시, 파일 크기)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, temp_name = tempfile.mkstemp(dir=directory, prefix='.upload-', suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in iter(lambda: stream.read(chunk_size), b''):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+    return Path(temp_name), digest.hexdigest(), size
+
+
+class UploadIndex:
+    """내용 해시 → 업로드 파일명 색인 (JSON 파일)"""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self, index: Dict[str, str]):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.index_path)
+
+    def lookup(self, file_hash: str, directory: Path) -> Optional[str]:
+        """
+        해시에 해당하는 기존 업로드 파일명 조회 (파일이 지워졌으면 None)
+
+        Args:
+            file_hash (str): 내용 해시
+            directory (Path): 업로드 디렉토리
+
+        Returns:
+            str: 파일명 또는 None
+        """
+        filename = self._load().get(file_hash)
+        if filename and (Path(directory) / filename).is_file():
+            return filename
+        return None
+
+    def record(self, file_hash: str, filename: str):
+        """해시와 파일명 등록 (같은 파일명의 이전 내용 해시는 제거)"""
+        with self._lock:
+            index = {h: name for h, name in self._load().items() if name != filename}
+            index[file_hash] = filename
+            self._save(index)
+
+    def forget(self, filename: str):
+        """파일명에 해당하는 해시 제거"""
+        with self._lock:
+            index = self._load()
+            remaining = {h: name for h, name in index.items() if name != filename}
+            if len(remaining) != len(index):
+                self._save(remaining)
+
+
+def store_upload(stream, directory: Path, filename: str, index: UploadIndex,
+                 chunk_size: int = UPLOAD_CHUNK_BYTES) -> StoredUpload:
+    """
+    업로드를 스트리밍 저장하고, 이미 있는 내용이면 기존 파일을 그대로 사용
+
+    Args:
+        stream: 업로드 스트림
+        directory (Path): 업로드 디렉토리
+        filename (str): 저장할 파일명 (secure_filename 처리된 이름)
+        index (UploadIndex): 내용 해시 색인
+        chunk_size (int): 청크 크기 (bytes)
+
+    Returns:
+        StoredUpload: 저장된(또는 중복으로 판별된 기존) 파일 정보
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    temp_path, file_hash, size = stream_to_temp(stream, directory, chunk_size)
+
+    existing = index.lookup(file_hash, directory)
+    if existing is not None:
+        temp_path.unlink()
+        return StoredUpload(existing, directory / existing, file_hash, size, True)
+
+    final_path = directory / filename
+    # mkstemp는 소유자 전용 권한으로 만들므로 일반 업로드 파일과 같은 권한으로 변경
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, final_path)
+    index.record(file_hash, filename)
+    return StoredUpload(filename, final_path, file_hash, size, False)
@@ -1,14 +1,25 @@
 import unittest
 import pandas as pd
+import numpy as np
 import tempfile
+import io
+import threading
 import os
+from unittest.mock import patch
 from pathlib import Path
 import sys
 
 # 상위 디렉토리의 모듈을 import하기 위한 경로 설정
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from routes.csv_analyzer import CSVAnalyzer
+from routes.csv_analyzer import CSVAnalyzer, ColumnStore, ColumnTypeInference, lttb_indices
+from routes.upload_store import UploadIndex, store_upload
+from routes.analysis_jobs import AnalysisJobQueue, QueueFullError
+from routes.spreadsheet_reader import list_sheets, read_sheet
+from routes.row_index import RowIndexStore
+from routes.timeseries_store import TimeseriesStore
+from routes.query_engine import QueryEngine, QueryError, SnapshotPendingError
+from module.analysis_cache import AnalysisCache, SQLiteCacheBackend, sanitize_json
 
 
 class TestCSVAnalyzer(unittest.TestCase):
@@ -121,6 +132,98 @@ class TestCSVAnalyzer(unittest.TestCase):
         self.assertIn('데이터1', results['summary_stats'])
         self.assertIn('데이터2', results['summary_stats'])
     
+    def test_컬럼_저장소_재사용(self):
+        """숫자 컬럼은 한 번만 변환되고 차트 생성 시 원본이 변경되지 않는지 테스트"""
+        test_data = {
+            '년도': ['2020', '2021', '2022'],
+            '지역': ['서울', '부산', '대구'],
+            '매출': ['1,000', '*', '2,500']
+        }
+        
+        csv_path = self.create_test_csv('저장소_테스트.csv', test_data)
+        
+        analyzer = CSVAnalyzer(csv_path)
+        results = analyzer.load_and_analyze_csv()
+        cleaned = analyzer.store.numeric_filled('매출')
+        
+        analyzer.generate_charts()
+        
+        # 같은 변환 결과를 재사용하고 원본 데이터는 그대로 유지
+        self.assertIs(analyzer.store.numeric_filled('매출'), cleaned)
+        self.assertEqual(cleaned.tolist(), [1000, 1, 2500])
+        self.assertEqual(results['summary_stats']['매출']['sum'], 3501)
+        self.assertEqual(analyzer.df['매출'].tolist(), ['1,000', '*', '2,500'])
+    
+    def test_표본_타입_판별_전체_검사(self):
+        """기준값 근처의 컬럼만 전체 검사로 넘기고, 표본으로 확실한 컬럼은 표본으로 판별하는지 테스트"""
+        rows = 200_000
+        rng = np.random.default_rng(5)
+        df = pd.DataFrame({
+            # 절반은 한 번씩만 나오는 값, 나머지는 같은 값 (고유값 비율 50.2%, 표본 추정치만으로는 50% 미만으로 보일 수 있음)
+            '메모': rng.permutation(np.concatenate([np.arange(1, rows // 2 + 401), np.zeros(rows // 2 - 400, dtype=int)])),
+            '사업자번호': rng.permutation(rows),
+            '매출': rng.integers(1000, 100000, rows).astype(str)
+        })
+        inference = ColumnTypeInference(ColumnStore(df), sample_rows=2_000)
+        
+        self.assertFalse(inference.is_categorical('메모'))
+        self.assertFalse(inference.is_categorical('사업자번호'))
+        self.assertTrue(inference.is_numeric('매출'))
+        self.assertEqual(inference.stats()['full_scan_columns'], ['메모'])
+    
+    def test_분포_차트_구간_집계(self):
+        """분포 차트가 원본 값 대신 구간별 빈도만 담는지 테스트"""
+        test_data = {
+            '지역': ['서울', '부산', '대구', '인천'] * 250,
+            '값': [str(i % 97) for i in range(1000)]
+        }
+        
+        csv_path = self.create_test_csv('분포_테스트.csv', test_data)
+        
+        analyzer = CSVAnalyzer(csv_path)
+        analyzer.load_and_analyze_csv()
+        charts = analyzer.generate_charts()
+        
+        trace = charts['distribution'][0]['traces'][0]
+        self.assertEqual(trace['type'], 'bar')
+        self.assertEqual(sum(trace['y']), 1000)
+        self.assertLess(len(trace['x']), 1000)
+        self.assertEqual(len(trace['x']), len(trace['width']))
+    
+    def test_시계열_다운샘플링(self):
+        """점이 많은 시계열은 LTTB로 줄이되 극값을 유지하고, 확대 구간은 원본 해상도로 조회하는지 테스트"""
+        values = np.sin(np.arange(5000) / 100.0) * 10 + 50
+        values[1234] = 500
+        csv_path = self.create_test_csv('일별.csv', {
+            '기준일': pd.date_range('2000-01-01', periods=5000, freq='D').strftime('%Y-%m-%d'),
+            '판매량': values.round(2)
+        })
+        
+        analyzer = CSVAnalyzer(csv_path)
+        analyzer.load_and_analyze_csv()
+        analyzer.max_points = 200
+        chart = analyzer.generate_charts()['timeseries'][0]
+        
+        self.assertTrue(chart['downsampled'])
+        self.assertEqual(chart['points']['total'], 5000)
+        self.assertLessEqual(len(chart['traces'][0]['y']), 202)
+        self.assertIn(500.0, chart['traces'][0]['y'])
+        self.assertEqual(chart['traces'][0]['x'][0], '2000-01-01')
+        
+        window = CSVAnalyzer.timeseries_window(analyzer.timeseries_series('판매량'), False, '2003-05-01', '2003-05-10')
+        self.assertFalse(window['downsampled'])
+        self.assertEqual(window['traces'][0]['x'], pd.date_range('2003-05-01', '2003-05-10').strftime('%Y-%m-%d').tolist())
+        
+        # 분석 작업이 저장해 둔 원본 시계열로 조회해도 같은 구간
+        store = TimeseriesStore(self.temp_path)
+        store.save('키', {'판매량': analyzer.timeseries_series('판매량')}, False)
+        series, by_location = store.load('키', '판매량')
+        self.assertEqual(CSVAnalyzer.timeseries_window(series, by_location, '2003-05-01', '2003-05-10'), window)
+        self.assertIsNone(store.load('없는 키', '판매량'))
+        
+        # 점 수가 목표 이하이면 그대로 유지
+        self.assertEqual(lttb_indices(values[:50], 200).tolist(), list(range(50)))
+    
     def test_빈_데이터_처리(self):
         """빈 데이터 및 결측값 처리 테스트"""
         test_data = {
@@ -190,6 +293,195 @@ class TestCSVAnalyzer(unittest.TestCase):
         self.assertEqual(results['file_info']['rows'], 2)
 
 
+    def test_CP949_인코딩_판별(self):
+        """CP949 파일의 인코딩을 판별하여 한 번에 읽는지 테스트"""
+        df = pd.DataFrame({
+            '년도': ['2020', '2021'],
+            '지역': ['경상북도', '대구광역시'],
+            '사업체수': ['1,200', '3,400']
+        })
+        csv_path = self.temp_path / '인코딩_cp949.csv'
+        df.to_csv(csv_path, index=False, encoding='cp949')
+        
+        analyzer = CSVAnalyzer(str(csv_path))
+        results = analyzer.load_and_analyze_csv()
+        
+        self.assertNotIn('error', results)
+        self.assertEqual(results['file_info']['encoding'], 'cp949')
+        self.assertEqual(results['sample_data'][0]['지역'], '경상북도')
+    
+    def test_인코딩_판별_실패시_재시도(self):
+        """판별한 인코딩으로 읽다가 디코딩 오류가 나면 다음 인코딩으로 다시 읽는지 테스트"""
+        csv_path = self.temp_path / '뒤쪽_한글.csv'
+        csv_path.write_bytes('code,value\nA1,1\n서울,2\n'.encode('cp949'))
+        
+        # 샘플 범위(8MB) 밖에서 처음 한글이 나와 UTF-8로 잘못 판별된 경우
+        with patch('module.encoding_sniffer.sniff_encoding', return_value='utf-8'):
+            results = CSVAnalyzer(str(csv_path)).load_and_analyze_csv()
+        
+        self.assertNotIn('error', results)
+        self.assertEqual(results['file_info']['encoding'], 'cp949')
+        self.assertEqual(results['file_info']['rows'], 2)
+    
+    def test_엑셀_시트_분석(self):
+        """Excel 통합문서의 시트를 스트리밍으로 읽어 같은 파이프라인으로 분석하는지 테스트"""
+        xlsx_path = self.temp_path / '통합문서.xlsx'
+        regional = pd.DataFrame({
+            '지역': ['서울', '부산', '대구', '인천', '광주'],
+            '사업체수': [100, 200, 300, 400, 500]
+        })
+        with pd.ExcelWriter(xlsx_path) as writer:
+            pd.DataFrame({'메모': ['표지']}).to_excel(writer, sheet_name='표지', index=False)
+            regional.to_excel(writer, sheet_name='지역별', index=False)
+        
+        # 조각 단위로 읽어도 한 번에 읽은 결과와 같아야 함
+        pd.testing.assert_frame_equal(read_sheet(xlsx_path, '지역별', chunk_rows=2), regional)
+        
+        analyzer = CSVAnalyzer(str(xlsx_path), sheet='지역별')
+        results = analyzer.load_and_analyze_csv()
+        
+        self.assertNotIn('error', results)
+        self.assertEqual(results['file_info']['sheets'], ['표지', '지역별'])
+        self.assertEqual(results['file_info']['sheet'], '지역별')
+        self.assertEqual(results['file_info']['rows'], 5)
+        self.assertIn('지역', results['columns']['location_columns'])
+        self.assertEqual(results['summary_stats']['사업체수']['sum'], 1500)
+        
+        # xlrd가 없으면 .xls 시트 목록도 안내 문구와 함께 ValueError
+        xls_path = self.temp_path / '이전형식.xls'
+        xls_path.write_bytes(b'')
+        with patch('pandas.ExcelFile', side_effect=ImportError("Missing optional dependency 'xlrd'")):
+            with self.assertRaisesRegex(ValueError, 'xlrd 패키지가 필요합니다'):
+                list_sheets(xls_path)
+    
+    def test_분석_캐시_저장_조회(self):
+        """같은 내용의 파일은 캐시된 분석 결과를 돌려주는지 테스트"""
+        csv_path = self.create_test_csv('캐시.csv', {
+            '지역': ['서울', '부산', '대구'],
+            '사업체수': ['100', '*', None]
+        })
+        analyzer = CSVAnalyzer(csv_path)
+        results = analyzer.load_and_analyze_csv()
+        charts = analyzer.generate_charts()
+        
+        cache = AnalysisCache(SQLiteCacheBackend(self.temp_path / 'cache.sqlite3'))
+        file_hash = cache.file_hash(csv_path)
+        self.assertIsNone(cache.get(file_hash))
+        
+        cache.put(file_hash, '캐시.csv', results, charts)
+        cached_results, cached_charts = cache.get(file_hash)
+        
+        self.assertEqual(cached_results['file_info']['rows'], 3)
+        self.assertIsNone(cached_results['sample_data'][2]['사업체수'])
+        self.assertEqual(cached_charts.keys(), charts.keys())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+    
+    def test_중복_업로드_판별(self):
+        """같은 내용을 다른 이름으로 올리면 기존 파일을 사용하는지 테스트"""
+        content = '지역,사업체수\n서울,100\n부산,200\n'.encode('utf-8')
+        upload_dir = self.temp_path
+        index = UploadIndex(self.temp_path / 'upload_index.json')
+        
+        first = store_upload(io.BytesIO(content), upload_dir, 'a.csv', index, chunk_size=8)
+        second = store_upload(io.BytesIO(content), upload_dir, 'b.csv', index, chunk_size=8)
+        
+        self.assertFalse(first.duplicate)
+        self.assertTrue(second.duplicate)
+        self.assertEqual(second.filename, 'a.csv')
+        self.assertEqual(first.file_hash, second.file_hash)
+        self.assertEqual((upload_dir / 'a.csv').read_bytes(), content)
+        self.assertFalse((upload_dir / 'b.csv').exists())
+        self.assertEqual(list(upload_dir.glob('.upload-*')), [])
+    
+    def test_행_위치_색인_페이지_조회(self):
+        """행 위치 색인으로 따옴표 안 줄바꿈과 빈 줄이 있어도 요청한 행만 읽는지 테스트"""
+        csv_path = self.temp_path / '행.csv'
+        csv_path.write_bytes('지역,메모\r\n서울,"첫 줄\r\n둘째 줄"\r\n\r\n부산,"따옴표 ""포함"""\r\n대구,\r\n'.encode('cp949'))
+        store = RowIndexStore(self.temp_path)
+        
+        page = store.read_page(csv_path, 1, 5)
+        
+        self.assertEqual(page['total_rows'], 3)
+        self.assertEqual(page['columns'], ['지역', '메모'])
+        self.assertEqual(page['rows'], [
+            {'지역': '부산', '메모': '따옴표 "포함"'},
+            {'지역': '대구', '메모': None}
+        ])
+        self.assertEqual(store.read_page(csv_path, 0, 1)['rows'][0]['메모'], '첫 줄\r\n둘째 줄')
+
+        # 필드 중간의 따옴표는 인용 필드를 열지 않음 (pandas와 같은 행 수)
+        inch_path = self.temp_path / '인치.csv'
+        inch_path.write_bytes(b'name,size\nmonitor,27" wide\nlaptop,13\ndesk,5\n')
+        page = store.read_page(inch_path, 1, 2)
+
+        self.assertEqual(page['total_rows'], 3)
+        self.assertEqual(page['rows'], [{'name': 'laptop', 'size': '13'}, {'name': 'desk', 'size': '5'}])
+    
+    def test_분석_작업_대기열(self):
+        """대기열이 가득 차면 작업을 거절하고, 끝난 작업의 진행 상황과 결과를 조회하는지 테스트"""
+        queue = AnalysisJobQueue(self.temp_path / 'jobs', max_workers=1, max_queued=0)
+        release = threading.Event()
+        
+        def task(progress):
+            progress('loading', 10)
+            release.wait(5)
+            return {'rows': 10}
+        
+        job_id = queue.submit('a', task, filename='a.csv')
+        self.assertEqual(queue.submit('a', task, filename='a.csv'), job_id)
+        with self.assertRaises(QueueFullError):
+            queue.submit('b', task, filename='b.csv')
+        
+        release.set()
+        queue._executor.shutdown(wait=True)
+        
+        status = queue.status(job_id)
+        self.assertEqual(status['state'], 'done')
+        self.assertEqual(status['rows_processed'], 10)
+        self.assertEqual(status['filename'], 'a.csv')
+        self.assertEqual(queue.result(job_id), {'rows': 10})
+        for path in (self.temp_path / 'jobs').glob('*'):
+            path.unlink()
+        (self.temp_path / 'jobs').rmdir()
+    
+    @unittest.skipUnless(QueryEngine.available(), 'duckdb가 설치되지 않음')
+    def test_SQL_질의(self):
+        """업로드 파일을 테이블로 질의하고, 행 수 제한과 읽기 전용 제한을 지키는지 테스트"""
+        self.create_test_csv('2024_매출.csv', {
+            '지역': ['서울', '부산', '서울', '대구'],
+            '매출': [10, 20, 30, 35]
+        })
+        self.create_test_csv('지역.csv', {
+            '지역': ['서울', '부산'],
+            '권역': ['수도권', '동남권']
+        })
+        engine = QueryEngine(self.temp_path, self.temp_path / 'parquet', max_rows=2)
+        join_sql = 'SELECT 권역, SUM(매출) AS 합계 FROM t_2024_매출 JOIN 지역 USING (지역) GROUP BY 권역 ORDER BY 합계 DESC'
+        
+        # 스냅샷은 요청 안에서 만들지 않고 필요한 테이블을 알려줌 (USING JOIN도 등록 전에 해석)
+        with self.assertRaises(SnapshotPendingError) as pending:
+            engine.execute(join_sql, {'csv'})
+        self.assertEqual(sorted(pending.exception.tables), ['t_2024_매출', '지역'])
+        engine.build_snapshots(pending.exception.tables)
+        self.assertEqual(sanitize_json(engine.execute(join_sql, {'csv'})['table'].to_pylist()),
+                         [{'권역': '수도권', '합계': 40}, {'권역': '동남권', '합계': 20}])
+        
+        result = engine.execute('SELECT 지역, SUM(매출) AS 합계 FROM t_2024_매출 GROUP BY 지역 ORDER BY 합계 DESC;', {'csv'})
+        
+        self.assertEqual(sanitize_json(result['table'].to_pylist()), [{'지역': '서울', '합계': 40}, {'지역': '대구', '합계': 35}])
+        self.assertTrue(result['truncated'])
+        self.assertEqual(engine.execute('SELECT 매출 FROM t_2024_매출 ORDER BY 매출', {'csv'}, offset=3)['table'].to_pylist(),
+                         [{'매출': 35}])
+        for sql in ('DELETE FROM t_2024_매출', 'SELECT 1; SELECT 2', "SELECT * FROM read_csv_auto('/etc/passwd')",
+                    'SELEC 1', "SELECT * FROM query('SELEC 1')"):
+            with self.assertRaises(QueryError):
+                engine.execute(sql, {'csv'})
+        
+        engine.forget('2024_매출.csv')
+        engine.forget('지역.csv')
+        (self.temp_path / 'parquet').rmdir()
+
+
 class TestCSVDashboardIntegration(unittest.TestCase):
     """통합 테스트"""
     
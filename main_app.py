@@ -4,11 +4,10 @@ Flask 기반 데이터 분석 대시보드 시스템
 동적 카테고리 폴더 검색 및 라우트 자동 생성을 지원하는 메인 애플리케이션
 """
 
-from flask import Flask, render_template
+from flask import Flask, render_template, request, jsonify
 from pathlib import Path
 import re
 import sys
-import importlib.util
 import os
 from dotenv import load_dotenv
 
@@ -19,6 +18,10 @@ load_dotenv()
 from module.menu_generator import MenuGenerator
 from module.markdown_renderer import MarkdownRenderer
 from module.api_routes import APIRoutes
+from module.db_config import is_cloudtype_environment
+from module.giup_dataset import get_giup_dataset
+from module.route_loader import route_module_cache
+from module.page_cache import PageCache, UncachedHTML, directory_signature
 
 
 def create_app():
@@ -33,6 +36,8 @@ def create_app():
     # 기본 설정
     app.config['SECRET_KEY'] = 'csv_dashboard_secret_key_2024'  # 세션 및 보안을 위한 시크릿 키
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB 최대 파일 크기 제한
+    app.config['PAGE_CACHE_MAX_BYTES'] = int(os.getenv('PAGE_CACHE_MAX_BYTES', 64 * 1024 * 1024))  # 렌더링 페이지 캐시 용량
+    app.config['PAGE_CACHE_ROUTES'] = ('dash1', 'dash2', 'dash3')  # 데이터 파일에만 의존하는 캐시 대상 라우트
 
     # 템플릿에서 사용할 유틸리티 함수들을 등록
     @app.context_processor
@@ -84,6 +89,8 @@ def register_giup_routes(app):
     try:
         giup_base = Path("1_giup")
         markdown_renderer = MarkdownRenderer()
+        page_cache = PageCache(app.config['PAGE_CACHE_MAX_BYTES'])
+        dataset = get_giup_dataset(giup_base / "data")
 
         # 1_giup 메인 페이지
         @app.route("/1_giup", endpoint="giup_index")
@@ -102,19 +109,34 @@ def register_giup_routes(app):
         def giup_route_exec(filename):
             """routes 폴더의 .py 파일을 동적으로 실행"""
             try:
-                menu_items = MenuGenerator.get_giup_menu_items(giup_base)
-                route_content = execute_route_module(giup_base / "routes", filename)
-
-                if is_complete_html(route_content):
-                    return MenuGenerator.inject_navbar_to_html(route_content, menu_items, filename)
-                else:
-                    return render_template('category_with_navbar.html',
-                                         menu_items=menu_items,
-                                         content=route_content,
-                                         category_name="1_giup")
+                # 데이터 기반 대시보드의 GET 요청은 렌더링 결과 캐시 사용
+                if request.method == 'GET' and filename in app.config['PAGE_CACHE_ROUTES']:
+                    cache_key = (
+                        filename,
+                        dataset.source_version(),
+                        directory_signature(giup_base / "markdown_docs",
+                                            giup_base / "html_docs",
+                                            giup_base / "routes")
+                    )
+                    page = page_cache.get(cache_key)
+                    if page is None:
+                        html = render_giup_route(giup_base, filename)
+                        # 데이터 로드 실패 안내 등은 캐시하지 않고 다음 요청에서 다시 렌더링
+                        if isinstance(html, UncachedHTML):
+                            return html
+                        page = page_cache.put(cache_key, html)
+                    return page_cache.respond(page, request)
+
+                return render_giup_route(giup_base, filename)
             except Exception as e:
                 return f"<h1>오류 발생</h1><pre>{str(e)}</pre>"
 
+        # 렌더링 페이지 캐시 통계
+        @app.route("/1_giup/api/page_cache_stats")
+        def giup_page_cache_stats():
+            """렌더링 페이지 캐시 적중/미스 횟수 반환"""
+            return jsonify(page_cache.stats())
+
         # HTML 문서 표시 (html_docs 폴더)
         @app.route("/1_giup/html/<filename>")
         def giup_html_view(filename):
@@ -160,6 +182,15 @@ def register_giup_routes(app):
         # API 엔드포인트들 등록
         APIRoutes(app, giup_base)
 
+        # 집계표 패널 사전 로드 (gunicorn preload_app 시 마스터에서 한 번 게시 후 워커들이 공유)
+        try:
+            dataset.warm()
+        except Exception as e:
+            print(f"집계표 패널 사전 로드 실패: {e}")
+
+        # PostgreSQL 접속 환경 판별 (DNS 조회는 시작 시 한 번만 수행, 워커들은 결과를 물려받음)
+        is_cloudtype_environment()
+
         print("1_giup 동적 라우트 시스템 등록 완료")
 
     except Exception as e:
@@ -237,6 +268,30 @@ def get_first_markdown_content(giup_base, markdown_renderer):
     return "<p>표시할 마크다운 파일이 없습니다.</p>"
 
 
+def render_giup_route(giup_base, filename):
+    """
+    1_giup routes 모듈을 실행하고 상단 메뉴를 포함한 페이지 HTML 생성
+
+    Args:
+        giup_base (Path): 1_giup 폴더 경로
+        filename (str): 실행할 파일명 (확장자 제외)
+
+    Returns:
+        str: 완성된 페이지 HTML (모듈이 UncachedHTML을 반환하면 페이지도 UncachedHTML)
+    """
+    menu_items = MenuGenerator.get_giup_menu_items(giup_base)
+    route_content = execute_route_module(giup_base / "routes", filename)
+
+    if is_complete_html(route_content):
+        page = MenuGenerator.inject_navbar_to_html(route_content, menu_items, filename)
+    else:
+        page = render_template('category_with_navbar.html',
+                             menu_items=menu_items,
+                             content=route_content,
+                             category_name="1_giup")
+    return UncachedHTML(page) if isinstance(route_content, UncachedHTML) else page
+
+
 def execute_route_module(routes_dir, filename):
     """
     routes 폴더의 파이썬 모듈을 동적으로 실행
@@ -248,12 +303,8 @@ def execute_route_module(routes_dir, filename):
     Returns:
         str: 모듈의 render() 함수 실행 결과
     """
-    sys.path.insert(0, str(routes_dir))
-
-    # 모듈 동적 임포트
-    spec = importlib.util.spec_from_file_location(filename, routes_dir / f"{filename}.py")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    # 모듈 캐시에서 가져오기 (파일이 변경된 경우에만 다시 임포트)
+    module = route_module_cache.load(routes_dir, filename)
 
     # render 함수 실행
     if hasattr(module, 'render'):
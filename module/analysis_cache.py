@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+CSV 분석 결과 캐시 모듈
+파일 내용의 SHA-256 해시를 키로 분석 결과와 차트 데이터를 csv_analysis_cache 테이블(MariaDB)이나
+로컬 SQLite 파일에 보관하여, 같은 파일을 다시 볼 때 분석을 생략하는 기능을 제공
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(file_path):
+    """
+    파일 내용의 SHA-256 해시 계산 (1MB 단위로 읽음)
+
+    Args:
+        file_path (Path): 파일 경로
+
+    Returns:
+        str: 64자리 16진수 해시
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sanitize_json(value):
+    """
+    JSON 컬럼에 저장할 수 있도록 값 정리 (NaN/무한대 → None, numpy/Decimal 타입 → 파이썬 숫자)
+
+    Args:
+        value: 분석 결과 또는 차트 데이터
+
+    Returns:
+        표준 JSON으로 직렬화 가능한 값
+    """
+    if isinstance(value, dict):
+        return {str(k): sanitize_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [sanitize_json(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return sanitize_json(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, Decimal):
+        value = int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _dumps(value):
+    return json.dumps(sanitize_json(value), ensure_ascii=False, allow_nan=False)
+
+
+class SQLiteCacheBackend:
+    """로컬 SQLite 파일에 분석 결과를 저장하는 캐시 저장소 (MariaDB가 없는 배포용)"""
+
+    name = 'sqlite'
+
+    def __init__(self, db_path):
+        """
+        SQLite 저장소 초기화
+
+        Args:
+            db_path (Path): SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS csv_analysis_cache (
+                    file_hash TEXT PRIMARY KEY,
+                    file_name TEXT NOT NULL,
+                    analysis_result TEXT NOT NULL,
+                    chart_data TEXT,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed_at ON csv_analysis_cache (accessed_at)")
+
+    def _connect(self):
+        # 여러 워커 프로세스가 같은 파일을 쓰므로 잠금 대기 시간을 둠
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def get(self, file_hash):
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT analysis_result, chart_data FROM csv_analysis_cache WHERE file_hash = ?",
+                (file_hash,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE csv_analysis_cache SET accessed_at = ? WHERE file_hash = ?",
+                         (time.time(), file_hash))
+            return row
+
+    def put(self, file_hash, file_name, analysis_json, chart_json):
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                INSERT INTO csv_analysis_cache
+                    (file_hash, file_name, analysis_result, chart_data, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(file_hash) DO UPDATE SET
+                    file_name = excluded.file_name,
+                    analysis_result = excluded.analysis_result,
+                    chart_data = excluded.chart_data,
+                    accessed_at = excluded.accessed_at
+            """, (file_hash, file_name, analysis_json, chart_json, now, now))
+
+    def evict(self, max_age_seconds, max_bytes):
+        with closing(self._connect()) as conn, conn:
+            removed = conn.execute("DELETE FROM csv_analysis_cache WHERE accessed_at < ?",
+                                   (time.time() - max_age_seconds,)).rowcount
+            rows = conn.execute("""
+                SELECT file_hash, LENGTH(analysis_result) + IFNULL(LENGTH(chart_data), 0)
+                FROM csv_analysis_cache ORDER BY accessed_at DESC
+            """).fetchall()
+            stale = _over_budget(rows, max_bytes)
+            conn.executemany("DELETE FROM csv_analysis_cache WHERE file_hash = ?", [(h,) for h in stale])
+            return removed + len(stale)
+
+    def summary(self):
+        with closing(self._connect()) as conn:
+            count, size = conn.execute("""
+                SELECT COUNT(*), IFNULL(SUM(LENGTH(analysis_result) + IFNULL(LENGTH(chart_data), 0)), 0)
+                FROM csv_analysis_cache
+            """).fetchone()
+            return {'entries': count, 'bytes': size}
+
+
+class MariaDBCacheBackend:
+    """database/init/01-init.sql의 csv_analysis_cache 테이블(MariaDB/MySQL)을 사용하는 캐시 저장소"""
+
+    name = 'mariadb'
+
+    def _connect(self):
+        from .db_config import get_db_connection
+        return get_db_connection()
+
+    def get(self, file_hash):
+        with closing(self._connect()) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT analysis_result, chart_data FROM csv_analysis_cache WHERE file_hash = %s",
+                    (file_hash,)
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                cursor.execute("UPDATE csv_analysis_cache SET accessed_at = CURRENT_TIMESTAMP WHERE file_hash = %s",
+                               (file_hash,))
+            conn.commit()
+            return row['analysis_result'], row['chart_data']
+
+    def put(self, file_hash, file_name, analysis_json, chart_json):
+        with closing(self._connect()) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    INSERT INTO csv_analysis_cache (file_hash, file_name, analysis_result, chart_data)
+                    VALUES (%s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                        file_name = VALUES(file_name),
+                        analysis_result = VALUES(analysis_result),
+                        chart_data = VALUES(chart_data),
+                        accessed_at = CURRENT_TIMESTAMP
+                """, (file_hash, file_name[:255], analysis_json, chart_json))
+            conn.commit()
+
+    def evict(self, max_age_seconds, max_bytes):
+        with closing(self._connect()) as conn:
+            with conn.cursor() as cursor:
+                removed = cursor.execute(
+                    "DELETE FROM csv_analysis_cache WHERE accessed_at < NOW() - INTERVAL %s SECOND",
+                    (int(max_age_seconds),)
+                )
+                cursor.execute("""
+                    SELECT file_hash, LENGTH(analysis_result) + IFNULL(LENGTH(chart_data), 0) AS size
+                    FROM csv_analysis_cache ORDER BY accessed_at DESC
+                """)
+                stale = _over_budget([(row['file_hash'], row['size']) for row in cursor.fetchall()], max_bytes)
+                if stale:
+                    cursor.executemany("DELETE FROM csv_analysis_cache WHERE file_hash = %s", stale)
+            conn.commit()
+            return removed + len(stale)
+
+    def summary(self):
+        with closing(self._connect()) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT COUNT(*) AS entries,
+                           IFNULL(SUM(LENGTH(analysis_result) + IFNULL(LENGTH(chart_data), 0)), 0) AS bytes
+                    FROM csv_analysis_cache
+                """)
+                row = cursor.fetchone()
+                return {'entries': row['entries'], 'bytes': int(row['bytes'])}
+
+
+def _over_budget(rows, max_bytes):
+    """최근 사용 순 (해시, 크기) 목록에서 용량 한도를 넘는 오래된 항목의 해시 목록"""
+    total = 0
+    stale = []
+    for file_hash, size in rows:
+        total += size or 0
+        if total > max_bytes:
+            stale.append(file_hash)
+    return stale
+
+
+class AnalysisCache:
+    """파일 내용 해시 기준 CSV 분석 결과 캐시 클래스"""
+
+    def __init__(self, backend=None, max_age_days=None, max_bytes=None):
+        """
+        분석 캐시 초기화
+
+        Args:
+            backend: 캐시 저장소 (None이면 CSV_ANALYSIS_CACHE 환경변수: 'sqlite'(기본), 'mariadb', 'off')
+            max_age_days (float): 마지막 조회 후 보관 기간 (None이면 CSV_ANALYSIS_CACHE_MAX_AGE_DAYS, 기본 30일)
+            max_bytes (int): 저장 용량 한도 (None이면 CSV_ANALYSIS_CACHE_MAX_BYTES, 기본 256MB)
+        """
+        self._backend = backend
+        self._backend_ready = backend is not None
+        self.max_age_days = float(max_age_days or os.getenv('CSV_ANALYSIS_CACHE_MAX_AGE_DAYS', 30))
+        self.max_bytes = int(max_bytes or os.getenv('CSV_ANALYSIS_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+        self._hashes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.evictions = 0
+
+    @property
+    def backend(self):
+        """캐시 저장소 (처음 사용할 때 생성, 사용할 수 없으면 None)"""
+        if not self._backend_ready:
+            with self._lock:
+                if not self._backend_ready:
+                    self._backend = self._create_backend()
+                    self._backend_ready = True
+        return self._backend
+
+    @staticmethod
+    def _create_backend():
+        kind = os.getenv('CSV_ANALYSIS_CACHE', 'sqlite').lower()
+        try:
+            if kind == 'mariadb':
+                return MariaDBCacheBackend()
+            if kind == 'sqlite':
+                default_path = Path(__file__).parent.parent / '3_csv_dashboard' / 'data' / '.cache' / 'csv_analysis_cache.sqlite3'
+                return SQLiteCacheBackend(os.getenv('CSV_ANALYSIS_CACHE_PATH', default_path))
+        except Exception as e:
+            print(f"CSV 분석 캐시를 사용할 수 없습니다 ({kind}): {e}")
+        return None
+
+    def file_hash(self, file_path):
+        """
+        파일 내용 해시 (경로/크기/수정시각이 같으면 프로세스 안에서 다시 계산하지 않음)
+
+        Args:
+            file_path (Path): 파일 경로
+
+        Returns:
+            str: SHA-256 해시
+        """
+        key = self._hash_key(file_path)
+        file_hash = self._hashes.get(key)
+        if file_hash is None:
+            file_hash = file_sha256(file_path)
+            self.remember_hash(file_path, file_hash)
+        return file_hash
+
+    @staticmethod
+    def _hash_key(file_path):
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        return str(file_path.resolve()), stat.st_size, stat.st_mtime_ns
+
+    def remember_hash(self, file_path, file_hash):
+        """
+        이미 계산된 파일 해시 등록 (업로드 중 계산한 해시를 분석 시 다시 계산하지 않도록)
+
+        Args:
+            file_path (Path): 파일 경로
+            file_hash (str): SHA-256 해시
+        """
+        key = self._hash_key(file_path)
+        with self._lock:
+            self._hashes[key] = file_hash
+
+    def get(self, file_hash):
+        """
+        캐시된 분석 결과 조회 (조회 시각 갱신)
+
+        Args:
+            file_hash (str): 파일 내용 해시
+
+        Returns:
+            tuple: (분석 결과 dict, 차트 dict) - 없으면 None
+        """
+        backend = self.backend
+        if backend is None:
+            return None
+        try:
+            row = backend.get(file_hash)
+        except Exception as e:
+            self.errors += 1
+            print(f"CSV 분석 캐시 조회 실패: {e}")
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        analysis_json, chart_json = row
+        return json.loads(analysis_json), (json.loads(chart_json) if chart_json else None)
+
+    def put(self, file_hash, file_name, analysis, charts):
+        """
+        분석 결과 저장 후 오래되었거나 용량을 넘는 항목 제거
+
+        Args:
+            file_hash (str): 파일 내용 해시
+            file_name (str): 파일명
+            analysis (dict): 분석 결과
+            charts (dict): 차트 데이터
+        """
+        backend = self.backend
+        if backend is None:
+            return
+        try:
+            backend.put(file_hash, file_name, _dumps(analysis), _dumps(charts) if charts is not None else None)
+            self.evictions += backend.evict(self.max_age_days * 86400, self.max_bytes)
+        except Exception as e:
+            self.errors += 1
+            print(f"CSV 분석 캐시 저장 실패: {e}")
+
+    def stats(self):
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: 저장소 종류, 적중/미스/오류/제거 횟수, 저장된 항목 수와 용량
+        """
+        stats = {
+            'backend': self.backend.name if self.backend is not None else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'errors': self.errors,
+            'evictions': self.evictions,
+            'max_age_days': self.max_age_days,
+            'max_bytes': self.max_bytes
+        }
+        if self.backend is not None:
+            try:
+                stats.update(self.backend.summary())
+            except Exception as e:
+                stats['summary_error'] = str(e)
+        return stats
+
+
+# 프로세스 공유 분석 캐시
+analysis_cache = AnalysisCache()
@@ -4,13 +4,14 @@ API 라우트 모듈
 1_giup 카테고리의 API 엔드포인트들을 관리
 """
 
-import sys
 import os
-import importlib.util
 from pathlib import Path
 from flask import request, jsonify, send_file
 
 from .pdf_generator import PDFGenerator
+from .chart_cache import chart_cache
+from .db_config import get_pool_stats
+from .route_loader import route_module_cache
 
 
 class APIRoutes:
@@ -33,6 +34,9 @@ class APIRoutes:
         """API 라우트들을 등록"""
         self._register_dash3_update()
         self._register_dash3_export_pdf()
+        self._register_route_cache_stats()
+        self._register_chart_cache_stats()
+        self._register_db_pool_stats()
 
     def _register_dash3_update(self):
         """dash3 업데이트 API 등록"""
@@ -47,10 +51,8 @@ class APIRoutes:
                 # dash3 모듈 동적 로드
                 dash3_module = self._load_dash3_module()
 
-                # 데이터 로드 및 차트 생성
-                df, sido_list, industry_list, years, months = dash3_module.load_data()
-                region_chart = dash3_module.create_region_table_chart(df, year, month)
-                industry_chart = dash3_module.create_industry_table_chart(df, year, month)
+                # 차트 캐시 조회 (없을 때만 데이터 로드 및 차트 생성)
+                region_chart, industry_chart = dash3_module.get_cached_charts(year, month)
 
                 return jsonify({
                     'success': True,
@@ -78,9 +80,7 @@ class APIRoutes:
                 # dash3 모듈 로드 및 데이터 생성
                 dash3_module = self._load_dash3_module()
 
-                df, _, _, _, _ = dash3_module.load_data()
-                region_chart = dash3_module.create_region_table_chart(df, year, month)
-                industry_chart = dash3_module.create_industry_table_chart(df, year, month)
+                region_chart, industry_chart = dash3_module.get_cached_charts(year, month)
 
                 # PDF 생성
                 output_dir = self.giup_base / "output"
@@ -109,18 +109,32 @@ class APIRoutes:
             except Exception as e:
                 return f"PDF 생성 오류: {str(e)}", 500
 
+    def _register_route_cache_stats(self):
+        """라우트 모듈 캐시 통계 API 등록"""
+        @self.app.route("/1_giup/api/route_cache_stats")
+        def route_cache_stats():
+            """라우트 모듈 캐시 적중/미스 횟수 반환"""
+            return jsonify(route_module_cache.stats())
+
+    def _register_chart_cache_stats(self):
+        """차트 캐시 통계 API 등록"""
+        @self.app.route("/1_giup/api/chart_cache_stats")
+        def chart_cache_stats():
+            """dash3 차트 캐시 적중/미스 횟수 반환"""
+            return jsonify(chart_cache.stats())
+
+    def _register_db_pool_stats(self):
+        """PostgreSQL 연결 풀 통계 API 등록"""
+        @self.app.route("/1_giup/api/db_pool_stats")
+        def db_pool_stats():
+            """현재 워커의 연결 대여 횟수와 대기 시간 반환"""
+            return jsonify(get_pool_stats())
+
     def _load_dash3_module(self):
         """
-        dash3 모듈을 동적으로 로드
+        dash3 모듈 로드 (라우트 모듈 캐시 사용, 페이지 라우트와 같은 모듈 공유)
 
         Returns:
             module: 로드된 dash3 모듈
         """
-        routes_dir = self.giup_base / "routes"
-        sys.path.insert(0, str(routes_dir))
-
-        spec = importlib.util.spec_from_file_location("dash3", routes_dir / "dash3.py")
-        dash3_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(dash3_module)
-
-        return dash3_module
\ No newline at end of file
+        return route_module_cache.load(self.giup_base / "routes", "dash3")
\ No newline at end of file
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+PostgreSQL 대량 적재 모듈
+DataFrame을 COPY FROM STDIN(CSV)으로 하나의 트랜잭션에서 적재하고,
+적재할 수 없는 행은 행 단위 오류 보고서로 돌려주는 기능을 제공
+"""
+
+import io
+import time
+from typing import List, NamedTuple
+
+import pandas as pd
+
+
+# giup_statistics 적재 컬럼 (기준년월 + 집계표 컬럼, 테이블 정의 순서)
+GIUP_TABLE = 'giup_statistics'
+GIUP_TEXT_COLUMNS = {'기준년월': 10, '시도': 50, '시군구': 50}
+GIUP_NUMERIC_COLUMNS = {'매출액': (20, 2), '평균종사자수': (15, 2)}
+GIUP_COLUMNS = [
+    '기준년월', '시도', '시군구',
+    '기업체수', '임시및일용근로자수', '상용근로자수', '매출액', '근로자수',
+    '총종사자수', '평균종사자수', '등록일자수', '개업일자수', '폐업일자수',
+    '기업_1', '기업_2', '기업_3', '기업_4', '기업_5', '법인구분코드합계',
+    '폐업_1', '폐업_2', '폐업_3', '폐업_4', '폐업_99',
+    '산업_A', '산업_B', '산업_C', '산업_D', '산업_E', '산업_F',
+    '산업_G', '산업_H', '산업_I', '산업_J', '산업_K', '산업_L',
+    '산업_M', '산업_N', '산업_O', '산업_P', '산업_Q', '산업_R', '산업_S'
+]
+
+# PostgreSQL INTEGER 범위
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+class RowError(NamedTuple):
+    """적재하지 못한 행 정보"""
+    row: object
+    column: str
+    value: object
+    message: str
+
+
+class LoadReport:
+    """대량 적재 결과 (성공 건수, 행 단위 오류, 처리 속도)"""
+
+    def __init__(self, table):
+        self.table = table
+        self.inserted = 0
+        self.errors: List[RowError] = []
+        self.batches = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_sec(self):
+        """초당 적재 행 수"""
+        return self.inserted / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        """
+        결과 요약 문자열
+
+        Returns:
+            str: 성공/실패 건수와 처리 속도
+        """
+        return (f"{self.table} COPY 적재: {self.inserted}건 성공, {len(self.errors)}건 실패, "
+                f"{self.elapsed:.2f}초 ({self.rows_per_sec:,.0f} rows/sec, 배치 {self.batches}개)")
+
+
+def prepare_giup_frame(df, yearmonth):
+    """
+    집계표 DataFrame을 giup_statistics 컬럼 순서/타입에 맞게 변환하고 적재 불가 행을 걸러냄
+
+    Args:
+        df (pandas.DataFrame): load_excel_data()로 읽은 집계표 (컬럼명의 괄호는 언더스코어로 변경된 상태)
+        yearmonth (str): 기준년월
+
+    Returns:
+        tuple: (적재할 DataFrame, RowError 리스트)
+    """
+    frame = pd.DataFrame(index=df.index)
+    invalid = pd.Series(False, index=df.index)
+    errors = []
+
+    def reject(mask, column, values, message):
+        for idx in mask[mask & ~invalid].index:
+            errors.append(RowError(idx, column, values[idx], message))
+        invalid.loc[mask] = True
+
+    for col in GIUP_COLUMNS:
+        if col == '기준년월':
+            frame[col] = str(yearmonth)
+            continue
+        if col not in df.columns:
+            raise KeyError(f"집계표에 '{col}' 컬럼이 없습니다.")
+
+        values = df[col]
+        if col in GIUP_TEXT_COLUMNS:
+            text = values.astype(object).where(values.isna(), values.astype(str))
+            lengths = text.astype(str).str.len().where(text.notna(), 0)
+            reject(lengths > GIUP_TEXT_COLUMNS[col], col, values, f"{GIUP_TEXT_COLUMNS[col]}자 초과")
+            frame[col] = text
+            continue
+
+        numbers = pd.to_numeric(values, errors='coerce')
+        reject(values.notna() & numbers.isna(), col, values, "숫자가 아닌 값")
+
+        if col in GIUP_NUMERIC_COLUMNS:
+            precision, scale = GIUP_NUMERIC_COLUMNS[col]
+            reject(numbers.abs() >= 10.0 ** (precision - scale), col, values,
+                   f"NUMERIC({precision}, {scale}) 범위 초과")
+            frame[col] = numbers.round(scale)
+        else:
+            reject(numbers.notna() & (numbers % 1 != 0), col, values, "정수가 아닌 값")
+            reject((numbers < INT_MIN) | (numbers > INT_MAX), col, values, "INTEGER 범위 초과")
+            frame[col] = numbers.where(~invalid).round().astype('Int64')
+
+    return frame[~invalid], errors
+
+
+def _copy_rows(cursor, table, frame):
+    """DataFrame 전체를 COPY FROM STDIN(CSV)으로 전송"""
+    buffer = io.StringIO()
+    frame.to_csv(buffer, header=False, index=False, na_rep='')
+    buffer.seek(0)
+    columns = ', '.join(frame.columns)
+    cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _copy_with_bisect(cursor, table, frame, errors):
+    """
+    세이브포인트 안에서 COPY하고, 실패하면 반으로 나눠 다시 시도하여 문제 행만 골라냄
+
+    Returns:
+        int: 적재된 행 수
+    """
+    cursor.execute("SAVEPOINT bulk_copy")
+    try:
+        _copy_rows(cursor, table, frame)
+        cursor.execute("RELEASE SAVEPOINT bulk_copy")
+        return len(frame)
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT bulk_copy")
+        cursor.execute("RELEASE SAVEPOINT bulk_copy")
+        if len(frame) == 1:
+            message = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+            errors.append(RowError(frame.index[0], None, None, message))
+            return 0
+
+    middle = len(frame) // 2
+    return (_copy_with_bisect(cursor, table, frame.iloc[:middle], errors) +
+            _copy_with_bisect(cursor, table, frame.iloc[middle:], errors))
+
+
+def copy_frame(conn, table, frame, batch_size=None, report=None):
+    """
+    DataFrame을 COPY FROM STDIN으로 하나의 트랜잭션에서 적재
+
+    배치마다 세이브포인트를 두어, 데이터베이스가 거부한 행만 제외하고 나머지는 적재한다.
+
+    Args:
+        conn: PostgreSQL 연결 객체 (psycopg2)
+        table (str): 대상 테이블
+        frame (pandas.DataFrame): 적재할 데이터 (컬럼명 = 테이블 컬럼명)
+        batch_size (int): 배치당 행 수 (None이면 한 번에 전송)
+        report (LoadReport): 결과를 누적할 보고서 (None이면 새로 생성)
+
+    Returns:
+        LoadReport: 적재 결과
+    """
+    report = report or LoadReport(table)
+    batch_size = batch_size or max(len(frame), 1)
+    start = time.perf_counter()
+
+    cursor = conn.cursor()
+    try:
+        for offset in range(0, len(frame), batch_size):
+            batch = frame.iloc[offset:offset + batch_size]
+            report.inserted += _copy_with_bisect(cursor, table, batch, report.errors)
+            report.batches += 1
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    report.elapsed += time.perf_counter() - start
+    return report
+
+
+def bulk_load_giup(conn, df, yearmonth, batch_size=None):
+    """
+    집계표 DataFrame을 giup_statistics 테이블에 COPY로 일괄 적재
+
+    Args:
+        conn: PostgreSQL 연결 객체
+        df (pandas.DataFrame): 집계표 데이터
+        yearmonth (str): 기준년월
+        batch_size (int): 배치당 행 수 (None이면 한 번에 전송)
+
+    Returns:
+        LoadReport: 적재 결과 (행 단위 오류 포함)
+    """
+    start = time.perf_counter()
+    frame, errors = prepare_giup_frame(df, yearmonth)
+
+    report = LoadReport(GIUP_TABLE)
+    report.errors.extend(errors)
+    copy_frame(conn, GIUP_TABLE, frame, batch_size=batch_size, report=report)
+    report.elapsed = time.perf_counter() - start
+
+    for error in report.errors:
+        location = f"{error.column}={error.value!r}: " if error.column else ""
+        print(f"[WARNING] Row {error.row} 적재 실패: {location}{error.message}")
+    print(f"[OK] {report.summary()}")
+    return report
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+차트 이미지 캐시 모듈
+차트 종류 + 년도 + 월 + 데이터 버전을 키로 렌더링된 차트(base64 PNG)를 보관하여
+페이지 렌더링, 업데이트 API, PDF 내보내기가 같은 이미지를 재사용하도록 하는 기능을 제공
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+
+class ChartCache:
+    """바이트 용량 제한이 있는 LRU 차트 캐시 클래스"""
+
+    def __init__(self, max_bytes=None):
+        """
+        차트 캐시 초기화
+
+        Args:
+            max_bytes (int): 캐시할 차트의 최대 총 용량 (None이면 CHART_CACHE_MAX_BYTES 환경변수, 기본 32MB)
+        """
+        self.max_bytes = max_bytes or int(os.getenv('CHART_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+        self._charts = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        캐시된 차트 조회 (최근 사용으로 갱신)
+
+        Args:
+            key (tuple): (차트 종류, 년도, 월, 데이터 버전)
+
+        Returns:
+            str: base64 PNG 문자열 (없으면 None)
+        """
+        with self._lock:
+            chart = self._charts.get(key)
+            if chart is not None:
+                self._charts.move_to_end(key)
+            return chart
+
+    def put(self, key, chart):
+        """
+        차트 저장 (용량 초과 시 오래 사용하지 않은 차트부터 제거)
+
+        Args:
+            key (tuple): (차트 종류, 년도, 월, 데이터 버전)
+            chart (str): base64 PNG 문자열
+        """
+        size = len(chart)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._charts.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+
+            # 데이터 버전이 바뀐 같은 종류의 차트는 더 이상 쓰이지 않으므로 제거
+            for stale_key in [k for k in self._charts if k[0] == key[0] and k[-1] != key[-1]]:
+                self.current_bytes -= len(self._charts.pop(stale_key))
+
+            while self._charts and self.current_bytes + size > self.max_bytes:
+                _, evicted = self._charts.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+            self._charts[key] = chart
+            self.current_bytes += size
+
+    def get_or_create(self, key, factory):
+        """
+        캐시된 차트를 반환하고, 없으면 factory()로 렌더링하여 저장
+
+        Args:
+            key (tuple): (차트 종류, 년도, 월, 데이터 버전)
+            factory (callable): 차트를 렌더링하여 base64 문자열(실패 시 None)을 반환하는 함수
+
+        Returns:
+            str: base64 PNG 문자열 (렌더링 실패 시 None)
+        """
+        return self.get_or_create_many([key], lambda missing: [factory()])[key]
+
+    def get_or_create_many(self, keys, factory):
+        """
+        여러 차트를 한 번에 조회하고, 없는 차트만 모아 factory(missing_keys)로 렌더링하여 저장
+
+        같은 키를 동시에 요청하면 한 번만 렌더링하고 나머지는 결과를 기다린다.
+
+        Args:
+            keys (list): (차트 종류, 년도, 월, 데이터 버전) 키 목록
+            factory (callable): 없는 키 목록을 받아 같은 순서의 차트 목록(실패 시 None)을 반환하는 함수
+
+        Returns:
+            dict: 키별 base64 PNG 문자열 (렌더링 실패 시 None)
+        """
+        charts = {key: self.get(key) for key in keys}
+        missing = [key for key in keys if charts[key] is None]
+        self.hits += len(keys) - len(missing)
+        if not missing:
+            return charts
+
+        # 키 순서대로 잠가서 교착 상태 방지
+        with self._lock:
+            key_locks = [self._key_locks.setdefault(key, threading.Lock()) for key in sorted(missing)]
+        for key_lock in key_locks:
+            key_lock.acquire()
+
+        try:
+            # 기다리는 동안 다른 요청이 렌더링했으면 그 결과 사용
+            for key in missing:
+                charts[key] = self.get(key)
+            to_render = [key for key in missing if charts[key] is None]
+            self.hits += len(missing) - len(to_render)
+            self.misses += len(to_render)
+
+            if to_render:
+                for key, chart in zip(to_render, factory(to_render)):
+                    charts[key] = chart
+                    if chart is not None:
+                        self.put(key, chart)
+        finally:
+            for key_lock in key_locks:
+                key_lock.release()
+            with self._lock:
+                for key in missing:
+                    self._key_locks.pop(key, None)
+
+        return charts
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._charts.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: 적중/미스/제거 횟수와 사용 용량
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._charts),
+            'current_bytes': self.current_bytes,
+            'max_bytes': self.max_bytes
+        }
+
+
+# 프로세스 공유 차트 캐시
+chart_cache = ChartCache()
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+차트 렌더링 서비스 모듈
+차트 명세(spec, 순수 파이썬 dict)를 받아 별도 프로세스 풀에서 Agg 백엔드로 PNG를 생성하여
+웹 워커의 요청 스레드가 matplotlib 렌더링(GIL 점유, pyplot 전역 상태)에 묶이지 않도록 하는 기능을 제공
+"""
+
+import atexit
+import base64
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import matplotlib
+from matplotlib.figure import Figure
+
+
+# 경상북도 강조 색상
+GYEONGBUK_COLOR = '#1f4e79'
+
+
+def _init_worker():
+    """렌더링 프로세스 초기화 (화면 없는 Agg 백엔드 사용)"""
+    matplotlib.use('Agg')
+
+
+def _figure_to_base64(fig):
+    """Figure를 150dpi PNG base64 문자열로 변환"""
+    img_buffer = io.BytesIO()
+    fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
+    return base64.b64encode(img_buffer.getvalue()).decode()
+
+
+def _draw_table(ax, spec, col_labels, col_widths, fontsize, row_style):
+    """좌측 상단 현황 표 그리기"""
+    ax.axis('tight')
+    ax.axis('off')
+
+    table_data = spec['table_rows']
+    table = ax.table(cellText=table_data,
+                     colLabels=col_labels,
+                     cellLoc='center',
+                     loc='center',
+                     colWidths=col_widths)
+
+    # 표 스타일링
+    table.auto_set_font_size(False)
+    table.set_fontsize(fontsize)
+    table.scale(1.2, 1.8)
+
+    # 헤더 스타일
+    for i in range(4):
+        table[(0, i)].set_facecolor('#4472C4')
+        table[(0, i)].set_text_props(weight='bold', color='white', ha='center')
+
+    # 데이터 행 스타일링
+    for idx in range(len(table_data)):
+        # 이름은 왼쪽 정렬, 숫자는 오른쪽 정렬
+        table[(idx + 1, 0)].set_text_props(ha='left')
+        for j in range(1, 4):
+            table[(idx + 1, j)].set_text_props(ha='right')
+
+        # 합계 행 스타일 (첫 번째 데이터 행)
+        if idx == 0:
+            for i in range(4):
+                table[(idx + 1, i)].set_facecolor('#B4C7E7')
+                table[(idx + 1, i)].set_text_props(weight='bold')
+        else:
+            row_style(table, idx, table_data[idx])
+
+    ax.set_title(spec['table_title'], fontsize=16, fontweight='bold', pad=20)
+
+
+def _draw_bar(ax, labels, values, colors, xlabel, ylabel, title, value_format):
+    """상위 항목 막대그래프와 값 주석 그리기"""
+    bars = ax.bar(range(len(values)), values, color=colors)
+    ax.set_xlabel(xlabel, fontweight='bold')
+    ax.set_ylabel(ylabel, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_xticks(range(len(values)))
+    ax.set_xticklabels(labels, rotation=45, ha='right')
+    ax.grid(True, alpha=0.3)
+
+    # 막대 위에 값 표시
+    for bar, value in zip(bars, values):
+        height = bar.get_height()
+        ax.annotate(value_format.format(value),
+                    xy=(bar.get_x() + bar.get_width() / 2, height),
+                    xytext=(0, 3),
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontsize=9)
+
+
+def _is_gyeongbuk(name):
+    """경상북도 행정구역 여부"""
+    return '경상북도' in name or '경북' in name
+
+
+def render_region_table_chart(spec):
+    """
+    행정구역별 사업체 현황 표 + 막대그래프 3개 렌더링
+
+    Args:
+        spec (dict): dash3.build_region_spec()이 만든 차트 명세
+
+    Returns:
+        str: base64 PNG 문자열
+    """
+    with matplotlib.rc_context(spec['rc']):
+        fig = Figure(figsize=(24, 16))
+
+        def highlight_gyeongbuk(table, idx, row):
+            # 경상북도 행 찾아서 진한 파란색으로 표시
+            if _is_gyeongbuk(str(row[0])):
+                for i in range(4):
+                    table[(idx + 1, i)].set_facecolor(GYEONGBUK_COLOR)
+                    table[(idx + 1, i)].set_text_props(color='white', weight='bold')
+
+        # 1. 표 (좌측 상단)
+        _draw_table(fig.add_subplot(2, 2, 1), spec,
+                    ['행정구역', '사업체수', '종사자수', '매출액'], [0.3, 0.25, 0.25, 0.2], 11,
+                    highlight_gyeongbuk)
+
+        bars = spec['bars']
+        labels = bars['labels']
+
+        def colors(base_color):
+            return [GYEONGBUK_COLOR if _is_gyeongbuk(label) else base_color for label in labels]
+
+        # 2~4. 사업체수/종사자수/매출액 막대그래프
+        _draw_bar(fig.add_subplot(2, 2, 2), labels, bars['기업체수'], colors('#4472C4'),
+                  '행정구역', '사업체수', '행정구역별 사업체수 (상위 10개)', '{:,}')
+        _draw_bar(fig.add_subplot(2, 2, 3), labels, bars['종사자수'], colors('#70AD47'),
+                  '행정구역', '종사자수', '행정구역별 종사자수 (상위 10개)', '{:,}')
+        _draw_bar(fig.add_subplot(2, 2, 4), labels, bars['매출액_억'], colors('#FFC000'),
+                  '행정구역', '매출액(억원)', '행정구역별 매출액 (상위 10개)', '{:.1f}억')
+
+        fig.tight_layout(pad=3.0)
+        return _figure_to_base64(fig)
+
+
+def render_industry_table_chart(spec):
+    """
+    산업분류별 사업체 현황 표 + 막대그래프 3개 렌더링
+
+    Args:
+        spec (dict): dash3.build_industry_spec()이 만든 차트 명세
+
+    Returns:
+        str: base64 PNG 문자열
+    """
+    with matplotlib.rc_context(spec['rc']):
+        fig = Figure(figsize=(24, 16))
+
+        def alternate_rows(table, idx, row):
+            # 나머지 행들은 교대로 색상 적용
+            color = '#F2F2F2' if idx % 2 == 0 else 'white'
+            for i in range(4):
+                table[(idx + 1, i)].set_facecolor(color)
+
+        # 1. 표 (좌측 상단)
+        _draw_table(fig.add_subplot(2, 2, 1), spec,
+                    ['산업분류', '사업체수', '종사자수', '매출액'], [0.4, 0.2, 0.2, 0.2], 10,
+                    alternate_rows)
+
+        bars = spec['bars']
+        labels = bars['labels']
+
+        # 2~4. 사업체수/종사자수/매출액 막대그래프
+        _draw_bar(fig.add_subplot(2, 2, 2), labels, bars['기업체수'], '#4472C4',
+                  '산업분류', '사업체수', '산업분류별 사업체수 (상위 10개)', '{:,}')
+        _draw_bar(fig.add_subplot(2, 2, 3), labels, bars['종사자수'], '#70AD47',
+                  '산업분류', '종사자수', '산업분류별 종사자수 (상위 10개)', '{:,}')
+        _draw_bar(fig.add_subplot(2, 2, 4), labels, bars['매출액_억'], '#FFC000',
+                  '산업분류', '매출액(억원)', '산업분류별 매출액 (상위 10개)', '{:.1f}억')
+
+        fig.tight_layout(pad=3.0)
+        return _figure_to_base64(fig)
+
+
+# 차트 종류별 렌더링 함수
+RENDERERS = {
+    'region': render_region_table_chart,
+    'industry': render_industry_table_chart,
+}
+
+
+def render_spec(spec):
+    """
+    차트 명세를 종류에 맞는 렌더링 함수로 처리 (프로세스 풀에서 실행)
+
+    Args:
+        spec (dict): 'kind' 키를 포함한 차트 명세 (None이면 None 반환)
+
+    Returns:
+        str: base64 PNG 문자열 (실패 시 None)
+    """
+    if spec is None:
+        return None
+    try:
+        return RENDERERS[spec['kind']](spec)
+    except Exception as e:
+        print(f"차트 렌더링 오류 ({spec.get('kind')}): {str(e)}")
+        return None
+
+
+class ChartRenderService:
+    """차트 명세를 프로세스 풀에 제출하여 렌더링하는 클래스"""
+
+    def __init__(self, max_workers=None, timeout=120):
+        """
+        차트 렌더링 서비스 초기화
+
+        Args:
+            max_workers (int): 렌더링 프로세스 수 (None이면 CHART_RENDER_WORKERS 환경변수, 기본 2, 0이면 현재 프로세스에서 렌더링)
+            timeout (int): 차트 하나를 기다리는 최대 시간 (초)
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv('CHART_RENDER_WORKERS', 2))
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """현재 프로세스용 프로세스 풀 반환 (fork된 워커에서는 새로 생성)"""
+        if self.max_workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                # spawn 방식: fork된 웹 워커의 스레드/락 상태를 물려받지 않음
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def render_many(self, specs):
+        """
+        여러 차트 명세를 병렬로 렌더링
+
+        프로세스 풀을 사용할 수 없으면 현재 프로세스에서 순서대로 렌더링한다.
+
+        Args:
+            specs (list): 차트 명세 목록
+
+        Returns:
+            list: 명세 순서대로 base64 PNG 문자열 (실패한 차트는 None)
+        """
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                futures = [executor.submit(render_spec, spec) for spec in specs]
+                return [future.result(timeout=self.timeout) for future in futures]
+            except (BrokenProcessPool, OSError, RuntimeError) as e:
+                print(f"차트 렌더링 프로세스 풀 오류, 현재 프로세스에서 렌더링합니다: {e}")
+                self.shutdown()
+
+        return [render_spec(spec) for spec in specs]
+
+    def render(self, spec):
+        """
+        차트 명세 하나를 렌더링
+
+        Args:
+            spec (dict): 차트 명세
+
+        Returns:
+            str: base64 PNG 문자열 (실패 시 None)
+        """
+        return self.render_many([spec])[0]
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pid = None
+
+
+# 프로세스 공유 차트 렌더링 서비스
+chart_renderer = ChartRenderService()
+atexit.register(chart_renderer.shutdown)
@@ -1,8 +1,14 @@
 import pymysql
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
+import psycopg2.pool
 import os
 import socket
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from urllib.parse import urlparse
 
 
@@ -23,8 +29,16 @@ def get_db_connection():
     return pymysql.connect(**get_config())
 
 
+@lru_cache(maxsize=None)
 def is_cloudtype_environment():
-    """Cloudtype 환경인지 확인 (내부 호스트명 'postgresql' 접근 가능 여부)"""
+    """
+    Cloudtype 환경인지 확인 (내부 호스트명 'postgresql' 접근 가능 여부)
+
+    DNS 조회는 프로세스당 한 번만 수행하며, POSTGRES_ENV 환경변수('cloudtype' 또는 'external')로 지정할 수도 있음
+    """
+    env = os.environ.get("POSTGRES_ENV", "").lower()
+    if env in ("cloudtype", "external"):
+        return env == "cloudtype"
     try:
         socket.gethostbyname('postgresql')
         return True
@@ -58,10 +72,203 @@ def get_postgres_config():
 
 
 def get_postgres_connection():
-    
-    """PostgreSQL 연결 (딕셔너리 커서 사용)"""
+    """PostgreSQL 연결 (딕셔너리 커서 사용, 호출한 쪽에서 close 필요)"""
     config = get_postgres_config()
     return psycopg2.connect(
         **config,
         cursor_factory=psycopg2.extras.RealDictCursor
     )
+
+
+class PostgresPool:
+    """
+    워커 프로세스별 PostgreSQL 연결 풀 (ThreadedConnectionPool 기반)
+
+    풀이 가득 차면 POSTGRES_POOL_TIMEOUT초까지 반납을 기다리고,
+    꺼낼 때마다 연결 상태를 확인하여 끊어진 연결은 정상 연결이 나오거나 새 연결을 만들 때까지 버린다.
+    """
+
+    def __init__(self, minconn=None, maxconn=None, timeout=None):
+        """
+        연결 풀 설정 (실제 연결은 처음 사용할 때 생성)
+
+        Args:
+            minconn (int): 최소 연결 수 (기본 POSTGRES_POOL_MIN 또는 1)
+            maxconn (int): 최대 연결 수 (기본 POSTGRES_POOL_MAX 또는 5)
+            timeout (float): 연결 대기 최대 시간(초) (기본 POSTGRES_POOL_TIMEOUT 또는 30)
+        """
+        self.minconn = minconn or int(os.environ.get("POSTGRES_POOL_MIN", "1"))
+        self.maxconn = maxconn or int(os.environ.get("POSTGRES_POOL_MAX", "5"))
+        self.timeout = timeout or float(os.environ.get("POSTGRES_POOL_TIMEOUT", "30"))
+        self._pool = None
+        self._pid = None
+        self._slots = None
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        """통계 초기화"""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.health_check_failures = 0
+        self.in_use = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _ensure_pool(self):
+        """현재 프로세스용 풀 반환 (fork된 워커에서는 부모의 연결을 쓰지 않고 새로 생성)"""
+        if self._pool is not None and self._pid == os.getpid():
+            return self._pool
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = psycopg2.pool.ThreadedConnectionPool(
+                    self.minconn, self.maxconn,
+                    **get_postgres_config(),
+                    cursor_factory=psycopg2.extras.RealDictCursor
+                )
+                self._slots = threading.BoundedSemaphore(self.maxconn)
+                self._pid = os.getpid()
+                self._reset_stats()
+            return self._pool
+
+    @staticmethod
+    def _is_healthy(conn):
+        """연결 상태 확인 (SELECT 1)"""
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self):
+        """
+        풀에서 정상 연결 꺼내기
+
+        Returns:
+            psycopg2 connection: 딕셔너리 커서를 사용하는 연결
+
+        Raises:
+            psycopg2.pool.PoolError: timeout 안에 연결을 얻지 못한 경우
+        """
+        pool = self._ensure_pool()
+
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise psycopg2.pool.PoolError(f"{self.timeout}초 안에 PostgreSQL 연결을 얻지 못했습니다.")
+        waited = time.perf_counter() - start
+
+        try:
+            conn = pool.getconn()
+            # 끊어진 연결은 버리고 다음 연결 확인 (DB 재시작 후에는 유휴 연결이 모두 끊어져 있음)
+            # 풀의 유휴 연결은 maxconn개를 넘지 않으므로 그만큼 버리면 다음 연결은 새로 연결한 것
+            for _ in range(self.maxconn):
+                if self._is_healthy(conn):
+                    break
+                with self._lock:
+                    self.health_check_failures += 1
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return conn
+
+    def putconn(self, conn):
+        """
+        연결을 풀에 반납 (진행 중인 트랜잭션은 롤백)
+
+        Args:
+            conn: getconn()으로 꺼낸 연결
+        """
+        pool = self._pool
+        close = bool(conn.closed)
+        if not close and conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                close = True
+        try:
+            if pool is not None and self._pid == os.getpid():
+                pool.putconn(conn, close=close)
+            else:
+                conn.close()
+        finally:
+            with self._lock:
+                self.in_use -= 1
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        with 문으로 연결을 빌려 쓰고 자동 반납
+
+        Yields:
+            psycopg2 connection: 풀 연결
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def stats(self):
+        """
+        풀 사용 통계
+
+        Returns:
+            dict: 연결 대여 횟수, 대기 시간, 사용 중 연결 수 등
+        """
+        return {
+            "pid": self._pid,
+            "minconn": self.minconn,
+            "maxconn": self.maxconn,
+            "in_use": self.in_use,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "health_check_failures": self.health_check_failures,
+            "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+    def closeall(self):
+        """풀의 모든 연결 종료"""
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.closeall()
+            self._pool = None
+            self._pid = None
+
+
+# 프로세스 공유 연결 풀
+postgres_pool = PostgresPool()
+
+
+def postgres_connection():
+    """
+    풀에서 PostgreSQL 연결을 빌리는 컨텍스트 매니저
+
+    사용 예:
+        with postgres_connection() as conn:
+            ...
+
+    Returns:
+        contextmanager: 연결을 yield하고 종료 시 풀에 반납
+    """
+    return postgres_pool.connection()
+
+
+def get_pool_stats():
+    """PostgreSQL 연결 풀 통계 반환"""
+    return postgres_pool.stats()
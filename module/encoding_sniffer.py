@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+인코딩 판별 모듈
+파일 앞부분의 바이트(BOM, UTF-8 유효성, CP949 선행/후행 바이트 통계)만 검사하여
+CSV를 여러 인코딩으로 반복해서 읽지 않고 한 번에 읽을 수 있도록 인코딩을 판별하는 기능을 제공
+"""
+
+import codecs
+from pathlib import Path
+from typing import NamedTuple
+
+
+# 판별에 사용할 샘플 크기와 ASCII만 있을 때 비ASCII 바이트를 찾아 읽을 최대 크기
+SNIFF_BYTES = 64 * 1024
+MAX_SCAN_BYTES = 8 * 1024 * 1024
+
+# 판별한 인코딩으로 읽다가 디코딩 오류가 나면 순서대로 다시 시도할 인코딩
+# (샘플 범위 밖에서 처음 한글이 나오는 파일, CP949로 잘못 판별한 UTF-8 파일 등)
+FALLBACK_ENCODINGS = ['cp949', 'euc-kr', 'utf-8-sig']
+
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+class EncodingGuess(NamedTuple):
+    """인코딩 판별 결과"""
+    encoding: str
+    confidence: float
+    reason: str
+
+
+def _decodes(sample, encoding):
+    """샘플이 해당 인코딩으로 오류 없이 디코딩되는지 확인 (끝에서 잘린 문자는 허용)"""
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def cp949_pair_ratio(sample):
+    """
+    비ASCII 바이트 중 CP949 2바이트 문자(선행 0x81~0xFE + 후행 A-Z/a-z/0x81~0xFE)로 읽히는 비율
+
+    Args:
+        sample (bytes): 검사할 바이트
+
+    Returns:
+        tuple: (유효한 2바이트 문자 비율, 그중 KS X 1001 한글 영역(선행 0xB0~0xC8) 비율)
+    """
+    pairs = hangul = invalid = 0
+    i, size = 0, len(sample)
+    while i < size:
+        byte = sample[i]
+        if byte < 0x80:
+            i += 1
+            continue
+        if i + 1 >= size:
+            break
+        trail = sample[i + 1]
+        if 0x81 <= byte <= 0xFE and (0x41 <= trail <= 0x5A or 0x61 <= trail <= 0x7A or 0x81 <= trail <= 0xFE):
+            pairs += 1
+            if 0xB0 <= byte <= 0xC8:
+                hangul += 1
+            i += 2
+        else:
+            invalid += 1
+            i += 1
+
+    total = pairs + invalid
+    if total == 0:
+        return 0.0, 0.0
+    return pairs / total, (hangul / pairs if pairs else 0.0)
+
+
+def guess_encoding(sample):
+    """
+    바이트 샘플의 인코딩 판별
+
+    Args:
+        sample (bytes): 파일 앞부분 바이트
+
+    Returns:
+        EncodingGuess: 판별된 인코딩, 신뢰도(0~1), 판별 근거
+    """
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return EncodingGuess(encoding, 1.0, 'BOM')
+
+    if sample.isascii():
+        return EncodingGuess('utf-8', 0.5, 'ASCII')
+
+    # 한글이 UTF-8로 유효하게 디코딩되는 경우는 CP949와 헷갈릴 일이 거의 없음
+    if _decodes(sample, 'utf-8'):
+        return EncodingGuess('utf-8', 0.99, 'UTF-8 유효')
+
+    # CP949로 유효하면 한글 영역 비율이 높을수록 신뢰도가 높음
+    pair_ratio, hangul_ratio = cp949_pair_ratio(sample)
+    if _decodes(sample, 'cp949'):
+        return EncodingGuess('cp949', 0.6 + 0.4 * hangul_ratio, f'CP949 유효 (한글 {hangul_ratio:.0%})')
+
+    # 어느 쪽으로도 깨끗하게 읽히지 않으면 바이트 통계로 가까운 쪽 선택
+    if pair_ratio >= 0.9:
+        return EncodingGuess('cp949', pair_ratio * 0.5, f'CP949 2바이트 비율 {pair_ratio:.0%}')
+    return EncodingGuess('utf-8', 0.1, '판별 불가')
+
+
+def read_sample(path, sample_size=SNIFF_BYTES, max_scan=MAX_SCAN_BYTES):
+    """
+    판별용 샘플 읽기 (앞부분이 ASCII뿐이면 처음 나오는 비ASCII 바이트 위치부터 샘플을 읽음)
+
+    Args:
+        path (Path): 파일 경로
+        sample_size (int): 샘플 크기 (bytes)
+        max_scan (int): 비ASCII 바이트를 찾아 읽을 최대 크기 (bytes)
+
+    Returns:
+        bytes: 판별용 샘플
+    """
+    with open(path, 'rb') as f:
+        head = f.read(sample_size)
+        if not head.isascii() or len(head) < sample_size:
+            return head
+
+        scanned = len(head)
+        while scanned < max_scan:
+            chunk = f.read(sample_size)
+            if not chunk:
+                return head
+            scanned += len(chunk)
+            if not chunk.isascii():
+                # 비ASCII 바이트 바로 앞은 ASCII이므로 문자 경계에서 샘플 시작
+                start = next(i for i, byte in enumerate(chunk) if byte >= 0x80)
+                return chunk[start:] + f.read(start)
+    return head
+
+
+def sniff_encoding(path, sample_size=SNIFF_BYTES):
+    """
+    파일 인코딩 판별 (pandas.read_csv 등에 바로 넘길 인코딩 이름 반환)
+
+    Args:
+        path (str | Path): 파일 경로
+        sample_size (int): 검사할 바이트 수
+
+    Returns:
+        str: 'utf-8', 'utf-8-sig', 'utf-16', 'cp949' 중 하나
+    """
+    return guess_encoding(read_sample(Path(path), sample_size)).encoding
+
+
+def read_with_fallback(path, read):
+    """
+    판별한 인코딩으로 파일을 읽고, 디코딩 오류가 나면 FALLBACK_ENCODINGS 순서로 처음부터 다시 읽기
+
+    Args:
+        path (str | Path): 파일 경로
+        read (callable): read(인코딩) - 파일 전체를 읽어 결과를 반환 (다시 읽을 때 처음부터 새로 호출됨)
+
+    Returns:
+        tuple: (read 결과, 읽기에 성공한 인코딩)
+
+    Raises:
+        UnicodeDecodeError: 모든 인코딩으로 읽지 못한 경우 (마지막 오류)
+    """
+    sniffed = sniff_encoding(path)
+    candidates = [sniffed] + [encoding for encoding in FALLBACK_ENCODINGS if encoding != sniffed]
+    for index, encoding in enumerate(candidates):
+        try:
+            return read(encoding), encoding
+        except UnicodeDecodeError:
+            if index == len(candidates) - 1:
+                raise
+            print(f"{encoding} 인코딩으로 읽기 실패, {candidates[index + 1]} 인코딩으로 다시 읽습니다: {Path(path).name}")
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+집계 큐브 모듈
+년도 × 월 × 시도 × 시군구 × 지표 조합의 합계를 미리 계산해 두고,
+대시보드 필터를 pandas 스캔 대신 배열 슬라이스 + 합계로 처리하는 기능을 제공
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# 큐브 축 (DataFrame 컬럼명)
+AXES = ('년도', '월', '시도', '시군구')
+
+# 필터 인자명 → 축 이름
+FILTER_AXES = {'year': '년도', 'month': '월', 'sido': '시도', 'sigungu': '시군구'}
+
+
+class AggregationCube:
+    """년도/월/시도/시군구별 지표 합계를 담은 밀집(dense) 배열 큐브"""
+
+    def __init__(self, df, metrics):
+        """
+        DataFrame으로부터 큐브 생성
+
+        Args:
+            df (pandas.DataFrame): 집계표 패널 데이터
+            metrics (list): 집계할 숫자형 컬럼 목록
+        """
+        self.metrics = [m for m in metrics if m in df.columns]
+        self.labels = {}
+        codes = []
+
+        for axis in AXES:
+            if axis in df.columns:
+                axis_codes, uniques = pd.factorize(df[axis], sort=True)
+                self.labels[axis] = list(uniques.tolist())
+            else:
+                # 축 컬럼이 없으면 하나의 구간으로 취급
+                axis_codes = np.zeros(len(df), dtype=np.intp)
+                self.labels[axis] = [None]
+            codes.append(axis_codes)
+
+        # 축 값이 결측인 행은 제외
+        valid = np.all([c >= 0 for c in codes], axis=0) if len(df) else np.zeros(0, dtype=bool)
+        codes = tuple(c[valid] for c in codes)
+
+        shape = tuple(len(self.labels[axis]) for axis in AXES)
+        dtypes = [df[m].dtype for m in self.metrics]
+        dtype = np.result_type(*dtypes) if dtypes else np.float64
+
+        self.values = np.zeros(shape + (len(self.metrics),), dtype=dtype)
+        self.counts = np.zeros(shape, dtype=np.int64)
+        if self.metrics:
+            np.add.at(self.values, codes, df[self.metrics].to_numpy(dtype=dtype)[valid])
+        np.add.at(self.counts, codes, 1)
+
+        self._positions = {axis: {label: i for i, label in enumerate(labels)}
+                           for axis, labels in self.labels.items()}
+        self._metric_positions = {m: i for i, m in enumerate(self.metrics)}
+
+    @property
+    def nbytes(self):
+        """큐브 배열 메모리 사용량 (bytes)"""
+        return self.values.nbytes + self.counts.nbytes
+
+    def _axis_index(self, axis, value):
+        """필터 값을 축 위치 배열로 변환 (None이면 전체)"""
+        positions = self._positions[axis]
+        if value is None:
+            return np.arange(len(positions), dtype=np.intp)
+        if not isinstance(value, (list, tuple, set, np.ndarray, pd.Index)):
+            value = [value]
+        return np.array([positions[v] for v in value if v in positions], dtype=np.intp)
+
+    def _slice(self, metrics, filters):
+        """필터 조건에 맞는 (값, 개수) 부분 배열 반환"""
+        unknown = set(filters) - set(FILTER_AXES)
+        if unknown:
+            raise TypeError(f"알 수 없는 필터: {sorted(unknown)}")
+
+        index = [self._axis_index(axis, filters.get(key))
+                 for key, axis in zip(FILTER_AXES, AXES)]
+        metric_index = np.array([self._metric_positions[m] for m in metrics], dtype=np.intp)
+
+        values = self.values[np.ix_(*index, metric_index)]
+        counts = self.counts[np.ix_(*index)]
+        return values, counts, index
+
+    def sum(self, metrics, **filters):
+        """
+        필터 조건의 지표 합계
+
+        Args:
+            metrics (str | list): 지표 컬럼명 또는 목록
+            **filters: year, month, sido, sigungu (값 또는 값 목록)
+
+        Returns:
+            스칼라(지표 1개) 또는 지표별 합계 Series
+        """
+        single = isinstance(metrics, str)
+        metric_list = [metrics] if single else list(metrics)
+        values, _, _ = self._slice(metric_list, filters)
+        totals = values.sum(axis=(0, 1, 2, 3))
+        return totals[0] if single else pd.Series(totals, index=metric_list)
+
+    def count(self, **filters):
+        """
+        필터 조건에 해당하는 원본 행 수
+
+        Args:
+            **filters: year, month, sido, sigungu (값 또는 값 목록)
+
+        Returns:
+            int: 행 수
+        """
+        _, counts, _ = self._slice([], filters)
+        return int(counts.sum())
+
+    def group_sum(self, metrics, by, **filters):
+        """
+        필터 조건에서 한 축 기준으로 묶은 지표 합계 (df.groupby(by)[metrics].sum()과 동일)
+
+        Args:
+            metrics (str | list): 지표 컬럼명 또는 목록
+            by (str): 묶을 축 ('년도', '월', '시도', '시군구')
+            **filters: year, month, sido, sigungu (값 또는 값 목록)
+
+        Returns:
+            pandas.Series(지표 1개) 또는 pandas.DataFrame, 실제 데이터가 있는 그룹만 포함
+        """
+        single = isinstance(metrics, str)
+        metric_list = [metrics] if single else list(metrics)
+        values, counts, index = self._slice(metric_list, filters)
+
+        axis_no = AXES.index(by)
+        other_axes = tuple(i for i in range(len(AXES)) if i != axis_no)
+        grouped = values.sum(axis=other_axes)
+        present = counts.sum(axis=other_axes) > 0
+
+        labels = [self.labels[by][i] for i in index[axis_no][present]]
+        group_index = pd.Index(labels, name=by)
+        if single:
+            return pd.Series(grouped[present, 0], index=group_index, name=metrics)
+        return pd.DataFrame(grouped[present], index=group_index, columns=metric_list)
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+기업통계 데이터셋 레지스트리 모듈
+집계표 패널 데이터를 한 번만 로드하여 공유 메모리에 게시하고, 모든 워커/라우트에 읽기 전용 뷰로 제공
+"""
+
+import hashlib
+import re
+import threading
+from pathlib import Path
+from typing import List, NamedTuple
+
+import pandas as pd
+
+from .giup_cube import AggregationCube
+from .shared_panel import SharedPanelStore
+from .snapshot_cache import (
+    SnapshotCache, NUMERIC_COLS, CLOSURE_COLS, BUSINESS_COLS, INDUSTRY_COLS
+)
+
+
+# 집계표 파일명 패턴 (집계표_YYYYMM.xlsx)
+FILE_PATTERN = re.compile(r'^집계표_(\d{6})\.xlsx$')
+
+# 기본 데이터 폴더 (프로젝트 루트 기준)
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / '1_giup' / 'data'
+
+# 공유 메모리에 게시할 패널 이름
+PANEL_NAME = 'giup_panel'
+
+
+class ColumnGroups(NamedTuple):
+    """집계표 컬럼 그룹 (실제 존재하는 컬럼만 포함)"""
+    numeric: List[str]
+    closure: List[str]
+    business: List[str]
+    industry: List[str]
+
+    @property
+    def all_metrics(self):
+        """모든 숫자형 지표 컬럼 (기본 + 구분별)"""
+        return self.numeric + self.closure + self.business + self.industry
+
+
+class GiupDataset:
+    """집계표 패널 데이터를 관리하는 레지스트리 클래스"""
+
+    def __init__(self, data_dir=None, snapshot_cache=None, shared_store=None):
+        """
+        데이터셋 레지스트리 초기화
+
+        Args:
+            data_dir (Path): 집계표 파일이 있는 폴더
+            snapshot_cache (SnapshotCache): 사용할 스냅샷 캐시
+            shared_store (SharedPanelStore): 워커 간 공유에 사용할 저장소
+        """
+        self.data_dir = Path(data_dir) if data_dir else DEFAULT_DATA_DIR
+        self.snapshot_cache = snapshot_cache or SnapshotCache()
+        self.shared_store = shared_store or SharedPanelStore()
+        self._lock = threading.RLock()
+        self._signature = None
+        self._version = None
+        self._panel = None
+        self._column_groups = ColumnGroups([], [], [], [])
+        self._cubes = {}
+
+    def source_files(self):
+        """
+        데이터 폴더의 집계표 파일 목록 (기준년월 순)
+
+        Returns:
+            list: (기준년월, 파일경로) 튜플 리스트
+        """
+        files = []
+        if self.data_dir.exists():
+            for file_path in self.data_dir.iterdir():
+                match = FILE_PATTERN.match(file_path.name)
+                if match and file_path.is_file():
+                    files.append((match.group(1), file_path))
+        return sorted(files)
+
+    def signature(self):
+        """
+        원본 파일들의 이름/크기/수정시각 서명 (파일 변경 감지용)
+
+        Returns:
+            tuple: 파일별 (이름, 크기, 수정시각) 튜플
+        """
+        signature = []
+        for _, file_path in self.source_files():
+            stat = file_path.stat()
+            signature.append((file_path.name, stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+    def source_version(self):
+        """
+        원본 파일 기준 데이터 버전 (패널을 로드하지 않고 계산)
+
+        Returns:
+            str: 원본 파일 서명의 해시 (16자리)
+        """
+        return self._version_of(self.signature())
+
+    @staticmethod
+    def _version_of(signature):
+        """원본 파일 서명을 데이터 버전 문자열로 변환"""
+        return hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:16]
+
+    @property
+    def version(self):
+        """현재 로드된 데이터 버전 (원본 파일 서명의 해시)"""
+        self._ensure_loaded()
+        return self._version
+
+    @property
+    def column_groups(self):
+        """숫자형/폐업/기업/산업 컬럼 그룹"""
+        self._ensure_loaded()
+        return self._column_groups
+
+    def warm(self):
+        """
+        패널 데이터를 미리 로드 (앱 시작 시 호출)
+
+        gunicorn preload_app 환경에서는 마스터 프로세스가 패널을 게시/매핑한 뒤
+        fork하므로 워커들은 파싱 없이 같은 메모리 페이지를 공유한다.
+        """
+        self._ensure_loaded()
+        return self
+
+    def view(self, months=None):
+        """
+        패널 데이터의 읽기 전용 뷰 반환
+
+        뷰에 새 컬럼을 추가하거나 컬럼을 교체하는 것은 호출한 쪽에만 반영되며,
+        공유 데이터를 직접 수정하려 하면 ValueError가 발생한다.
+
+        Args:
+            months (list): 포함할 월 목록 (예: [12]), None이면 전체
+
+        Returns:
+            pandas.DataFrame: 패널 데이터 뷰
+        """
+        panel = self._ensure_loaded()
+        if months is not None and not panel.empty:
+            return panel[panel['월'].isin(months)]
+        return panel.copy(deep=False)
+
+    def cube(self, months=None):
+        """
+        년도 × 월 × 시도 × 시군구 × 지표 집계 큐브 반환 (데이터 버전별로 한 번만 생성)
+
+        Args:
+            months (list): 포함할 월 목록 (view(months)와 동일), None이면 전체
+
+        Returns:
+            AggregationCube: 집계 큐브
+        """
+        self._ensure_loaded()
+        with self._lock:
+            key = (self._version, tuple(months) if months is not None else None)
+            if key not in self._cubes:
+                # 이전 데이터 버전의 큐브는 폐기
+                self._cubes = {k: v for k, v in self._cubes.items() if k[0] == self._version}
+                self._cubes[key] = AggregationCube(self.view(months), self._column_groups.all_metrics)
+            return self._cubes[key]
+
+    def _ensure_loaded(self):
+        """원본 파일이 변경되었으면 패널 데이터를 다시 로드"""
+        signature = self.signature()
+        if self._panel is not None and signature == self._signature:
+            return self._panel
+
+        with self._lock:
+            if self._panel is None or signature != self._signature:
+                version = self._version_of(signature)
+                self._panel, self._column_groups = self._load(version)
+                self._signature = signature
+                self._version = version
+            return self._panel
+
+    def _load(self, version):
+        """
+        패널 로드: 공유 메모리에 게시된 버전이 있으면 연결하고, 없으면 스냅샷에서 만들어 게시
+
+        Args:
+            version (str): 원본 파일 서명 기반 데이터 버전
+
+        Returns:
+            tuple: (읽기 전용 패널 DataFrame, ColumnGroups)
+        """
+        panel = self.shared_store.attach(PANEL_NAME, version)
+        if panel is None:
+            built = self._build_panel()
+            if not built.empty and self.shared_store.publish(PANEL_NAME, version, built):
+                # 게시한 파일에 다시 연결하여 프로세스 전용 사본 대신 공유 페이지 사용
+                panel = self.shared_store.attach(PANEL_NAME, version)
+            if panel is None:
+                panel = self._freeze(built)
+
+        groups = ColumnGroups(
+            numeric=[col for col in NUMERIC_COLS if col in panel.columns],
+            closure=[col for col in CLOSURE_COLS if col in panel.columns],
+            business=[col for col in BUSINESS_COLS if col in panel.columns],
+            industry=[col for col in INDUSTRY_COLS if col in panel.columns],
+        )
+        return panel, groups
+
+    def _build_panel(self):
+        """
+        스냅샷에서 집계표들을 읽어 하나의 패널로 통합
+
+        Returns:
+            pandas.DataFrame: 통합 패널 (파일이 없으면 빈 DataFrame)
+        """
+        all_data = []
+        for year_month, file_path in self.source_files():
+            print(f"로드 중: {file_path.name}")
+            df = self.snapshot_cache.load(file_path)
+
+            # 기준년월에서 년도와 월 추출
+            df['년도'] = int(year_month[:4])
+            df['월'] = int(year_month[4:])
+            all_data.append(df)
+
+        if not all_data:
+            print("로드할 데이터가 없습니다.")
+            return pd.DataFrame()
+
+        # 모든 데이터 통합 후 시도/시군구 결측 행 제거
+        panel = pd.concat(all_data, ignore_index=True)
+        panel = panel.dropna(subset=['시도', '시군구']).reset_index(drop=True)
+        print(f"통합 데이터: {len(panel)}행, {len(panel.columns)}열")
+        return panel
+
+    @staticmethod
+    def _freeze(df):
+        """모든 컬럼 배열을 쓰기 금지로 설정한 DataFrame 생성"""
+        columns = {}
+        for col in df.columns:
+            values = df[col].to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[col] = values
+        return pd.DataFrame(columns, copy=False)
+
+
+# 데이터 폴더별 레지스트리 (프로세스당 하나)
+_datasets = {}
+_datasets_lock = threading.Lock()
+
+
+def get_giup_dataset(data_dir=None):
+    """
+    프로세스 공유 데이터셋 레지스트리 반환
+
+    Args:
+        data_dir (Path): 집계표 폴더 (None이면 1_giup/data)
+
+    Returns:
+        GiupDataset: 데이터셋 레지스트리
+    """
+    key = str(Path(data_dir).resolve()) if data_dir else str(DEFAULT_DATA_DIR.resolve())
+    with _datasets_lock:
+        if key not in _datasets:
+            _datasets[key] = GiupDataset(data_dir)
+        return _datasets[key]
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+렌더링 페이지 캐시 모듈
+라우트 이름 + 데이터 버전 + 메뉴 버전을 키로 완성된 HTML을 보관하고,
+강한 ETag와 If-None-Match(304) 응답을 지원하는 LRU 캐시 기능을 제공
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple
+
+from flask import make_response
+
+
+class UncachedHTML(str):
+    """캐시하지 않을 렌더링 결과 (데이터를 불러오지 못한 안내/오류 페이지 등, 데이터 버전이 그대로여도 다음 요청에서 다시 렌더링)"""
+
+
+class CachedPage(NamedTuple):
+    """캐시된 페이지 (UTF-8 본문과 ETag)"""
+    body: bytes
+    etag: str
+
+
+def directory_signature(*dirs):
+    """
+    폴더들의 파일 이름/크기/수정시각 서명 해시 (메뉴/라우트 변경 감지용)
+
+    Args:
+        *dirs (Path): 확인할 폴더 목록
+
+    Returns:
+        str: 서명 해시 (16자리)
+    """
+    signature = []
+    for directory in dirs:
+        directory = Path(directory)
+        if not directory.exists():
+            continue
+        for file_path in sorted(directory.iterdir()):
+            if file_path.is_file():
+                stat = file_path.stat()
+                signature.append((directory.name, file_path.name, stat.st_size, stat.st_mtime_ns))
+    return hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:16]
+
+
+class PageCache:
+    """바이트 용량 제한이 있는 LRU 페이지 캐시 클래스"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        페이지 캐시 초기화
+
+        Args:
+            max_bytes (int): 캐시할 본문의 최대 총 용량 (bytes)
+        """
+        self.max_bytes = max_bytes
+        self._pages = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.not_modified = 0
+
+    def get(self, key):
+        """
+        캐시된 페이지 조회 (최근 사용으로 갱신)
+
+        Args:
+            key (tuple): 캐시 키
+
+        Returns:
+            CachedPage: 캐시된 페이지 (없으면 None)
+        """
+        with self._lock:
+            page = self._pages.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, key, html):
+        """
+        페이지 저장 (용량 초과 시 오래 사용하지 않은 페이지부터 제거)
+
+        Args:
+            key (tuple): 캐시 키
+            html (str): 렌더링된 HTML
+
+        Returns:
+            CachedPage: 저장된 페이지 (용량보다 크면 저장하지 않고 반환만 함)
+        """
+        body = html.encode('utf-8')
+        page = CachedPage(body=body, etag=hashlib.sha256(body).hexdigest()[:32])
+        if len(body) > self.max_bytes:
+            return page
+
+        with self._lock:
+            old = self._pages.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old.body)
+
+            # 같은 라우트의 이전 버전 페이지는 더 이상 쓰이지 않으므로 제거
+            for stale_key in [k for k in self._pages if k[0] == key[0]]:
+                self.current_bytes -= len(self._pages.pop(stale_key).body)
+
+            while self._pages and self.current_bytes + len(body) > self.max_bytes:
+                _, evicted = self._pages.popitem(last=False)
+                self.current_bytes -= len(evicted.body)
+                self.evictions += 1
+
+            self._pages[key] = page
+            self.current_bytes += len(body)
+        return page
+
+    def respond(self, page, request):
+        """
+        캐시된 페이지로 응답 생성 (If-None-Match가 일치하면 304)
+
+        Args:
+            page (CachedPage): 응답할 페이지
+            request (flask.Request): 현재 요청
+
+        Returns:
+            flask.Response: 200 또는 304 응답
+        """
+        response = make_response(page.body)
+        response.content_type = 'text/html; charset=utf-8'
+        response.set_etag(page.etag)
+        # 브라우저/프록시가 매번 ETag로 재검증하도록 설정
+        response.headers['Cache-Control'] = 'no-cache'
+        response = response.make_conditional(request)
+        if response.status_code == 304:
+            self.not_modified += 1
+        return response
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._pages.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: 적중/미스/제거/304 횟수와 사용 용량
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'not_modified': self.not_modified,
+            'entries': len(self._pages),
+            'current_bytes': self.current_bytes,
+            'max_bytes': self.max_bytes
+        }
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+라우트 모듈 캐시 모듈
+routes 폴더의 파이썬 파일을 프로세스당 한 번만 임포트하고,
+파일이 수정된 경우에만 다시 로드하는 기능을 제공
+"""
+
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+
+
+class RouteModuleCache:
+    """routes/*.py 모듈을 파일 수정시각 기준으로 캐시하는 클래스"""
+
+    def __init__(self):
+        """라우트 모듈 캐시 초기화"""
+        self._modules = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def load(self, routes_dir, filename):
+        """
+        routes 폴더의 모듈 반환 (처음이거나 파일이 변경되었을 때만 임포트)
+
+        Args:
+            routes_dir (Path): routes 폴더 경로
+            filename (str): 모듈 파일명 (확장자 제외)
+
+        Returns:
+            module: 로드된 모듈
+        """
+        file_path = (Path(routes_dir) / f"{filename}.py").resolve()
+        stat = file_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._modules.get(file_path)
+        if cached is not None and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+
+        with self._lock:
+            cached = self._modules.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                self.hits += 1
+                return cached[1]
+
+            # routes 폴더는 한 번만 sys.path에 추가 (모듈 간 임포트 지원)
+            routes_path = str(file_path.parent)
+            if routes_path not in sys.path:
+                sys.path.insert(0, routes_path)
+
+            spec = importlib.util.spec_from_file_location(filename, file_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            if cached is None:
+                self.misses += 1
+            else:
+                self.reloads += 1
+                print(f"라우트 모듈 다시 로드: {file_path.name}")
+
+            self._modules[file_path] = (stamp, module)
+            return module
+
+    def clear(self):
+        """캐시된 모듈 모두 제거"""
+        with self._lock:
+            self._modules.clear()
+
+    def stats(self):
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: 적중/미스/재로드 횟수와 캐시된 모듈 목록
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'reloads': self.reloads,
+            'modules': sorted(path.name for path in self._modules)
+        }
+
+
+# 프로세스 공유 라우트 모듈 캐시
+route_module_cache = RouteModuleCache()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+공유 메모리 패널 저장소 모듈
+로드된 DataFrame을 /dev/shm 아래 NumPy 파일로 게시하고, 각 워커 프로세스가
+메모리 맵(읽기 전용)으로 연결하여 데이터를 복사 없이 공유하는 기능을 제공
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+META_FILE = 'meta.json'
+
+# 게시 파일 형식 버전 (형식이 바뀌면 이전 형식으로 게시된 패널에 연결하지 않음)
+PANEL_FORMAT = 2
+
+
+def default_shared_dir():
+    """
+    공유 메모리 기본 폴더 반환 (GIUP_SHM_DIR 환경변수 > /dev/shm > 임시 폴더)
+
+    Returns:
+        Path: 공유 폴더 경로
+    """
+    env_dir = os.environ.get('GIUP_SHM_DIR')
+    if env_dir:
+        return Path(env_dir)
+    shm = Path('/dev/shm')
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return Path(tempfile.gettempdir())
+
+
+class SharedPanelStore:
+    """DataFrame을 메모리 맵 파일로 게시/연결하는 클래스"""
+
+    def __init__(self, base_dir=None, prefix='flask_dashboard'):
+        """
+        공유 패널 저장소 초기화
+
+        Args:
+            base_dir (Path): 게시할 폴더 (None이면 default_shared_dir())
+            prefix (str): 게시 폴더 이름 접두어
+        """
+        self.base_dir = Path(base_dir) if base_dir else default_shared_dir()
+        self.prefix = prefix
+
+    def panel_dir(self, name, version):
+        """게시된 패널 폴더 경로"""
+        return self.base_dir / f"{self.prefix}-{name}-{version}-f{PANEL_FORMAT}"
+
+    def attach(self, name, version):
+        """
+        게시된 패널에 읽기 전용 메모리 맵으로 연결
+
+        Args:
+            name (str): 패널 이름
+            version (str): 데이터 버전
+
+        Returns:
+            pandas.DataFrame: 메모리 맵 기반 DataFrame (게시되지 않았으면 None)
+        """
+        panel_dir = self.panel_dir(name, version)
+        meta_file = panel_dir / META_FILE
+        if not meta_file.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_file.read_text(encoding='utf-8'))
+            columns = {}
+            for col in meta['columns']:
+                values = np.load(panel_dir / col['file'], mmap_mode='r')
+                if col['kind'] == 'labels':
+                    # 문자열 컬럼: 메모리 맵 코드 배열을 복사하지 않고 감싼 범주형으로 복원 (결측은 코드 -1)
+                    values = pd.Categorical.from_codes(values, categories=col['labels'])
+                columns[col['name']] = values
+            return pd.DataFrame(columns, copy=False)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"공유 패널 연결 실패: {panel_dir.name} ({e})")
+            return None
+
+    def publish(self, name, version, df):
+        """
+        DataFrame을 공유 폴더에 게시 (이미 게시된 버전이면 그대로 둠)
+
+        Args:
+            name (str): 패널 이름
+            version (str): 데이터 버전
+            df (pandas.DataFrame): 게시할 데이터
+
+        Returns:
+            bool: 게시된 패널이 존재하면 True
+        """
+        panel_dir = self.panel_dir(name, version)
+        if (panel_dir / META_FILE).exists():
+            return True
+
+        temp_dir = None
+        try:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            temp_dir = Path(tempfile.mkdtemp(prefix=f".{self.prefix}-{name}-", dir=self.base_dir))
+
+            meta = {'rows': len(df), 'columns': []}
+            for i, col in enumerate(df.columns):
+                file_name = f"col_{i}.npy"
+                series = df[col]
+                if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+                    np.save(temp_dir / file_name, series.to_numpy())
+                    meta['columns'].append({'name': col, 'kind': 'numeric', 'file': file_name})
+                else:
+                    # 라벨은 정렬해 두어 범주 순서가 문자열 정렬 순서와 같게 함 (결측은 코드 -1)
+                    try:
+                        codes, uniques = pd.factorize(series, sort=True)
+                    except TypeError:
+                        codes, uniques = pd.factorize(series)
+                    # 연결할 때 다시 변환하지 않도록 pandas가 라벨 수에 맞춰 고르는 코드 타입으로 저장
+                    codes = pd.Categorical.from_codes(codes, categories=uniques).codes
+                    np.save(temp_dir / file_name, codes)
+                    meta['columns'].append({
+                        'name': col, 'kind': 'labels', 'file': file_name,
+                        'labels': [self._to_native(v) for v in uniques]
+                    })
+
+            (temp_dir / META_FILE).write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+
+            # 폴더 이름 변경으로 원자적 게시 (다른 프로세스가 먼저 게시했으면 버림)
+            try:
+                os.rename(temp_dir, panel_dir)
+                temp_dir = None
+                print(f"공유 패널 게시 완료: {panel_dir}")
+            except OSError:
+                pass
+
+            self._remove_old_versions(name, version)
+            return (panel_dir / META_FILE).exists()
+
+        except OSError as e:
+            print(f"공유 패널 게시 실패: {e}")
+            return False
+        finally:
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _remove_old_versions(self, name, version):
+        """같은 이름의 이전 버전 패널 삭제 (이미 매핑한 프로세스는 계속 사용 가능)"""
+        current = self.panel_dir(name, version)
+        for old_dir in self.base_dir.glob(f"{self.prefix}-{name}-*"):
+            if old_dir != current and old_dir.is_dir():
+                shutil.rmtree(old_dir, ignore_errors=True)
+
+    @staticmethod
+    def _to_native(value):
+        """JSON 저장을 위해 numpy 스칼라를 파이썬 기본형으로 변환"""
+        return value.item() if hasattr(value, 'item') else value
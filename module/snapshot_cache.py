@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+집계표 스냅샷 캐시 모듈
+집계표 Excel 파일을 한 번만 파싱하여 컬럼형 파일(Parquet)로 저장하고 재사용하는 기능을 제공
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+
+# 기본 숫자형 컬럼들 (집계표 구조)
+NUMERIC_COLS = [
+    '기업체수', '임시및일용근로자수', '상용근로자수', '매출액',
+    '근로자수', '총종사자수', '평균종사자수', '등록일자수',
+    '개업일자수', '폐업일자수'
+]
+
+# 폐업구분 컬럼들
+CLOSURE_COLS = ['폐업(1)', '폐업(2)', '폐업(3)', '폐업(4)', '폐업(99)']
+
+# 기업구분 컬럼들
+BUSINESS_COLS = ['기업(1)', '기업(2)', '기업(3)', '기업(4)', '기업(5)']
+
+# 산업구분 컬럼들 (A-S)
+INDUSTRY_COLS = [f'산업({chr(65 + i)})' for i in range(19)]
+
+
+def clean_giup_frame(df):
+    """
+    집계표 숫자형 컬럼 정리 (쉼표 제거, '*' → 1, 결측값 → 0)
+
+    Args:
+        df (pandas.DataFrame): 원본 집계표 데이터프레임
+
+    Returns:
+        pandas.DataFrame: 숫자형 컬럼이 정리된 데이터프레임
+    """
+    for col in NUMERIC_COLS + CLOSURE_COLS + BUSINESS_COLS + INDUSTRY_COLS:
+        if col in df.columns:
+            if df[col].dtype == 'object':
+                # 쉼표, 특수문자 제거하고 숫자로 변환
+                df[col] = pd.to_numeric(
+                    df[col].astype(str).str.replace(',', '').str.replace('*', '1'),
+                    errors='coerce'
+                )
+            df[col] = df[col].fillna(0)  # NaN을 0으로 대체
+    return df
+
+
+class SnapshotCache:
+    """집계표 Excel 파일의 컬럼형 스냅샷을 관리하는 클래스"""
+
+    def __init__(self, cache_dir=None):
+        """
+        스냅샷 캐시 초기화
+
+        Args:
+            cache_dir (Path): 스냅샷 저장 폴더 (None이면 원본 파일 옆의 .snapshots 폴더 사용)
+        """
+        cache_dir = cache_dir or os.environ.get('GIUP_SNAPSHOT_DIR')
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.file_format = self._detect_format()
+
+    def _detect_format(self):
+        """
+        사용 가능한 스냅샷 형식 확인 (pyarrow가 없으면 pickle 사용)
+
+        Returns:
+            str: 'parquet' 또는 'pickle'
+        """
+        try:
+            import pyarrow  # noqa: F401
+            return 'parquet'
+        except ImportError:
+            print("pyarrow를 찾을 수 없어 pickle 스냅샷을 사용합니다.")
+            return 'pickle'
+
+    @staticmethod
+    def source_key(file_path):
+        """
+        원본 파일의 경로, 크기, 수정시각으로 스냅샷 키 생성
+
+        Args:
+            file_path (Path): 원본 Excel 파일 경로
+
+        Returns:
+            str: 16자리 스냅샷 키
+        """
+        stat = file_path.stat()
+        raw = f"{file_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+    def snapshot_path(self, file_path):
+        """
+        원본 파일에 대응하는 스냅샷 파일 경로 반환
+
+        Args:
+            file_path (Path): 원본 Excel 파일 경로
+
+        Returns:
+            Path: 스냅샷 파일 경로
+        """
+        cache_dir = self.cache_dir or file_path.parent / '.snapshots'
+        suffix = 'parquet' if self.file_format == 'parquet' else 'pkl'
+        return cache_dir / f"{file_path.stem}.{self.source_key(file_path)}.{suffix}"
+
+    def load(self, file_path):
+        """
+        스냅샷에서 집계표 로드 (원본이 변경된 경우에만 스냅샷 재생성)
+
+        Args:
+            file_path (Path): 원본 Excel 파일 경로
+
+        Returns:
+            pandas.DataFrame: 정리된 집계표 데이터프레임
+        """
+        file_path = Path(file_path)
+        snapshot_file = self.snapshot_path(file_path)
+
+        if snapshot_file.exists():
+            try:
+                return self._read(snapshot_file)
+            except Exception as e:
+                print(f"스냅샷 읽기 실패, 재생성합니다: {snapshot_file.name} ({e})")
+
+        return self.build(file_path, snapshot_file)
+
+    def build(self, file_path, snapshot_file=None):
+        """
+        원본 Excel 파일을 파싱/정리하여 스냅샷 생성
+
+        Args:
+            file_path (Path): 원본 Excel 파일 경로
+            snapshot_file (Path): 저장할 스냅샷 경로 (None이면 자동 결정)
+
+        Returns:
+            pandas.DataFrame: 정리된 집계표 데이터프레임
+        """
+        file_path = Path(file_path)
+        snapshot_file = snapshot_file or self.snapshot_path(file_path)
+
+        print(f"스냅샷 생성 중: {file_path.name}")
+        df = clean_giup_frame(pd.read_excel(file_path))
+
+        try:
+            snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(df, snapshot_file)
+            self._remove_stale(file_path, snapshot_file)
+        except OSError as e:
+            # 스냅샷 저장에 실패해도 데이터는 그대로 반환
+            print(f"스냅샷 저장 실패: {snapshot_file} ({e})")
+
+        return df
+
+    def _read(self, snapshot_file):
+        """스냅샷 파일 읽기"""
+        if snapshot_file.suffix == '.parquet':
+            return pd.read_parquet(snapshot_file)
+        return pd.read_pickle(snapshot_file)
+
+    def _write_atomic(self, df, snapshot_file):
+        """임시 파일에 쓴 뒤 교체하여 다른 프로세스가 쓰다 만 파일을 읽지 않도록 저장"""
+        fd, temp_name = tempfile.mkstemp(dir=snapshot_file.parent, suffix='.tmp')
+        os.close(fd)
+        try:
+            if snapshot_file.suffix == '.parquet':
+                df.to_parquet(temp_name, index=False)
+            else:
+                df.to_pickle(temp_name)
+            os.replace(temp_name, snapshot_file)
+        except Exception:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+
+    def _remove_stale(self, file_path, current_snapshot):
+        """같은 원본 파일의 이전 버전 스냅샷 삭제"""
+        for old_file in current_snapshot.parent.glob(f"{file_path.stem}.*"):
+            if old_file != current_snapshot and old_file.suffix in ('.parquet', '.pkl'):
+                try:
+                    old_file.unlink()
+                except OSError:
+                    pass